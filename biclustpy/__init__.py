@@ -1,2 +1,8 @@
 from .main import Algorithm
-from .main import compute_bi_clusters, save_bi_clusters_as_xml
+from .cache import Cache
+from .checkpoint import Checkpoint
+from .distributed import Coordinator, run_worker
+from .main import compute_bi_clusters, compute_bi_clusters_batch, score_bi_clusters
+from .main import load_bi_clusters, save_bi_clusters, save_bi_clusters_as_jsonl, save_bi_clusters_as_npz, save_bi_clusters_as_xml, save_bi_clusters_batch_as_jsonl, save_bi_clusters_batch_as_xml
+from .monitor import Monitor, JsonLinesMonitor, MultiMonitor, PrintMonitor, ProgressBarMonitor
+from .session import Session
@@ -0,0 +1,350 @@
+from . import helpers
+from . import main as bp
+from .monitor import Monitor, MultiMonitor, PrintMonitor
+import argparse as ap
+import json
+import numpy as np
+import os
+import scipy.sparse as sp
+import tempfile
+import time
+
+def generate_planted_instance(num_rows, num_cols, num_bi_clusters, noise = 0.1, sparsity = 0.0, default_weight = -0.5, seed = None):
+    """Generates a problem instance with planted bi-clusters.
+    
+    Each row and each column is assigned to one of num_bi_clusters planted bi-clusters
+    uniformly at random. Cells inside a planted bi-cluster have positive weights, cells
+    between different planted bi-clusters have negative weights. The absolute values of
+    the weights are drawn uniformly from [0.5, 1]. Subsequently, the signs of a fraction
+    of the cells are flipped, and a fraction of the negative cells are set to the default weight.
+    
+    Args:
+        num_rows (int): Number of rows.
+        num_cols (int): Number of columns.
+        num_bi_clusters (int): Number of planted bi-clusters.
+        noise (float): Between 0 and 1. Probability that the sign of a cell is flipped.
+        sparsity (float): Between 0 and 1. Probability that a negative cell is set to the default weight.
+        default_weight (float): Weight of the sparse cells. Must be negative.
+        seed (None or int): Seed for random generation.
+    
+    Returns:
+        numpy.array: The weights of the generated instance.
+        list of tuple of list of int: The planted bi-clusters. Empty bi-clusters are omitted.
+    """
+    if default_weight >= 0:
+        raise Exception("Default weight of planted instances must be negative.")
+    rng = np.random.default_rng(seed)
+    
+    # Assign the rows and columns to the planted bi-clusters.
+    row_labels = rng.integers(num_bi_clusters, size=num_rows)
+    col_labels = rng.integers(num_bi_clusters, size=num_cols)
+    is_inside = row_labels[:, None] == col_labels[None, :]
+    
+    # Draw the weights and add noise.
+    weights = np.where(is_inside, 1.0, -1.0) * rng.uniform(0.5, 1.0, size=(num_rows, num_cols))
+    is_flipped = rng.random((num_rows, num_cols)) < noise
+    weights[is_flipped] = -weights[is_flipped]
+    is_sparse = (weights < 0) & (rng.random((num_rows, num_cols)) < sparsity)
+    weights[is_sparse] = default_weight
+    
+    # Collect the planted bi-clusters.
+    planted_bi_clusters = []
+    for label in range(num_bi_clusters):
+        rows = np.flatnonzero(row_labels == label).tolist()
+        cols = np.flatnonzero(col_labels == label).tolist()
+        if len(rows) + len(cols) > 0:
+            planted_bi_clusters.append((rows, cols))
+    return weights, planted_bi_clusters
+
+def to_sparse(weights, default_weight):
+    """Converts a dense instance into a sparse instance that does not store the cells with the default weight.
+    
+    Args:
+        weights (numpy.array): The weights of the instance.
+        default_weight (float): The weight that is not stored explicitly.
+    
+    Returns:
+        scipy.sparse.csr_matrix: The sparse instance.
+    """
+    rows, cols = np.nonzero(weights != default_weight)
+    return sp.csr_matrix((weights[rows, cols], (rows, cols)), shape=weights.shape)
+
+def adjusted_rand_index(labels, other_labels):
+    """Computes the adjusted Rand index of two clusterings.
+    
+    Args:
+        labels (numpy.array): Cluster labels of the first clustering.
+        other_labels (numpy.array): Cluster labels of the second clustering.
+    
+    Returns:
+        float: The adjusted Rand index. Equals 1 if and only if the clusterings are identical.
+    """
+    labels = np.unique(labels, return_inverse=True)[1].ravel()
+    other_labels = np.unique(other_labels, return_inverse=True)[1].ravel()
+    contingency = sp.csr_matrix((np.ones(labels.size), (labels, other_labels))).toarray()
+    def num_pairs(counts):
+        return float((counts * (counts - 1) / 2).sum())
+    index = num_pairs(contingency)
+    row_index = num_pairs(contingency.sum(axis=1))
+    col_index = num_pairs(contingency.sum(axis=0))
+    expected_index = row_index * col_index / max(num_pairs(np.array([labels.size])), 1.0)
+    max_index = (row_index + col_index) / 2
+    if max_index == expected_index:
+        return 1.0
+    return (index - expected_index) / (max_index - expected_index)
+
+class PhaseTimingMonitor(Monitor):
+    
+    """Monitor that collects the run times of the phases of compute_bi_clusters().
+    
+    \"model_build\" and \"solve\" are summed over the subproblems. If the subproblems are solved 
+    in parallel, they are hence CPU times that may exceed the wall-clock time of the solve phase.
+    
+    Attributes:
+        timings (dict): Run times in seconds of the phases \"graph_build\", \"decomposition\", 
+            \"model_build\", \"solve\", and \"reconstruction\". Model building is only reported 
+            by \"ILP\" and is not included in \"solve\". \"reconstruction\" is the wall-clock time 
+            after the solve phase.
+    """
+    
+    def __init__(self):
+        self.timings = {"graph_build": 0.0, "decomposition": 0.0, "model_build": 0.0, "solve": 0.0, "reconstruction": 0.0}
+        self.subproblem_model_build = 0.0
+        self.solve_wall_time = 0.0
+    
+    def event(self, name, **data):
+        if name == "graph_built":
+            self.timings["graph_build"] = data["time"]
+        elif name == "decomposed":
+            self.timings["decomposition"] = data["time"]
+        elif name == "subproblem_started":
+            self.subproblem_model_build = 0.0
+        elif name == "ilp_model_built":
+            self.timings["model_build"] = self.timings["model_build"] + data["time"]
+            self.subproblem_model_build = self.subproblem_model_build + data["time"]
+        elif name == "subproblem_finished":
+            self.timings["solve"] = self.timings["solve"] + max(0.0, data["time"] - self.subproblem_model_build)
+        elif name == "solved":
+            self.solve_wall_time = data["time"]
+        elif name == "finished":
+            self.timings["reconstruction"] = data["time"] - self.timings["graph_build"] - self.timings["decomposition"] - self.solve_wall_time
+    
+def build_algorithm(setting, time_limit = 60):
+    """Builds an algorithm from a setting string.
+    
+    A setting consists of an algorithm name (\"ILP\", \"CH\", \"GRASP\", or \"AUTO\"), optionally followed by
+    \"+lazy\" (lazy constraint generation for ILP), \"+warm\" (warm start of ILP with CH), \"+reduce\" 
+    (data reduction), \"+bound\" (lower bounds), and \"+highs\" (HiGHS instead of Gurobi as backend of ILP), 
+    e.g., \"ILP+lazy+reduce\".
+    
+    Args:
+        setting (string): The setting.
+        time_limit (float): Time limit in seconds of ILP and GRASP and time budget of AUTO.
+    
+    Returns:
+        Algorithm: The algorithm.
+    """
+    name, *options = setting.split("+")
+    algorithm = bp.Algorithm()
+    if name == "ILP":
+        algorithm.use_ilp(time_limit, False, "lazy" in options, "warm" in options)
+    elif name == "CH":
+        algorithm.use_ch()
+    elif name == "GRASP":
+        algorithm.use_grasp(time_limit = time_limit, seed = 0)
+    elif name == "AUTO":
+        algorithm.use_auto(time_budget = time_limit)
+        algorithm.ilp_lazy = "lazy" in options
+        algorithm.ilp_warm_start = "warm" in options
+        algorithm.grasp_seed = 0
+    else:
+        raise Exception("Invalid algorithm name " + name + ". Options: \"ILP\", \"CH\", \"GRASP\", \"AUTO\".")
+    for option in options:
+        if option not in ["lazy", "warm", "reduce", "bound", "highs"]:
+            raise Exception("Invalid option " + option + ". Options: \"lazy\", \"warm\", \"reduce\", \"bound\", \"highs\".")
+    algorithm.reduce = "reduce" in options
+    algorithm.bound = "bound" in options
+    if "highs" in options:
+        algorithm.ilp_backend = "highs"
+    return algorithm
+
+def run_benchmark(settings, sizes, num_bi_clusters = 5, noise = 0.1, sparsity = 0.0, default_weight = -0.5,
+                  use_sparse = False, num_repetitions = 1, seed = 0, time_limit = 60, num_workers = 1, verbose = False):
+    """Runs compute_bi_clusters with several settings on planted instances of several sizes.
+    
+    Args:
+        settings (list of string): Settings of the algorithms, see build_algorithm().
+        sizes (list of tuple of int): Numbers of rows and columns of the instances.
+        num_bi_clusters (int): Number of planted bi-clusters.
+        noise (float): Probability that the sign of a cell is flipped.
+        sparsity (float): Probability that a negative cell is set to the default weight.
+        default_weight (float): Weight of the sparse cells.
+        use_sparse (bool): If True, the instances are passed as scipy.sparse matrices that do not store the sparse cells.
+        num_repetitions (int): Number of instances per size. Repetition r uses the seed seed + r.
+        seed (int): Seed of the first repetition.
+        time_limit (float): Time limit in seconds of ILP and GRASP and time budget of AUTO.
+        num_workers (int): Number of worker processes used to solve the subproblems.
+        verbose (bool): If True, the events of compute_bi_clusters are printed.
+    
+    Returns:
+        list of dict: One record per setting, size, and repetition. Contains the run times
+            in seconds of the phases, the objective value, the objective value of the planted
+            bi-clusters, and the adjusted Rand index w.r.t. the planted bi-clusters.
+    """
+    records = []
+    for num_rows, num_cols in sizes:
+        for repetition in range(num_repetitions):
+            weights, planted_bi_clusters = generate_planted_instance(num_rows, num_cols, num_bi_clusters, noise, sparsity, default_weight, seed + repetition)
+            planted_obj_val = bp.score_bi_clusters(weights, planted_bi_clusters)[0]
+            planted_labels = np.concatenate(helpers.bi_clusters_to_labels(planted_bi_clusters, num_rows, num_cols)[:2])
+            instance = weights
+            instance_default_weight = 0.0
+            if use_sparse:
+                instance = to_sparse(weights, default_weight)
+                instance_default_weight = default_weight
+            for setting in settings:
+                algorithm = build_algorithm(setting, time_limit)
+                timing_monitor = PhaseTimingMonitor()
+                monitor = timing_monitor
+                if verbose:
+                    monitor = MultiMonitor([timing_monitor, PrintMonitor()])
+    
+                # Compute the bi-clusters.
+                start = time.perf_counter()
+                bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(instance, algorithm, num_workers, instance_default_weight, monitor)
+                timings = timing_monitor.timings
+    
+                # Save the bi-clusters.
+                output_start = time.perf_counter()
+                with tempfile.TemporaryDirectory() as directory:
+                    bp.save_bi_clusters_as_xml(os.path.join(directory, "bi_clusters.xml"), bi_clusters, obj_val, is_optimal)
+                timings["output"] = time.perf_counter() - output_start
+                total_time = time.perf_counter() - start
+    
+                # Compare the bi-clusters with the planted bi-clusters.
+                labels = np.concatenate(helpers.bi_clusters_to_labels(bi_clusters, num_rows, num_cols)[:2])
+                records.append({
+                    "setting": setting,
+                    "num_rows": num_rows,
+                    "num_cols": num_cols,
+                    "repetition": repetition,
+                    "seed": seed + repetition,
+                    "timings": timings,
+                    "total_time": total_time,
+                    "obj_val": float(obj_val),
+                    "is_optimal": bool(is_optimal),
+                    "num_bi_clusters": len(bi_clusters),
+                    "planted_obj_val": float(planted_obj_val),
+                    "relative_gap": float((obj_val - planted_obj_val) / max(abs(planted_obj_val), 1e-9)),
+                    "adjusted_rand_index": adjusted_rand_index(labels, planted_labels)
+                })
+    return records
+
+def save_results(filename, records, parameters = None):
+    """Saves benchmark results as JSON file.
+    
+    Args:
+        filename (string): Name of JSON file.
+        records (list of dict): The records returned by run_benchmark().
+        parameters (None or dict): The parameters of the benchmark.
+    """
+    with open(filename, "w") as json_file:
+        json.dump({"parameters": parameters or {}, "records": records}, json_file, indent=2)
+
+def load_results(filename):
+    """Loads benchmark results from JSON file.
+    
+    Args:
+        filename (string): Name of JSON file.
+    
+    Returns:
+        list of dict: The records.
+    """
+    with open(filename) as json_file:
+        return json.load(json_file)["records"]
+
+def compare_results(baseline_records, records, tolerance = 0.2, min_time = 0.01):
+    """Compares benchmark results with baseline results and flags regressions.
+    
+    Records are matched by setting, size, and repetition. A phase is flagged if its run time
+    exceeds the baseline run time by more than the relative tolerance and by more than
+    min_time seconds. The objective value is flagged if it is worse than the baseline objective value.
+    
+    Args:
+        baseline_records (list of dict): The baseline records.
+        records (list of dict): The records that should be compared with the baseline.
+        tolerance (float): Relative tolerance of the run times.
+        min_time (float): Run time differences in seconds that are always tolerated.
+    
+    Returns:
+        list of string: Descriptions of the regressions.
+    """
+    def key(record):
+        return (record["setting"], record["num_rows"], record["num_cols"], record["repetition"])
+    baseline = {key(record): record for record in baseline_records}
+    regressions = []
+    for record in records:
+        if key(record) not in baseline:
+            continue
+        baseline_record = baseline[key(record)]
+        name = record["setting"] + " on " + str(record["num_rows"]) + " x " + str(record["num_cols"]) + " (repetition " + str(record["repetition"] + 1) + ")"
+        times = dict(record["timings"], total=record["total_time"])
+        baseline_times = dict(baseline_record["timings"], total=baseline_record["total_time"])
+        for phase in times:
+            if phase not in baseline_times:
+                continue
+            if times[phase] > (1 + tolerance) * baseline_times[phase] and times[phase] - baseline_times[phase] > min_time:
+                regressions.append(name + ": phase " + phase + " took " + "{:.3f}".format(times[phase]) +
+                                   " instead of " + "{:.3f}".format(baseline_times[phase]) + " seconds.")
+        if record["obj_val"] > baseline_record["obj_val"] + 1e-6 * max(1.0, abs(baseline_record["obj_val"])):
+            regressions.append(name + ": objective value " + str(record["obj_val"]) + " instead of " + str(baseline_record["obj_val"]) + ".")
+    return regressions
+
+def main():
+    """Provides command line interface of the benchmark suite.
+    """
+    
+    parser = ap.ArgumentParser(description="Benchmark biclustpy on instances with planted bi-clusters.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run the benchmark and save the results as JSON file.")
+    run_parser.add_argument("--output", required=True, help="Save results as JSON file.", metavar="output-file")
+    run_parser.add_argument("--settings", nargs="+", default=["CH", "GRASP"], help="Algorithm settings of the form name[+lazy][+warm][+reduce][+bound][+highs] with name in ILP, CH, GRASP, AUTO. Default = CH GRASP.", metavar="setting")
+    run_parser.add_argument("--sizes", nargs="+", default=["50x50", "100x100", "200x200"], help="Sizes of the instances. Default = 50x50 100x100 200x200.", metavar="num-rowsxnum-cols")
+    run_parser.add_argument("--num_bi_clusters", type=int, default=5, help="Number of planted bi-clusters. Default = 5.", metavar="num-bi-clusters")
+    run_parser.add_argument("--noise", type=float, default=0.1, help="Probability that the sign of a cell is flipped. Default = 0.1.")
+    run_parser.add_argument("--sparsity", type=float, default=0.0, help="Probability that a negative cell is set to the default weight. Default = 0.")
+    run_parser.add_argument("--default_weight", type=float, default=-0.5, help="Weight of the sparse cells. Default = -0.5.", metavar="default-weight")
+    run_parser.add_argument("--sparse", action="store_true", help="Pass the instances as sparse matrices that do not store the sparse cells.")
+    run_parser.add_argument("--repetitions", type=int, default=1, help="Number of instances per size. Default = 1.")
+    run_parser.add_argument("--seed", type=int, default=0, help="Seed of the first instance. Default = 0.")
+    run_parser.add_argument("--time_limit", type=float, default=60, help="Time limit in seconds of ILP and GRASP and time budget of AUTO. Default = 60.", metavar="time-limit")
+    run_parser.add_argument("--num_workers", type=int, default=1, help="Number of worker processes used to solve the subproblems. Default = 1.", metavar="num-workers")
+    run_parser.add_argument("--verbose", action="store_true", help="Print the events of compute_bi_clusters.")
+    compare_parser = subparsers.add_parser("compare", help="Compare results with baseline results and flag regressions.")
+    compare_parser.add_argument("baseline", help="JSON file with baseline results.", metavar="baseline-file")
+    compare_parser.add_argument("results", help="JSON file with results.", metavar="results-file")
+    compare_parser.add_argument("--tolerance", type=float, default=0.2, help="Relative tolerance of the run times. Default = 0.2.")
+    compare_parser.add_argument("--min_time", type=float, default=0.01, help="Run time differences in seconds that are always tolerated. Default = 0.01.", metavar="min-time")
+    args = parser.parse_args()
+    
+    if args.command == "run":
+        sizes = [tuple(int(dim) for dim in size.split("x")) for size in args.sizes]
+        records = run_benchmark(args.settings, sizes, args.num_bi_clusters, args.noise, args.sparsity, args.default_weight,
+                                args.sparse, args.repetitions, args.seed, args.time_limit, args.num_workers, args.verbose)
+        parameters = dict(vars(args))
+        del parameters["command"]
+        save_results(args.output, records, parameters)
+        for record in records:
+            print(record["setting"] + " on " + str(record["num_rows"]) + " x " + str(record["num_cols"]) + " (repetition " + str(record["repetition"] + 1) + 
+                  "): objective value " + str(record["obj_val"]) + " (planted " + str(record["planted_obj_val"]) + ") in " + "{:.3f}".format(record["total_time"]) + " seconds.")
+    
+    if args.command == "compare":
+        regressions = compare_results(load_results(args.baseline), load_results(args.results), args.tolerance, args.min_time)
+        for regression in regressions:
+            print("Regression: " + regression)
+        print("Found " + str(len(regressions)) + " regressions.")
+        if len(regressions) > 0:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
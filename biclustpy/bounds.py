@@ -0,0 +1,73 @@
+import numpy as np
+
+def round_robin(num_nodes, round_id):
+    """Returns the pairs of one round of a round-robin schedule.
+    
+    Over the rounds 0, 1, ..., num_nodes - 2 (num_nodes - 1 if num_nodes is odd), every pair of
+    nodes occurs exactly once, and the pairs of each round are disjoint.
+    
+    Args:
+        num_nodes (int): The number of nodes.
+        round_id (int): The round.
+    
+    Returns:
+        numpy.array: The first nodes of the pairs.
+        numpy.array: The second nodes of the pairs.
+    """
+    num_slots = num_nodes + num_nodes % 2
+    slots = np.concatenate([[0], np.roll(np.arange(1, num_slots), round_id)])
+    first = slots[:num_slots // 2]
+    second = slots[num_slots // 2:][::-1]
+    is_real = (first < num_nodes) & (second < num_nodes)
+    return first[is_real], second[is_real]
+
+def compute_lower_bound(weights, max_work = 10 ** 7):
+    """Computes a lower bound on the objective value of a subproblem by packing conflicts.
+    
+    Two rows i, j and two columns k, l form a conflict if three of the pairs (i,k), (i,l), (j,k),
+    and (j,l) are edges and the fourth is not. Every solution edits at least one pair of each
+    conflict. Each conflict receives a share of the editing costs of its pairs such that the
+    shares of each pair do not exceed its cost, and the sum of the shares is a lower bound.
+    
+    For a fixed pair of rows, the conflicts form a complete bipartite graph between the columns
+    adjacent to both rows and the columns adjacent to exactly one of them, so the maximal total
+    share of the pair of rows is the minimum of the remaining costs on both sides and can be
+    computed without enumerating the conflicts. The pairs of rows are processed in the rounds
+    of a round-robin schedule, and all disjoint pairs of a round are processed at once.
+    If there are more rows than columns, the roles of rows and columns are swapped.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+        max_work (int): Maximal number of cells processed over all rounds. At least one round is processed.
+            If fewer rounds than needed to process all pairs are processed, the bound is weaker but still valid.
+    
+    Returns:
+        float: The lower bound.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape[0] > weights.shape[1]:
+        weights = weights.T
+    num_rows, num_cols = weights.shape
+    if num_rows < 2 or num_cols < 2:
+        return 0.0
+    is_edge = weights > 0
+    residual_costs = np.abs(weights)
+    num_rounds = num_rows - 1 + num_rows % 2
+    num_rounds = min(num_rounds, max(1, max_work // weights.size))
+    lower_bound = 0.0
+    for round_id in range(num_rounds):
+        first, second = round_robin(num_rows, round_id)
+        costs = np.maximum(np.minimum(residual_costs[first], residual_costs[second]), 0.0)
+    
+        # Get the remaining costs of the columns adjacent to both rows and to exactly one row.
+        common_costs = np.where(is_edge[first] & is_edge[second], costs, 0.0)
+        exclusive_costs = np.where(is_edge[first] != is_edge[second], costs, 0.0)
+        shares = np.minimum(common_costs.sum(axis=1), exclusive_costs.sum(axis=1))
+    
+        # Charge the shares to the columns in order, exhausting the remaining cost of each column before moving on.
+        charges = np.clip(shares[:, None] - (np.cumsum(common_costs, axis=1) - common_costs), 0.0, common_costs)
+        charges = charges + np.clip(shares[:, None] - (np.cumsum(exclusive_costs, axis=1) - exclusive_costs), 0.0, exclusive_costs)
+        residual_costs[first] = residual_costs[first] - charges
+        residual_costs[second] = residual_costs[second] - charges
+        lower_bound = lower_bound + shares.sum()
+    return lower_bound
@@ -0,0 +1,181 @@
+import collections
+import hashlib
+import numpy as np
+import os
+import tempfile
+
+class Cache:
+
+    """Persistent content-addressed cache of solved subproblems.
+    
+    Each entry is stored as an .npz file in the cache directory whose name is the SHA-256
+    hash of the weights of the subproblem and of the settings of the algorithm. An entry
+    contains the bi-clusters, the objective value, the optimality flag, and the lower bound of the subproblem.
+    The modification time of an entry is updated whenever it is read. If the total size of
+    the entries exceeds the maximal size, the least recently used entries are evicted.
+    
+    Attributes:
+        directory (string): The cache directory. Created if it does not exist.
+        max_size (int): Maximal total size of the entries in bytes. If <= 0, no entries are evicted.
+        num_hits (int): Number of lookups that found an entry.
+        num_misses (int): Number of lookups that did not find an entry.
+        size (int): Total size of the entries in bytes. Tracked incrementally and only 
+            recomputed from the cache directory upon construction and by clear().
+    """
+    
+    def __init__(self, directory, max_size = 2**30):
+        self.directory = directory
+        self.max_size = max_size
+        self.num_hits = 0
+        self.num_misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+    
+    def _scan(self):
+        # Sizes of the entries by key, least recently used first.
+        self._sizes = collections.OrderedDict((entry.name[:-4], entry.stat().st_size) for entry in self.entries())
+        self.size = sum(self._sizes.values())
+    
+    def key(self, weights, algorithm):
+        """Computes the key of a subproblem.
+    
+        The key depends on the shape, the data type, and the bytes of the weights and on the 
+        settings of the algorithm that affect the solution, see Algorithm.settings(). If the algorithm 
+        is \"AUTO\", the key hence does not depend on the share of the time budget that is assigned 
+        to the subproblem.
+    
+        Args:
+            weights (numpy.array): The weights of the subproblem.
+            algorithm (None or Algorithm): The algorithm used to solve the subproblem. If None, 
+                the key only depends on the weights.
+    
+        Returns:
+            string: The key.
+        """
+        weights = np.ascontiguousarray(weights, dtype=np.asarray(weights).dtype.newbyteorder("<"))
+        settings = []
+        if algorithm is not None:
+            settings = algorithm.settings()
+        digest = hashlib.sha256()
+        digest.update(repr((weights.shape, weights.dtype.str, settings)).encode())
+        digest.update(weights.data)
+        return digest.hexdigest()
+    
+    def path(self, key):
+        """Returns the path of an entry.
+    
+        Args:
+            key (string): The key of the entry.
+    
+        Returns:
+            string: The path.
+        """
+        return os.path.join(self.directory, key + ".npz")
+    
+    def get(self, key):
+        """Looks up an entry.
+    
+        Args:
+            key (string): The key of the entry.
+    
+        Returns:
+            None or tuple: None if there is no entry with the given key. Otherwise, the list of
+                bi-clusters of the subproblem, the objective value, the optimality flag, and the lower bound. 
+                For entries without lower bound, the lower bound is the objective value if the 
+                solution is optimal and 0 otherwise.
+        """
+        path = self.path(key)
+        try:
+            with np.load(path) as entry:
+                rows = np.split(entry["rows"], np.cumsum(entry["num_rows"])[:-1])
+                cols = np.split(entry["cols"], np.cumsum(entry["num_cols"])[:-1])
+                obj_val = float(entry["obj_val"])
+                is_optimal = bool(entry["is_optimal"])
+                lower_bound = obj_val if is_optimal else 0.0
+                if "lower_bound" in entry.files:
+                    lower_bound = float(entry["lower_bound"])
+            os.utime(path)
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+        except (OSError, KeyError, ValueError):
+            self.num_misses = self.num_misses + 1
+            return None
+        self.num_hits = self.num_hits + 1
+        bi_clusters = [(bi_cluster_rows.tolist(), bi_cluster_cols.tolist()) for bi_cluster_rows, bi_cluster_cols in zip(rows, cols)]
+        return bi_clusters, obj_val, is_optimal, lower_bound
+    
+    def put(self, key, result):
+        """Stores an entry and evicts the least recently used entries if the cache is too large.
+    
+        The entry is first written to a temporary file, which is then atomically renamed.
+    
+        Args:
+            key (string): The key of the entry.
+            result (tuple): The list of bi-clusters of the subproblem, the objective value, the optimality flag, and the lower bound.
+        """
+        bi_clusters, obj_val, is_optimal, lower_bound = result
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            np.savez_compressed(temp_file,
+                                rows=np.array([row for rows, cols in bi_clusters for row in rows], dtype=np.int64),
+                                cols=np.array([col for rows, cols in bi_clusters for col in cols], dtype=np.int64),
+                                num_rows=np.array([len(rows) for rows, cols in bi_clusters], dtype=np.int64),
+                                num_cols=np.array([len(cols) for rows, cols in bi_clusters], dtype=np.int64),
+                                obj_val=obj_val,
+                                is_optimal=is_optimal,
+                                lower_bound=lower_bound)
+        os.replace(temp_path, self.path(key))
+        self.size = self.size - self._sizes.pop(key, 0)
+        self._sizes[key] = os.path.getsize(self.path(key))
+        self.size = self.size + self._sizes[key]
+        self.evict()
+    
+    def entries(self):
+        """Lists the entries of the cache.
+    
+        Returns:
+            list of os.DirEntry: The entries, least recently used first.
+        """
+        entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".npz")]
+        return sorted(entries, key = lambda entry: entry.stat().st_mtime)
+    
+    def evict(self):
+        """Evicts the least recently used entries until the total size does not exceed the maximal size.
+    
+        The entries are evicted in the order of the last accesses by this object, so that the cache 
+        directory is not scanned. Entries that have been written by other processes are only taken 
+        into account after the next scan.
+        """
+        if self.max_size <= 0:
+            return
+        while self.size > self.max_size and len(self._sizes) > 0:
+            key, size = self._sizes.popitem(last=False)
+            self.size = self.size - size
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+    
+    def clear(self):
+        """Removes all entries and resets the statistics.
+        """
+        for entry in self.entries():
+            os.remove(entry.path)
+        self.num_hits = 0
+        self.num_misses = 0
+        self._scan()
+    
+    def statistics(self):
+        """Returns statistics about the cache.
+    
+        Returns:
+            dict: The number of hits \"num_hits\", the number of misses \"num_misses\", the hit rate
+                \"hit_rate\", the number of entries \"num_entries\", and their total size in bytes \"size\".
+        """
+        entries = self.entries()
+        num_lookups = self.num_hits + self.num_misses
+        return {"num_hits": self.num_hits,
+                "num_misses": self.num_misses,
+                "hit_rate": self.num_hits / num_lookups if num_lookups > 0 else 0.0,
+                "num_entries": len(entries),
+                "size": sum(entry.stat().st_size for entry in entries)}
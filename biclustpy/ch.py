@@ -1,36 +1,163 @@
-import networkx as nx
-from progress.bar import Bar
 from . import helpers
+from .monitor import Monitor
 import numpy as np
-import random
+import time
 
-def get_next_pair(queue, is_deleted, alpha, seed):
-    # If alpha = 1, the pair (i,k) is determined deterministically.
-    if (alpha == 1):
-        for ((i,k), g) in queue:
-            if not (is_deleted[i] or is_deleted[k]):
-                return (i, k)
-    # Otherwise, (i,k) is selected randomly.
-    g_max = -np.infty
-    g_min = np.infty
-    for ((i,k), g) in queue:
-        if is_deleted[i] or is_deleted[k]:
-            continue
-        g_max = max(g_max, g)
-        g_min = min(g_min, g)
-    threshold = g_min + alpha * (g_max - g_min)
-    candidates = []
-    for ((i,k), g) in queue:
-        if is_deleted[i] or is_deleted[k]:
-            continue
-        if g >= threshold:
-            candidates.append((i,k))
-    random.seed(seed)
-    return random.choice(candidates)
-            
+class PairQueue:
+    
+    """Selection structure for the pairs of rows and columns picked by the construction phase of CH.
+    
+    The pairs are sorted once in decreasing order w.r.t. their g-values. Two cursors 
+    point to the first and the last pair whose row and column are not yet deleted.
+    Pairs that contain deleted rows or columns are skipped lazily when a cursor reaches them.
+    
+    Attributes:
+        pair_rows (numpy.array): Rows of the sorted pairs.
+        pair_cols (numpy.array): Columns of the sorted pairs.
+        g_values (numpy.array): G-values of the sorted pairs.
+        negative_g_values (numpy.array): Negated g-values of the sorted pairs, i.e., sorted in increasing order.
+        is_deleted_row (numpy.array): Deletion flags of the rows.
+        is_deleted_col (numpy.array): Deletion flags of the columns.
+        alpha (float): Between 0 and 1. If smaller than 1, pairs are drawn randomly 
+            from the restricted candidate list.
+        rng (numpy.random.Generator): Random number generator used to draw pairs.
+    """
+    
+    def __init__(self, g_values, alpha, rng):
+        num_rows, num_cols = g_values.shape
+        order = np.argsort(-g_values, axis=None, kind="stable")
+        self.pair_rows = order // num_cols
+        self.pair_cols = order % num_cols
+        self.g_values = g_values.ravel()[order]
+        self.negative_g_values = -self.g_values
+        self.is_deleted_row = np.zeros(num_rows, dtype=bool)
+        self.is_deleted_col = np.zeros(num_cols, dtype=bool)
+        self.alpha = alpha
+        self.rng = rng
+        self._front = 0
+        self._back = order.size - 1
+    
+    def _is_deleted(self, pos):
+        return self.is_deleted_row[self.pair_rows[pos]] or self.is_deleted_col[self.pair_cols[pos]]
+    
+    def delete(self, rows, cols):
+        """Marks rows and columns as deleted.
+        
+        Args:
+            rows (numpy.array): The rows that should be deleted.
+            cols (numpy.array): The columns that should be deleted.
+        """
+        self.is_deleted_row[rows] = True
+        self.is_deleted_col[cols] = True
+    
+    def next_pair(self):
+        """Returns the next pair of undeleted rows and columns.
+        
+        If alpha = 1, the pair with maximal g-value is returned. Otherwise, the pair 
+        is drawn uniformly at random from all pairs whose g-value is at least 
+        g_min + alpha * (g_max - g_min), where g_min and g_max are the minimal and 
+        maximal g-values of the undeleted pairs.
+        
+        Returns:
+            tuple of int: The selected pair (i,k) or None if all pairs are deleted.
+        """
+        while self._front <= self._back and self._is_deleted(self._front):
+            self._front = self._front + 1
+        if self._front > self._back:
+            return None
+        if self.alpha == 1:
+            return self.pair_rows[self._front], self.pair_cols[self._front]
+        while self._is_deleted(self._back):
+            self._back = self._back - 1
+        
+        # The restricted candidate list is the prefix of the undeleted pairs whose g-values exceed the threshold.
+        g_max = self.g_values[self._front]
+        g_min = self.g_values[self._back]
+        threshold = g_min + self.alpha * (g_max - g_min)
+        end = self._front + np.searchsorted(self.negative_g_values[self._front:self._back + 1], -threshold, side="right")
+        end = max(end, self._front + 1)
         
+        # Draw uniformly from the undeleted candidates. Deleted candidates are rejected, and 
+        # the candidates are only filtered explicitly if too many draws are rejected.
+        for trial in range(16):
+            pos = self.rng.integers(self._front, end)
+            if not self._is_deleted(pos):
+                return self.pair_rows[pos], self.pair_cols[pos]
+        rows = self.pair_rows[self._front:end]
+        cols = self.pair_cols[self._front:end]
+        candidates = self._front + np.flatnonzero(~(self.is_deleted_row[rows] | self.is_deleted_col[cols]))
+        pos = self.rng.choice(candidates)
+        return self.pair_rows[pos], self.pair_cols[pos]
 
-def run(weights, subgraph, alpha, seed):
+def compute_g_values(weights, adjacency):
+    """Computes the g-values of all pairs of rows and columns of a subproblem.
+    
+    The g-value of a pair (i,k) measures how much the objective benefits from 
+    putting the neighborhoods of i and k into a common bi-cluster. All g-values are
+    computed at once from the two-hop neighbor counts A * A^T and A^T * A.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+        adjacency (numpy.array): The bi-adjacency matrix of the subproblem, i.e., weights > 0.
+    
+    Returns:
+        numpy.array: Matrix of the same shape as weights that contains the g-values.
+    """
+    adjacency = adjacency.astype(weights.dtype)
+    positive_weights = weights * adjacency
+    two_hop_rows = adjacency @ adjacency.T
+    two_hop_cols = adjacency.T @ adjacency
+    row_degrees = np.diag(two_hop_rows)
+    col_degrees = np.diag(two_hop_cols)
+    g = weights + positive_weights
+    g = g @ two_hop_cols + two_hop_rows @ g
+    g = g + weights * (1 - row_degrees[:, None] - col_degrees[None, :])
+    g = g - positive_weights.sum(axis=1)[:, None] - positive_weights.sum(axis=0)[None, :]
+    return g
+
+def construct(weights, alpha, rng):
+    """Runs the construction phase of CH on a subproblem.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+        alpha (float): Between 0 and 1. If smaller than 1, the algorithm behaves non-deterministically.
+        rng (numpy.random.Generator): Random number generator used if alpha is smaller than 1.
+    
+    Returns:
+        numpy.array: Bi-cluster labels of the rows of the subproblem.
+        numpy.array: Bi-cluster labels of the columns of the subproblem.
+    """
+    adjacency = weights > 0
+    queue = PairQueue(compute_g_values(weights, adjacency), alpha, rng)
+    row_labels = np.full(weights.shape[0], -1)
+    col_labels = np.full(weights.shape[1], -1)
+    num_bi_clusters = 0
+    num_remaining_edges = np.count_nonzero(adjacency)
+    while num_remaining_edges > 0:
+        # Find the pair (i,k) of undeleted nodes that maximizes the g-value.
+        i, k = queue.next_pair()
+        # Set the bi-cluster to the union of neighborhoods of i and k.
+        bi_cluster_left = np.flatnonzero(adjacency[:, k] & ~queue.is_deleted_row)
+        bi_cluster_left = np.union1d(bi_cluster_left, [i])
+        bi_cluster_right = np.flatnonzero(adjacency[i, :] & ~queue.is_deleted_col)
+        bi_cluster_right = np.union1d(bi_cluster_right, [k])
+        row_labels[bi_cluster_left] = num_bi_clusters
+        col_labels[bi_cluster_right] = num_bi_clusters
+        num_bi_clusters = num_bi_clusters + 1
+        # Update the number of remaining edges and the deletion flags.
+        num_remaining_edges = num_remaining_edges - np.count_nonzero(adjacency[np.ix_(bi_cluster_left, ~queue.is_deleted_col)])
+        queue.delete(bi_cluster_left, [])
+        num_remaining_edges = num_remaining_edges - np.count_nonzero(adjacency[np.ix_(~queue.is_deleted_row, bi_cluster_right)])
+        queue.delete([], bi_cluster_right)
+    # Put isolated nodes into singleton bi-clusters.
+    isolated_rows = row_labels == -1
+    row_labels[isolated_rows] = num_bi_clusters + np.arange(np.count_nonzero(isolated_rows))
+    num_bi_clusters = num_bi_clusters + np.count_nonzero(isolated_rows)
+    isolated_cols = col_labels == -1
+    col_labels[isolated_cols] = num_bi_clusters + np.arange(np.count_nonzero(isolated_cols))
+    return row_labels, col_labels
+
+def run(weights, rows, cols, alpha, seed, monitor = None, default_weight = 0.0):
     """Suboptimally solves the bi-cluster editing problem via a constructive heuristic.
     
     Implements the heuristic CH suggested in: 
@@ -39,78 +166,33 @@ def run(weights, subgraph, alpha, seed):
     https://doi.org/10.1007/s10479-016-2261-x.
     
     Args:
-        weights (numpy.array): The overall problem instance.
-        subgraph (networkx.Graph): The subgraph that should be rendered bi-transitive.
+        weights (numpy.array or scipy.sparse matrix): The overall problem instance. 
+            If sparse, cells that are not stored explicitly have the default weight.
+        rows (numpy.array): The rows of the subproblem that should be rendered bi-transitive.
+        cols (numpy.array): The columns of the subproblem that should be rendered bi-transitive.
         alpha (float): Between 0 and 1. If smaller than 1, the algorithm behaves non-deterministically.
         seed (None or int): Seed for random generation.
+        monitor (None or Monitor): Receives the event \"ch_constructed\".
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
     
     Returns:
-        networkx.Graph: The obtained bi-transitive graph.
+        numpy.array: Bi-cluster labels of the rows of the subproblem.
+        numpy.array: Bi-cluster labels of the columns of the subproblem.
         float: Objective value of obtained solution.
         bool: True if and only if obtained solution is guaranteed to be optimal.
     """
     
-    print("Subproblem is solved with CH.")
-    
-    # Get rows and columns of the sub-problem.
-    num_rows = weights.shape[0]
-    rows = [node for node in subgraph.nodes if helpers.is_row(node, num_rows)]
-    cols = [node for node in subgraph.nodes if helpers.is_col(node, num_rows)]
-    
-    # Compute g-values for greedily picking pairs of nodes.
-    bar = Bar("Computing g-values.", max = len(rows) * len(cols))
-    queue = []
-    for i in rows:
-        n2i = [j for l in subgraph.adj[i] for j in subgraph.adj[l]]
-        for k in cols:
-            n2k = [l for j in subgraph.adj[k] for l in subgraph.adj[j]]
-            g = weights[i, helpers.node_to_col(k, num_rows)]
-            g = g + sum([weights[i, helpers.node_to_col(l, num_rows)] for l in n2k if l != k])
-            g = g + sum([weights[j, helpers.node_to_col(k, num_rows)] for j in n2i if j != i])
-            g = g - sum([weights[i, helpers.node_to_col(l, num_rows)] for l in cols if weights[i, helpers.node_to_col(l, num_rows)] > 0])
-            g = g + sum([weights[i, helpers.node_to_col(l, num_rows)] for l in n2k if weights[i, helpers.node_to_col(l, num_rows)] > 0])
-            g = g - sum([weights[j, helpers.node_to_col(k, num_rows)] for j in rows if weights[j, helpers.node_to_col(k, num_rows)] > 0])
-            g = g + sum([weights[j, helpers.node_to_col(k, num_rows)] for j in n2i if weights[j, helpers.node_to_col(k, num_rows)] > 0])
-            queue.append(((i,k),g))
-            bar.next()
-    bar.finish()
-          
-    # Sort the queue of all pairs of nodes in decrasing order w.r.t. their g-values.
-    if alpha == 1:
-        queue.sort(key = lambda t: t[1], reverse = True)
-    
-    # Construct the bi-transitive subgraph.
-    print("Constructing the bi-transitive subgraph ...")  
-    bi_transitive_subgraph = nx.Graph()
-    shrinking_subgraph = nx.Graph(subgraph)
-    is_deleted = {node : False for node in shrinking_subgraph.nodes}
-    while len(shrinking_subgraph.edges) > 0:
-        # Find the pair (i,k) of undeleted nodes that maximizes the g-value.
-        (i, k) = get_next_pair(queue, is_deleted, alpha, seed)
-        # Set the bi-cluster to the union of neighborhoods of i and k.
-        bi_cluster_left = set(shrinking_subgraph.adj[k])
-        bi_cluster_left.add(i)
-        bi_cluster_right = set(shrinking_subgraph.adj[i])
-        bi_cluster_right.add(k)
-        # Update teh bi-transitive subgraph, the shrinking subgraph, and the deletion flags.
-        bi_transitive_subgraph.add_nodes_from(bi_cluster_left)
-        bi_transitive_subgraph.add_nodes_from(bi_cluster_right)
-        bi_transitive_subgraph.add_edges_from([(j, l) for j in bi_cluster_right for l in bi_cluster_left])
-        shrinking_subgraph.remove_nodes_from(bi_cluster_left)
-        shrinking_subgraph.remove_nodes_from(bi_cluster_right)
-        for node in bi_cluster_left:
-            is_deleted[node] = True
-        for node in bi_cluster_right:
-            is_deleted[node] = True
-    # Add isolated nodes to the bi-transitive subgraph.
-    bi_transitive_subgraph.add_nodes_from(shrinking_subgraph.nodes)
+    if monitor is None:
+        monitor = Monitor()
+    start = time.perf_counter()
+    
+    # Construct the bi-clusters.
+    sub_weights = helpers.get_submatrix(weights, rows, cols, default_weight)
+    row_labels, col_labels = construct(sub_weights, alpha, np.random.default_rng(seed))
     
     # Compute the objective value of the constructed solution.
-    obj_val = 0
-    for i in rows:
-        for k in cols:
-            if subgraph.has_edge(i,k) != bi_transitive_subgraph.has_edge(i,k):
-                obj_val = obj_val + abs(weights[i, helpers.node_to_col(k, num_rows)])
+    obj_val = helpers.compute_obj_val(sub_weights, row_labels, col_labels)
+    monitor.event("ch_constructed", obj_val = obj_val, time = time.perf_counter() - start)
                 
-    # Return the obtained bi-transitive subgraph and the objective value.
-    return bi_transitive_subgraph, obj_val, False
\ No newline at end of file
+    # Return the obtained bi-cluster labels and the objective value.
+    return row_labels, col_labels, obj_val, False
\ No newline at end of file
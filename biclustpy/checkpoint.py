@@ -0,0 +1,82 @@
+from .cache import Cache
+import numpy as np
+import os
+import tempfile
+
+class Checkpoint(Cache):
+
+    """Checkpoint directory that allows to resume interrupted runs.
+    
+    The solution of each subproblem is written to the directory as soon as the subproblem is 
+    solved, in the same format and under the same key as in a Cache, so that a restarted run on 
+    the same instance with the same settings skips all subproblems that were already solved. 
+    In contrast to a Cache, entries are never evicted.
+    
+    Additionally, each new incumbent found by the ILP is stored under a key that only depends on 
+    the weights of the solved subproblem. If the run is interrupted during the solve, the resumed 
+    run installs the last incumbent as MIP start and cutoff. Once an ILP solve finishes, its 
+    incumbent is replaced by the final solution, which is removed once the solution of the 
+    subproblem is stored. Call clear() once the run has finished.
+    
+    Attributes:
+        directory (string): The checkpoint directory. Created if it does not exist.
+        max_size (int): Always 0, i.e., no entries are evicted.
+        num_hits (int): Number of subproblems whose solutions were loaded from the checkpoint.
+        num_misses (int): Number of subproblems that were not found in the checkpoint.
+    """
+    
+    def __init__(self, directory):
+        super().__init__(directory, 0)
+    
+    def incumbent_path(self, key):
+        """Returns the path of an incumbent.
+    
+        Args:
+            key (string): The key of the incumbent, i.e., the key of the weights of the subproblem for algorithm None.
+    
+        Returns:
+            string: The path.
+        """
+        return os.path.join(self.directory, key + ".incumbent.npz")
+    
+    def get_incumbent(self, key):
+        """Looks up an incumbent.
+    
+        Args:
+            key (string): The key of the incumbent.
+    
+        Returns:
+            None or tuple of numpy.array: None if there is no incumbent with the given key. 
+                Otherwise, the bi-cluster labels of the rows and columns of the subproblem.
+        """
+        try:
+            with np.load(self.incumbent_path(key)) as incumbent:
+                return incumbent["row_labels"], incumbent["col_labels"]
+        except (OSError, KeyError, ValueError):
+            return None
+    
+    def put_incumbent(self, key, row_labels, col_labels):
+        """Stores an incumbent.
+    
+        The incumbent is first written to a temporary file, which is then atomically renamed.
+    
+        Args:
+            key (string): The key of the incumbent.
+            row_labels (numpy.array): Bi-cluster labels of the rows of the subproblem.
+            col_labels (numpy.array): Bi-cluster labels of the columns of the subproblem.
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            np.savez(temp_file, row_labels=row_labels, col_labels=col_labels)
+        os.replace(temp_path, self.incumbent_path(key))
+    
+    def remove_incumbent(self, key):
+        """Removes an incumbent if it exists.
+    
+        Args:
+            key (string): The key of the incumbent.
+        """
+        try:
+            os.remove(self.incumbent_path(key))
+        except FileNotFoundError:
+            pass
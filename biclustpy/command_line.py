@@ -1,23 +1,178 @@
 from . import main as bp
+from . import cache as ca
+from . import checkpoint as cp
+from . import distributed as di
+from . import monitor as mon
+import glob
+import multiprocessing as mp
 import numpy as np
+import os
+import scipy.sparse as sp
 import argparse as ap
 
+def load_instance(filename, mmap, float32):
+    """Loads an instance from a .npy file or a sparse instance from a .npz file.
+    
+    Args:
+        filename (string): Name of the file.
+        mmap (bool): If True, .npy files are memory-mapped.
+        float32 (bool): If True, the instance is stored with single precision.
+    
+    Returns:
+        numpy.array or scipy.sparse.csr_matrix: The instance.
+    """
+    if filename.endswith(".npz"):
+        weights = sp.load_npz(filename)
+        if float32:
+            weights = weights.astype(np.float32)
+        return weights
+    weights = np.load(filename, mmap_mode="r")
+    if float32 and weights.dtype != np.float32:
+        weights = weights.astype(np.float32)
+    elif not mmap:
+        weights = np.array(weights)
+    return weights
+
+def is_batch(path):
+    """Checks if a path specifies a batch of instances.
+    
+    Args:
+        path (string): A file, a directory, or a glob pattern.
+    
+    Returns:
+        bool: True if and only if path is a directory, a glob pattern, or a .npz file with dense instances.
+    """
+    if os.path.isdir(path) or glob.has_magic(path):
+        return True
+    if path.endswith(".npz"):
+        with np.load(path) as npz_file:
+            return "format" not in npz_file.files
+    return False
+
+def check_name(name, names):
+    """Checks that the name of an instance has not been used before and records it.
+    
+    Args:
+        name (string): The name of the instance.
+        names (set of string): The names used so far.
+    """
+    if name in names:
+        raise Exception("Several instances are named \"" + name + "\".")
+    names.add(name)
+
+def iterate_instances(path, mmap, float32):
+    """Iterates over a batch of instances.
+    
+    Args:
+        path (string): A directory with .npy and .npz files, a glob pattern matching such files, 
+            or a .npz file with one dense instance per array.
+        mmap (bool): If True, .npy files are memory-mapped.
+        float32 (bool): If True, the instances are stored with single precision.
+    
+    Yields:
+        tuple: The name of an instance and the instance. The name is the name of the file without extension 
+            or, for a .npz file with dense instances, the name of the array if path is the file itself and 
+            the name of the file without extension followed by an underscore and the name of the array otherwise.
+    """
+    filenames = [path]
+    names = set()
+    if os.path.isdir(path):
+        filenames = sorted(glob.glob(os.path.join(path, "*.npy")) + glob.glob(os.path.join(path, "*.npz")))
+    elif glob.has_magic(path):
+        filenames = sorted(glob.glob(path))
+    for filename in filenames:
+        name = os.path.splitext(os.path.basename(filename))[0]
+        if filename.endswith(".npz") and is_batch(filename):
+            with np.load(filename) as npz_file:
+                for key in npz_file.files:
+                    weights = npz_file[key]
+                    if float32:
+                        weights = weights.astype(np.float32)
+                    key_name = key
+                    if filename != path:
+                        key_name = name + "_" + key
+                    check_name(key_name, names)
+                    yield key_name, weights
+        else:
+            check_name(name, names)
+            yield name, load_instance(filename, mmap, float32)
+
+def parse_address(address):
+    """Parses an address of the form host:port.
+    
+    Args:
+        address (string): The address.
+    
+    Returns:
+        tuple: The host and the port.
+    """
+    host, separator, port = address.rpartition(":")
+    if separator == "" or not port.isdigit():
+        raise Exception("Invalid address \"" + address + "\". Expected host:port.")
+    return host, int(port)
+
+def worker_main():
+    """Provides command line interface of the workers of biclustpy.
+    """
+    
+    parser = ap.ArgumentParser(description="Solve subproblems published by a biclustpy coordinator.")
+    parser.add_argument("address", help="Address of the coordinator, e.g., localhost:6000.", metavar="host:port")
+    parser.add_argument("--authkey", required=True, help="Key of the coordinator.", metavar="key")
+    parser.add_argument("--num_processes", type=int, default=1, help="Number of worker processes started on this host. Default = 1.", metavar="num-processes")
+    parser.add_argument("--wait", type=float, default=60, help="Time in seconds during which the workers try to connect to a coordinator that has not started yet. Default = 60.", metavar="wait-time")
+    args = parser.parse_args()
+    
+    address = parse_address(args.address)
+    authkey = args.authkey.encode()
+    if args.num_processes <= 1:
+        di.run_worker(address, authkey, args.wait)
+        return
+    processes = [mp.Process(target=di.run_worker, args=(address, authkey, args.wait)) for process_id in range(args.num_processes)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
 def main():
     """Provides command line interface of biclustpy.
     """
     
     parser = ap.ArgumentParser(description="Compute bi-clusters using bi-cluster editing.")
     instance = parser.add_mutually_exclusive_group(required=True)
-    instance.add_argument("--load", help="Load instance from .npy file.", metavar="input-file")
+    instance.add_argument("--load", help="Load instance from .npy file or sparse instance from .npz file. If input-file is a directory, a glob pattern, or a .npz file with several dense instances, all instances are solved in one process.", metavar="input-file")
     instance.add_argument("--random", nargs=4, help="Randomly generate instance with num-rows rows and num-cols columns whose cells are of the form ((random value between 0 and 1) - threshold).", metavar=("num-rows", "num-cols", "threshold", "seed"))
-    parser.add_argument("--save", help="Save bi-clusters as XML file.", metavar="output-file")
-    parser.add_argument("--alg", default="ILP", help="Employed algorithm. Default = ILP.", choices=["ILP", "CH"])
+    parser.add_argument("--mmap", action="store_true", help="Memory-map the instance loaded with --load instead of reading it into memory.")
+    parser.add_argument("--float32", action="store_true", help="Store the instance with single precision. If the .npy file has a different precision, the instance is converted and hence not memory-mapped.")
+    parser.add_argument("--default_weight", type=float, default=0.0, help="Weight of the cells that are not stored explicitly in a sparse instance. Default = 0.", metavar="default-weight")
+    parser.add_argument("--save", help="Save bi-clusters as .npz file with labels if output-file ends with .npz, as JSON lines if it ends with .jsonl, and as XML file otherwise. In batch mode, save one XML file per instance if output-file is a directory or ends with a path separator, and all bi-clusters in one XML file otherwise.", metavar="output-file")
+    parser.add_argument("--batch_format", default="xml", help="Format of the files saved per instance in batch mode if output-file is a directory. Default = xml.", choices=["xml", "npz", "jsonl"])
+    parser.add_argument("--alg", default="ILP", help="Employed algorithm. Default = ILP.", choices=["ILP", "CH", "GRASP", "AUTO"])
     parser.add_argument("--ilp_options", nargs=2, type=int, default=[60, 0], help="Options for the algorithm ILP: time limit in second and flag that indicates whether model should be tuned before optimization.", metavar=("time-limit", "tune"))
+    parser.add_argument("--grasp_options", nargs=4, type=float, default=[10, 0.8, 60, 1], help="Options for the algorithm GRASP: number of starts, alpha, time limit in seconds, and number of worker processes.", metavar=("num-starts", "alpha", "time-limit", "num-workers"))
+    parser.add_argument("--auto_options", nargs=2, type=float, default=[600, 400], help="Options for the algorithm AUTO: time budget in seconds for the overall computation and maximal number of cells of the subproblems that are solved with ILP.", metavar=("time-budget", "max-ilp-size"))
+    parser.add_argument("--ilp_backend", help="MILP backend of the algorithm ILP. Default = gurobi if gurobipy is installed and highs otherwise.", choices=["gurobi", "highs"])
+    parser.add_argument("--ilp_lazy", action="store_true", help="Generate the constraints of the algorithm ILP lazily.")
+    parser.add_argument("--ilp_warm_start", action="store_true", help="Use the solution of CH as MIP start and cutoff of the algorithm ILP.")
+    parser.add_argument("--reduce", action="store_true", help="Shrink the subproblems with data reduction rules before solving them.")
+    parser.add_argument("--bound", action="store_true", help="Compute lower bounds for the subproblems, skip ILP if CH matches the bound, and save the overall lower bound.")
+    parser.add_argument("--monitor", default="print", help="Report progress by printing banners, rendering a progress bar, or not at all. Default = print.", choices=["print", "progress", "quiet"])
+    parser.add_argument("--events", help="Write structured events as JSON lines to file.", metavar="events-file")
+    parser.add_argument("--cache", help="Cache the solutions of the subproblems in directory and reuse them in later runs.", metavar="cache-dir")
+    parser.add_argument("--cache_size", type=int, default=2**30, help="Maximal size of the cache in bytes. Default = 2^30.", metavar="cache-size")
+    parser.add_argument("--checkpoint", help="Store the solution of each subproblem and the incumbents of the ILP in directory and resume from them if the run is restarted.", metavar="checkpoint-dir")
+    parser.add_argument("--num_workers", type=int, default=1, help="Number of worker processes used to solve the subproblems. With --coordinator, number of subproblems in flight, which should match the overall number of workers. Default = 1.", metavar="num-workers")
+    parser.add_argument("--coordinator", help="Publish the subproblems on address for workers started with biclustpy-worker, possibly on other hosts. Not supported in batch mode.", metavar="host:port")
+    parser.add_argument("--authkey", help="Key that workers must present to connect to the coordinator. Default = random key, which only local workers know.", metavar="key")
+    parser.add_argument("--local_workers", type=int, default=0, help="Number of worker processes started on this host if --coordinator is given. Default = 0.", metavar="local-workers")
+    parser.add_argument("--worker_timeout", type=float, default=60, help="Abort if --coordinator is given and no worker has been connected for worker-timeout seconds while subproblems are waiting. Default = 60.", metavar="worker-timeout")
     args = parser.parse_args()
     
     weights = np.array(0)
-    if args.load is not None:
-        weights = np.load(args.load)
+    batch = args.load is not None and is_batch(args.load)
+    if batch and args.save is not None and args.save.endswith(".npz") and not (os.path.isdir(args.save) or args.save.endswith(os.sep)):
+        raise Exception("The bi-clusters of a batch cannot be saved in one .npz file. Save them in a directory with --batch_format npz instead.")
+    if args.load is not None and not batch:
+        weights = load_instance(args.load, args.mmap, args.float32)
     
     if args.random is not None:
         np.random.seed(int(args.random[3]))
@@ -26,12 +181,84 @@ def main():
         threshold = float(args.random[2])
         instance = "random"
         weights = np.random.rand(num_rows, num_cols) - (threshold * np.ones((num_rows, num_cols)))
+        if args.float32:
+            weights = weights.astype(np.float32)
     
     algorithm = bp.Algorithm()
     algorithm.algorithm_name = args.alg
     algorithm.ilp_time_limit = args.ilp_options[0]
     algorithm.ilp_tune = args.ilp_options[1]
-    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, algorithm)
+    algorithm.ilp_lazy = args.ilp_lazy
+    if args.ilp_backend is not None:
+        algorithm.ilp_backend = args.ilp_backend
+    algorithm.ilp_warm_start = args.ilp_warm_start
+    algorithm.grasp_num_starts = int(args.grasp_options[0])
+    algorithm.grasp_alpha = args.grasp_options[1]
+    algorithm.grasp_time_limit = args.grasp_options[2]
+    algorithm.grasp_num_workers = int(args.grasp_options[3])
+    algorithm.auto_time_budget = args.auto_options[0]
+    algorithm.auto_max_ilp_size = int(args.auto_options[1])
+    algorithm.reduce = args.reduce
+    algorithm.bound = args.bound
+    
+    monitors = []
+    if args.monitor == "print":
+        monitors.append(mon.PrintMonitor())
+    elif args.monitor == "progress":
+        monitors.append(mon.ProgressBarMonitor())
+    events_file = None
+    if args.events is not None:
+        events_file = open(args.events, "w")
+        monitors.append(mon.JsonLinesMonitor(events_file))
+    cache = None
+    if args.cache is not None:
+        cache = ca.Cache(args.cache, args.cache_size)
+    checkpoint = None
+    if args.checkpoint is not None:
+        checkpoint = cp.Checkpoint(args.checkpoint)
+    
+    coordinator = None
+    if args.coordinator is not None:
+        if batch:
+            raise Exception("Option --coordinator is not supported in batch mode.")
+        authkey = None
+        if args.authkey is not None:
+            authkey = args.authkey.encode()
+        coordinator = di.Coordinator(parse_address(args.coordinator), authkey, worker_timeout = args.worker_timeout)
+    
+    if batch:
+        results = bp.compute_bi_clusters_batch(iterate_instances(args.load, args.mmap, args.float32), algorithm, args.num_workers, args.default_weight, mon.MultiMonitor(monitors), 
+                                               cache, checkpoint, return_lower_bound = args.bound)
+        if args.save is None:
+            for result in results:
+                pass
+        elif os.path.isdir(args.save) or args.save.endswith(os.sep):
+            os.makedirs(args.save, exist_ok=True)
+            for name, bi_clusters, obj_val, is_optimal, *lower_bound in results:
+                bp.save_bi_clusters(os.path.join(args.save, name + "." + args.batch_format), bi_clusters, obj_val, is_optimal, name, *lower_bound)
+        elif args.save.endswith(".jsonl"):
+            bp.save_bi_clusters_batch_as_jsonl(args.save, results)
+        else:
+            bp.save_bi_clusters_batch_as_xml(args.save, results)
+    else:
+        try:
+            if coordinator is not None:
+                coordinator.start_local_workers(args.local_workers)
+            bi_clusters, obj_val, is_optimal, lower_bound = bp.compute_bi_clusters(weights, algorithm, args.num_workers, args.default_weight, mon.MultiMonitor(monitors), 
+                                                                                   cache = cache, checkpoint = checkpoint, return_lower_bound = True, coordinator = coordinator)
+            if coordinator is not None:
+                coordinator.report(mon.MultiMonitor(monitors))
+        finally:
+            if coordinator is not None:
+                coordinator.shutdown()
+    if events_file is not None:
+        events_file.close()
+    if cache is not None and args.monitor == "print":
+        statistics = cache.statistics()
+        print("Cache hits: " + str(statistics["num_hits"]) + ", misses: " + str(statistics["num_misses"]) + ", entries: " + str(statistics["num_entries"]) + ", size: " + str(statistics["size"]) + " bytes")
+    
+    if batch:
+        return
     
     if args.save is not None:
         instance = ""
@@ -39,5 +266,7 @@ def main():
             instance = args.load
         if args.random is not None:
             instance = "random (threshold=" + args.random[2] + ", seed=" + args.random[3] + ")"
-        bp.save_bi_clusters_as_xml(args.save, bi_clusters, obj_val, is_optimal, instance)
+        if not args.bound:
+            lower_bound = None
+        bp.save_bi_clusters(args.save, bi_clusters, obj_val, is_optimal, instance, lower_bound)
         
\ No newline at end of file
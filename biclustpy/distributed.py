@@ -0,0 +1,330 @@
+from . import helpers
+from . import main
+import concurrent.futures
+import multiprocessing
+import multiprocessing.connection as mpc
+import os
+import queue
+import socket
+import threading
+import time
+
+class Coordinator:
+
+    """Distributes subproblems to worker processes that connect over the network.
+    
+    The coordinator listens on a socket and publishes the subproblems that are submitted to it
+    in a work queue. Workers are started with run_worker() on any host, e.g., via the command
+    biclustpy-worker, connect to the coordinator, and solve one subproblem at a time. Each task
+    consists of the weights of a subproblem, the settings of the algorithm, and the start labels.
+    The workers send back bi-cluster labels, which the coordinator converts into bi-clusters.
+    While a worker solves a subproblem, it sends heartbeats. If the connection to a worker is lost 
+    or the worker sends nothing for heartbeat_timeout seconds, e.g., because its host died without 
+    closing the connection, the subproblem is put back into the queue and solved by another worker, 
+    at most max_retries times. If subproblems
+    are waiting while no worker has been connected for worker_timeout seconds, they fail.
+    Exceptions raised by the algorithm are passed on to the caller without retrying.
+    
+    Pass the coordinator to compute_bi_clusters() to solve the subproblems of an instance on the
+    workers. The coordinator should be shut down with shutdown() or used as a context manager,
+    which also stops the workers.
+    
+    Attributes:
+        address (tuple): Host and port the coordinator listens on.
+        authkey (bytes): Key that workers must present to connect.
+        max_retries (int): Maximal number of times a subproblem is put back into the queue after a worker was lost.
+        worker_timeout (float): Time in seconds after which waiting subproblems fail if no worker is connected.
+        heartbeat_timeout (float): Time in seconds after which a silent worker is considered lost.
+    """
+    
+    def __init__(self, address = ("localhost", 0), authkey = None, max_retries = 3, worker_timeout = 60.0, heartbeat_timeout = 30.0):
+        """Starts listening for workers.
+    
+        Args:
+            address (tuple): Host and port the coordinator listens on. If the port is 0, a free port is chosen.
+            authkey (None or bytes): Key that workers must present to connect. If None, a random key is generated.
+            max_retries (int): Maximal number of times a subproblem is put back into the queue after a worker was lost.
+            worker_timeout (float): Time in seconds after which waiting subproblems fail if no worker is connected.
+            heartbeat_timeout (float): Time in seconds after which a silent worker is considered lost. 
+                Workers send heartbeats three times as often.
+        """
+        if authkey is None:
+            authkey = os.urandom(16)
+        self.socket = socket.create_server(address)
+        self.address = self.socket.getsockname()[:2]
+        self.authkey = authkey
+        self.max_retries = max_retries
+        self.worker_timeout = worker_timeout
+        self.heartbeat_timeout = heartbeat_timeout
+        self.tasks = queue.Queue()
+        self.lock = threading.Lock()
+        self.workers = {}
+        self.threads = []
+        self.processes = []
+        self.is_closed = False
+        self.accept_thread = threading.Thread(target = self.accept, daemon = True)
+        self.accept_thread.start()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+    
+    def accept(self):
+        """Accepts workers until the coordinator is shut down and serves each of them in a thread of its own.
+    
+        Between connections, fails the waiting subproblems if no worker has been connected for too long.
+        """
+        idle_since = time.perf_counter()
+        while not self.is_closed:
+            with self.lock:
+                num_connected = sum(worker_statistics["is_connected"] for worker_statistics in self.workers.values())
+            if num_connected > 0 or self.tasks.empty():
+                idle_since = time.perf_counter()
+            elif time.perf_counter() - idle_since > self.worker_timeout:
+                self.fail_waiting_tasks("No worker has been connected for " + str(self.worker_timeout) + " seconds.")
+            try:
+                if len(mpc.wait([self.socket], timeout = 0.2)) == 0:
+                    continue
+                worker_socket = self.socket.accept()[0]
+            except OSError:
+                return
+            worker_socket.setblocking(True)
+            thread = threading.Thread(target = self.serve, args = (mpc.Connection(worker_socket.detach()),), daemon = True)
+            with self.lock:
+                self.threads.append(thread)
+            thread.start()
+    
+    def fail_waiting_tasks(self, message):
+        """Removes all subproblems from the queue and lets them fail.
+    
+        Args:
+            message (string): Message of the exception.
+        """
+        while True:
+            try:
+                task = self.tasks.get_nowait()
+            except queue.Empty:
+                return
+            task[3].set_exception(Exception(message))
+    
+    def serve(self, connection):
+        """Authenticates a worker, sends subproblems to it, and collects its results until the worker is lost or the coordinator is shut down.
+    
+        Args:
+            connection (multiprocessing.connection.Connection): The connection to the worker.
+        """
+        try:
+            mpc.deliver_challenge(connection, self.authkey)
+            mpc.answer_challenge(connection, self.authkey)
+            hello, host, pid = connection.recv()
+        except (OSError, EOFError, ValueError, mpc.AuthenticationError):
+            connection.close()
+            return
+        name = host + ":" + str(pid)
+        statistics = {"worker": name, "num_tasks": 0, "num_lost_tasks": 0, "num_cells": 0, "busy_time": 0.0, "is_connected": True}
+        with self.lock:
+            self.workers[name] = statistics
+        while not self.is_closed:
+            try:
+                task = self.tasks.get(timeout = 0.2)
+            except queue.Empty:
+                continue
+            weights, algorithm, start_labels, future, num_retries = task
+            start = time.perf_counter()
+            try:
+                connection.send((weights, algorithm, start_labels, self.heartbeat_timeout / 3))
+                status, reply = "heartbeat", None
+                while status == "heartbeat":
+                    if not connection.poll(self.heartbeat_timeout):
+                        # The worker is silent but has not disconnected. TimeoutError is an OSError.
+                        raise TimeoutError("Worker " + name + " sent no heartbeat for " + str(self.heartbeat_timeout) + " seconds.")
+                    status, reply = connection.recv()
+            except (OSError, EOFError):
+                # Put the subproblem back into the queue and drop the worker.
+                with self.lock:
+                    statistics["num_lost_tasks"] = statistics["num_lost_tasks"] + 1
+                    statistics["is_connected"] = False
+                if num_retries < self.max_retries:
+                    self.tasks.put((weights, algorithm, start_labels, future, num_retries + 1))
+                else:
+                    future.set_exception(Exception("Subproblem was lost by " + str(num_retries + 1) + " workers."))
+                connection.close()
+                return
+            except Exception as error:
+                future.set_exception(error)
+                continue
+            with self.lock:
+                statistics["num_tasks"] = statistics["num_tasks"] + 1
+                statistics["num_cells"] = statistics["num_cells"] + weights.size
+                statistics["busy_time"] = statistics["busy_time"] + time.perf_counter() - start
+            if status == "error":
+                future.set_exception(reply)
+                continue
+            row_labels, col_labels, obj_val, is_optimal, lower_bound, is_improved, recorded_monitor, run_time = reply
+            num_labels = max(row_labels.max(initial=-1), col_labels.max(initial=-1)) + 1
+            bi_clusters = [(rows.tolist(), cols.tolist()) for rows, cols in helpers.group_by_labels(row_labels, col_labels, num_labels)]
+            future.set_result(((bi_clusters, obj_val, is_optimal, lower_bound, is_improved), recorded_monitor, run_time, []))
+        # Tell the worker to stop.
+        try:
+            connection.send(None)
+        except OSError:
+            pass
+        connection.close()
+        with self.lock:
+            statistics["is_connected"] = False
+    
+    def submit(self, algorithm, weights, start_labels = None):
+        """Publishes a subproblem in the work queue.
+    
+        Args:
+            algorithm (Algorithm): The algorithm that should be used.
+            weights (numpy.array): The weights of the subproblem.
+            start_labels (None or tuple of numpy.array): Bi-cluster labels of the rows and columns of a start solution.
+    
+        Returns:
+            concurrent.futures.Future: Future whose result are the return values of main.solve_subproblem_recorded().
+        """
+        if self.is_closed:
+            raise Exception("Coordinator has been shut down.")
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        self.tasks.put((weights, algorithm, start_labels, future, 0))
+        return future
+    
+    def start_local_workers(self, num_workers):
+        """Starts worker processes on the local host.
+    
+        The processes are joined by shutdown() and terminated if they do not stop in time.
+    
+        Args:
+            num_workers (int): Number of worker processes.
+        """
+        for worker_id in range(num_workers):
+            process = multiprocessing.Process(target = run_worker, args = (self.address, self.authkey, 10.0))
+            process.start()
+            self.processes.append(process)
+    
+    def statistics(self):
+        """Returns the throughput of the workers that have connected so far.
+    
+        Returns:
+            list of dict: For each worker, its name \"host:pid\" (key \"worker\"), the number of solved subproblems
+                (\"num_tasks\"), the number of subproblems it was solving when it was lost (\"num_lost_tasks\"), the
+                number of cells of the solved subproblems (\"num_cells\"), the time spent on them in seconds including
+                the transfer (\"busy_time\"), the number of cells solved per second of busy time (\"throughput\"), and
+                whether it is still connected (\"is_connected\").
+        """
+        with self.lock:
+            statistics = [dict(worker_statistics) for worker_statistics in self.workers.values()]
+        for worker_statistics in statistics:
+            worker_statistics["throughput"] = worker_statistics["num_cells"] / max(worker_statistics["busy_time"], 1e-9)
+        return statistics
+    
+    def report(self, monitor):
+        """Emits one event \"worker_reported\" per worker with its statistics, see statistics().
+    
+        Args:
+            monitor (Monitor): The monitor that should receive the events.
+        """
+        for worker_statistics in self.statistics():
+            monitor.event("worker_reported", **worker_statistics)
+    
+    def shutdown(self, timeout = 5.0):
+        """Stops the workers, stops listening, and waits for the local worker processes.
+    
+        Subproblems that are still in the queue fail. Workers that are still solving a subproblem 
+        are not waited for, and local worker processes that do not stop in time are terminated.
+    
+        Args:
+            timeout (float): Time in seconds to wait for the workers.
+        """
+        with self.lock:
+            if self.is_closed:
+                return
+            self.is_closed = True
+        self.accept_thread.join()
+        self.socket.close()
+        self.fail_waiting_tasks("Coordinator has been shut down.")
+        deadline = time.perf_counter() + timeout
+        with self.lock:
+            threads = list(self.threads)
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.perf_counter()))
+        for process in self.processes:
+            process.join(max(0.0, deadline - time.perf_counter()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+def connect(address, authkey, wait_time):
+    """Connects to a coordinator, retrying refused connections until the coordinator has started.
+    
+    Args:
+        address (tuple): Host and port of the coordinator.
+        authkey (bytes): Key of the coordinator.
+        wait_time (float): Time in seconds during which refused connections are retried.
+    
+    Returns:
+        multiprocessing.connection.Connection: The connection to the coordinator.
+    """
+    deadline = time.perf_counter() + wait_time
+    while True:
+        try:
+            return mpc.Client(address, authkey = authkey)
+        except ConnectionRefusedError:
+            if time.perf_counter() >= deadline:
+                raise
+            time.sleep(0.5)
+
+def run_worker(address, authkey, wait_time = 0.0):
+    """Connects to a coordinator and solves subproblems until the coordinator shuts down or the connection is lost.
+    
+    While a subproblem is solved, a thread sends heartbeats at the interval requested by the coordinator.
+    
+    Args:
+        address (tuple): Host and port of the coordinator.
+        authkey (bytes): Key of the coordinator.
+        wait_time (float): Time in seconds during which refused connections are retried, e.g., 
+            because the worker was started before the coordinator.
+    
+    Returns:
+        int: Number of solved subproblems.
+    """
+    num_tasks = 0
+    with connect(address, authkey, wait_time) as connection:
+        connection.send(("hello", socket.gethostname(), os.getpid()))
+        while True:
+            try:
+                task = connection.recv()
+            except (OSError, EOFError):
+                break
+            if task is None:
+                break
+            weights, algorithm, start_labels, heartbeat_interval = task
+            lock = threading.Lock()
+            is_solved = threading.Event()
+            def send_heartbeats():
+                while not is_solved.wait(heartbeat_interval):
+                    with lock:
+                        try:
+                            connection.send(("heartbeat", None))
+                        except (OSError, EOFError):
+                            return
+            heartbeat_thread = threading.Thread(target = send_heartbeats, daemon = True)
+            heartbeat_thread.start()
+            try:
+                (bi_clusters, obj_val, is_optimal, lower_bound, is_improved), recorded_monitor, run_time, incumbent_keys = main.solve_subproblem_recorded(algorithm, weights, start_labels)
+                row_labels, col_labels = helpers.bi_clusters_to_labels(bi_clusters, weights.shape[0], weights.shape[1])[:2]
+                reply = ("done", (row_labels, col_labels, obj_val, is_optimal, lower_bound, is_improved, recorded_monitor, run_time))
+            except Exception as error:
+                reply = ("error", error)
+            is_solved.set()
+            heartbeat_thread.join()
+            try:
+                connection.send(reply)
+            except (OSError, EOFError):
+                break
+            num_tasks = num_tasks + 1
+    return num_tasks
@@ -0,0 +1,187 @@
+from . import ch
+from . import helpers
+from .monitor import Monitor
+import concurrent.futures
+import numpy as np
+import time
+
+def improve(weights, row_labels, col_labels, deadline = None):
+    """Improves a bi-clustering of a subproblem via local search.
+    
+    The cost of a bi-clustering equals the sum of all positive weights minus the sum of
+    the weights of all pairs (i,k) that belong to the same bi-cluster. For each row i and
+    each bi-cluster g, the local search maintains the sum of the weights between i and
+    the columns of g (and vice versa). This allows to evaluate the cost change of
+    moving a node to another bi-cluster in O(1). The following moves are applied until
+    no move improves the cost:
+        - Moving a row or a column to another bi-cluster.
+        - Moving a row or a column to a new bi-cluster, i.e., splitting it off from its bi-cluster.
+        - Merging two bi-clusters.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+        row_labels (numpy.array): Initial bi-cluster labels of the rows.
+        col_labels (numpy.array): Initial bi-cluster labels of the columns.
+        deadline (None or float): If not None, the search stops after the first sweep that ends after this point in time.
+    
+    Returns:
+        numpy.array: Improved bi-cluster labels of the rows.
+        numpy.array: Improved bi-cluster labels of the columns.
+    """
+    num_rows, num_cols = weights.shape
+    tolerance = 1e-9 * max(1.0, np.abs(weights).max())
+    
+    # Relabel the bi-clusters to 0, 1, ... and reserve one empty bi-cluster.
+    labels = np.unique(np.concatenate([row_labels, col_labels]), return_inverse=True)[1]
+    row_labels = labels[:num_rows].copy()
+    col_labels = labels[num_rows:].copy()
+    capacity = labels.max() + 2
+    row_counts = np.bincount(row_labels, minlength=capacity)
+    col_counts = np.bincount(col_labels, minlength=capacity)
+    
+    # Initialize the sums of weights between nodes and bi-clusters.
+    row_sums = np.zeros((num_rows, capacity))
+    np.add.at(row_sums.T, col_labels, weights.T)
+    col_sums = np.zeros((num_cols, capacity))
+    np.add.at(col_sums.T, row_labels, weights)
+    
+    def reserve_empty_bi_cluster():
+        nonlocal capacity, row_counts, col_counts, row_sums, col_sums
+        if np.any(row_counts + col_counts == 0):
+            return
+        row_counts = np.concatenate([row_counts, np.zeros(capacity, dtype=row_counts.dtype)])
+        col_counts = np.concatenate([col_counts, np.zeros(capacity, dtype=col_counts.dtype)])
+        row_sums = np.hstack([row_sums, np.zeros((num_rows, capacity))])
+        col_sums = np.hstack([col_sums, np.zeros((num_cols, capacity))])
+        capacity = 2 * capacity
+    
+    is_improved = True
+    while is_improved:
+        is_improved = False
+    
+        # Move rows. Moving a row does not change row_sums.
+        for i in range(num_rows):
+            g = row_labels[i]
+            h = np.argmax(row_sums[i])
+            if row_sums[i, h] - row_sums[i, g] > tolerance:
+                col_sums[:, g] = col_sums[:, g] - weights[i]
+                col_sums[:, h] = col_sums[:, h] + weights[i]
+                row_counts[g] = row_counts[g] - 1
+                row_counts[h] = row_counts[h] + 1
+                row_labels[i] = h
+                reserve_empty_bi_cluster()
+                is_improved = True
+    
+        # Move columns. Moving a column does not change col_sums.
+        for k in range(num_cols):
+            g = col_labels[k]
+            h = np.argmax(col_sums[k])
+            if col_sums[k, h] - col_sums[k, g] > tolerance:
+                row_sums[:, g] = row_sums[:, g] - weights[:, k]
+                row_sums[:, h] = row_sums[:, h] + weights[:, k]
+                col_counts[g] = col_counts[g] - 1
+                col_counts[h] = col_counts[h] + 1
+                col_labels[k] = h
+                reserve_empty_bi_cluster()
+                is_improved = True
+    
+        # Merge the pair of bi-clusters with the largest gain.
+        between_sums = np.zeros((capacity, capacity))
+        np.add.at(between_sums, row_labels, row_sums)
+        merge_gains = between_sums + between_sums.T
+        np.fill_diagonal(merge_gains, -np.inf)
+        g, h = np.unravel_index(np.argmax(merge_gains), merge_gains.shape)
+        if merge_gains[g, h] > tolerance:
+            row_labels[row_labels == h] = g
+            col_labels[col_labels == h] = g
+            row_sums[:, g] = row_sums[:, g] + row_sums[:, h]
+            row_sums[:, h] = 0
+            col_sums[:, g] = col_sums[:, g] + col_sums[:, h]
+            col_sums[:, h] = 0
+            row_counts[g] = row_counts[g] + row_counts[h]
+            row_counts[h] = 0
+            col_counts[g] = col_counts[g] + col_counts[h]
+            col_counts[h] = 0
+            is_improved = True
+    
+        if deadline is not None and time.time() > deadline:
+            break
+    
+    return row_labels, col_labels
+
+def run_start(weights, alpha, seed_sequence, deadline):
+    """Runs a single start of GRASP, i.e., randomized construction followed by local search.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+        alpha (float): Between 0 and 1. Parameter of the randomized construction.
+        seed_sequence (numpy.random.SeedSequence): Seed for random generation.
+        deadline (None or float): Point in time when the local search should stop.
+    
+    Returns:
+        numpy.array: Bi-cluster labels of the rows.
+        numpy.array: Bi-cluster labels of the columns.
+        float: Objective value of the obtained solution.
+    """
+    row_labels, col_labels = ch.construct(weights, alpha, np.random.default_rng(seed_sequence))
+    row_labels, col_labels = improve(weights, row_labels, col_labels, deadline)
+    return row_labels, col_labels, helpers.compute_obj_val(weights, row_labels, col_labels)
+
+def run(weights, rows, cols, num_starts, alpha, time_limit, seed, num_workers, monitor = None, default_weight = 0.0):
+    """Suboptimally solves the bi-cluster editing problem via multi-start GRASP.
+    
+    Each start builds a randomized solution with the construction phase of CH and
+    improves it via local search. The best solution over all starts is returned.
+    
+    Args:
+        weights (numpy.array or scipy.sparse matrix): The overall problem instance. 
+            If sparse, cells that are not stored explicitly have the default weight.
+        rows (numpy.array): The rows of the subproblem that should be rendered bi-transitive.
+        cols (numpy.array): The columns of the subproblem that should be rendered bi-transitive.
+        num_starts (int): Maximal number of starts. Must be at least 1.
+        alpha (float): Between 0 and 1. Parameter of the randomized construction.
+        time_limit (float): Time limit in seconds. No further starts are launched once
+            it is reached, but at least one start is completed. If <= 0, no time limit is enforced.
+        seed (None or int): Seed for random generation.
+        num_workers (int): Number of worker processes that run starts in parallel.
+        monitor (None or Monitor): Receives the event \"grasp_finished\".
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+    
+    Returns:
+        numpy.array: Bi-cluster labels of the rows of the subproblem.
+        numpy.array: Bi-cluster labels of the columns of the subproblem.
+        float: Objective value of obtained solution.
+        bool: True if and only if obtained solution is guaranteed to be optimal.
+    """
+    
+    if num_starts < 1:
+        raise Exception("Number of starts of GRASP should be at least 1 but is " + str(num_starts) + ".")
+    if monitor is None:
+        monitor = Monitor()
+    start = time.perf_counter()
+    sub_weights = helpers.get_submatrix(weights, rows, cols, default_weight)
+    seed_sequences = np.random.SeedSequence(seed).spawn(num_starts)
+    deadline = None
+    if time_limit > 0:
+        deadline = time.time() + time_limit
+    
+    # Run the starts.
+    results = []
+    if num_workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers = num_workers) as executor:
+            futures = [executor.submit(run_start, sub_weights, alpha, seed_sequence, deadline) for seed_sequence in seed_sequences]
+            if deadline is not None:
+                concurrent.futures.wait(futures, timeout = max(0.0, deadline - time.time()))
+                for future in futures[1:]:
+                    future.cancel()
+            results = [future.result() for future in futures if not future.cancelled()]
+    else:
+        for seed_sequence in seed_sequences:
+            results.append(run_start(sub_weights, alpha, seed_sequence, deadline))
+            if deadline is not None and time.time() > deadline:
+                break
+    
+    # Return the best solution.
+    row_labels, col_labels, obj_val = min(results, key = lambda result: result[2])
+    monitor.event("grasp_finished", num_starts = len(results), obj_val = obj_val, time = time.perf_counter() - start)
+    return row_labels, col_labels, obj_val, False
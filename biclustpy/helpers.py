@@ -1,40 +1,71 @@
+import json
 import networkx as nx
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse import csgraph
+from xml.sax.saxutils import escape
 
-def prettify(elem):
-    """Returns a pretty-printed XML string for the ElementTree element.
+def write_bi_clusters_as_xml(xml_file, bi_clusters, obj_val, is_optimal, instance, indent = "", lower_bound = None):
+    """Writes a \"bi_clusters\" XML element one bi-cluster at a time.
     
-    Args:
-        elem (xml.etree.ElementTree.Element): The element that should be prettified.
+    The element is indented with tabs, and the rows and columns of each bi-cluster are 
+    written as soon as they are formatted, so that no document tree is built in memory.
     
-    Returns:
-        string: A pretty-printed XML string for the element.
+    Args:
+        xml_file (file object): The file the element is written to.
+        bi_clusters (list of tuple of list of int): List of bi-clusters.
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        obj_val (float): Objective value of the bi-clusters.
+        is_optimal (bool): True if and only if the bi-clusters are guaranteed to be optimal.
+        instance (string): String that contains information about the problem instance.
+        indent (string): Indentation of the element.
+        lower_bound (None or float): Lower bound on the optimal objective value. 
+            Written as attribute \"lower_bound\" if not None.
     """
-    rough_string = ET.tostring(elem, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="\t")
-    
-def build_element_tree(bi_clusters, obj_val, is_optimal, instance):
-    root = ET.Element("bi_clusters")
-    root.set("num_bi_clusters", str(len(bi_clusters)))
-    root.set("num_rows", str(sum([len(bi_cluster[0]) for bi_cluster in bi_clusters])))
-    root.set("num_cols", str(sum([len(bi_cluster[1]) for bi_cluster in bi_clusters])))
-    root.set("obj_val", str(obj_val))
-    root.set("is_opt", str(is_optimal))
-    root.set("instance", instance)
+    xml_file.write(indent + "<bi_clusters num_bi_clusters=\"" + str(len(bi_clusters)) + "\"")
+    xml_file.write(" num_rows=\"" + str(sum([len(bi_cluster[0]) for bi_cluster in bi_clusters])) + "\"")
+    xml_file.write(" num_cols=\"" + str(sum([len(bi_cluster[1]) for bi_cluster in bi_clusters])) + "\"")
+    xml_file.write(" obj_val=\"" + str(obj_val) + "\" is_opt=\"" + str(is_optimal) + "\"")
+    if lower_bound is not None:
+        xml_file.write(" lower_bound=\"" + str(lower_bound) + "\"")
+    xml_file.write(" instance=\"" + escape(instance, {"\"": "&quot;"}) + "\"")
+    if len(bi_clusters) == 0:
+        xml_file.write("/>\n")
+        return
+    xml_file.write(">\n")
     cluster_id = 0
     for bi_cluster in bi_clusters:
-        child = ET.SubElement(root, "bi_cluster")
-        child.set("id", "_" + str(cluster_id))
-        child.set("num_rows", str(len(bi_cluster[0])))
-        child.set("num_cols", str(len(bi_cluster[1])))
-        rows = ET.SubElement(child, "rows")
-        rows.text = " ".join([str(row) for row in bi_cluster[0]])
-        columns = ET.SubElement(child, "cols")
-        columns.text = " ".join([str(col) for col in bi_cluster[1]])
+        xml_file.write(indent + "\t<bi_cluster id=\"_" + str(cluster_id) + "\" num_rows=\"" + str(len(bi_cluster[0])) + "\" num_cols=\"" + str(len(bi_cluster[1])) + "\">\n")
+        for tag, nodes in (("rows", bi_cluster[0]), ("cols", bi_cluster[1])):
+            if len(nodes) == 0:
+                xml_file.write(indent + "\t\t<" + tag + "/>\n")
+            else:
+                xml_file.write(indent + "\t\t<" + tag + ">" + " ".join([str(node) for node in nodes]) + "</" + tag + ">\n")
+        xml_file.write(indent + "\t</bi_cluster>\n")
         cluster_id = cluster_id + 1
-    return root
+    xml_file.write(indent + "</bi_clusters>\n")
+    
+def write_bi_clusters_as_jsonl(jsonl_file, bi_clusters, obj_val, is_optimal, instance, lower_bound = None):
+    """Writes a header line and one line per bi-cluster as JSON lines.
+    
+    The header contains \"num_bi_clusters\", \"obj_val\", \"is_optimal\", \"instance\", and, if not None, 
+    \"lower_bound\". Each further line contains the \"rows\" and \"cols\" of one bi-cluster.
+    
+    Args:
+        jsonl_file (file object): The file the lines are written to.
+        bi_clusters (list of tuple of list of int): List of bi-clusters.
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        obj_val (float): Objective value of the bi-clusters.
+        is_optimal (bool): True if and only if the bi-clusters are guaranteed to be optimal.
+        instance (string): String that contains information about the problem instance.
+        lower_bound (None or float): Lower bound on the optimal objective value.
+    """
+    header = {"num_bi_clusters": len(bi_clusters), "obj_val": obj_val, "is_optimal": is_optimal, "instance": instance}
+    if lower_bound is not None:
+        header["lower_bound"] = lower_bound
+    jsonl_file.write(json.dumps(header, default=lambda value: value.item()) + "\n")
+    for rows, cols in bi_clusters:
+        jsonl_file.write(json.dumps({"rows": rows, "cols": cols}, default=lambda value: value.item()) + "\n")
     
 def col_to_node(col, num_rows):
     """Returns node ID of a column in the instance.
@@ -98,16 +129,223 @@ def build_graph_from_weights(weights, nodes):
     graph = nx.Graph()
     graph.add_nodes_from(nodes)
     num_rows = weights.shape[0]
-    for row in nodes:
-        if is_col(row, num_rows):
-            continue
-        for col in nodes:
-            if is_row(col, num_rows):
-                continue
-            if weights[row, node_to_col(col, num_rows)] > 0:
-                graph.add_edge(row, col)
+    nodes = np.asarray(list(nodes), dtype=int)
+    rows = nodes[nodes < num_rows]
+    cols = nodes[nodes >= num_rows]
+    edge_rows, edge_cols = np.nonzero(weights[np.ix_(rows, cols - num_rows)] > 0)
+    graph.add_edges_from(zip(rows[edge_rows].tolist(), cols[edge_cols].tolist()))
+    return graph
+
+def build_graph_from_labels(rows, cols, row_labels, col_labels, num_rows):
+    """Builds the bi-transitive NetworkX graph that corresponds to a bi-clustering of a subproblem.
+    
+    Args:
+        rows (numpy.array): The rows of the subproblem.
+        cols (numpy.array): The columns of the subproblem.
+        row_labels (numpy.array): Bi-cluster labels of the rows.
+        col_labels (numpy.array): Bi-cluster labels of the columns.
+        num_rows (int): The number of rows in the instance.
+    
+    Returns:
+        networkx.Graph: Graph whose connected components are the bi-cliques induced by the labels.
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(rows.tolist())
+    graph.add_nodes_from((cols + num_rows).tolist())
+    edge_rows, edge_cols = np.nonzero(row_labels[:, None] == col_labels[None, :])
+    graph.add_edges_from(zip(rows[edge_rows].tolist(), (cols[edge_cols] + num_rows).tolist()))
     return graph
 
+def row_chunks(shape, chunk_size):
+    """Splits the rows of a matrix into chunks of consecutive rows.
+    
+    Args:
+        shape (tuple of int): Shape of the matrix.
+        chunk_size (int): Maximal number of cells per chunk. Each chunk contains at least one row.
+    
+    Returns:
+        list of tuple of int: Start and stop rows of the chunks.
+    """
+    num_rows_per_chunk = max(1, chunk_size // max(1, shape[1]))
+    return [(start, min(start + num_rows_per_chunk, shape[0])) for start in range(0, shape[0], num_rows_per_chunk)]
+
+def compute_obj_val(weights, row_labels, col_labels, default_weight = 0.0, chunk_size = 2 ** 24):
+    """Computes the objective value of a bi-clustering of a subproblem.
+    
+    Args:
+        weights (numpy.array or scipy.sparse matrix): The weights of the subproblem. May be memory-mapped.
+        row_labels (numpy.array): Bi-cluster labels of the rows.
+        col_labels (numpy.array): Bi-cluster labels of the columns.
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+        chunk_size (int): Maximal number of cells that are processed at once.
+    
+    Returns:
+        float: The overall cost of the edge insertions and deletions induced by the bi-clustering.
+    """
+    if sp.issparse(weights):
+        # The cost equals the sum of all positive weights minus the sum of the weights of all 
+        # pairs that belong to the same bi-cluster. Cells that are not stored explicitly 
+        # contribute the default weight.
+        weights = sp.coo_matrix(weights)
+        weights.sum_duplicates()
+        num_missing = weights.shape[0] * weights.shape[1] - weights.nnz
+        is_same = row_labels[weights.row] == col_labels[weights.col]
+        labels = np.unique(np.concatenate([row_labels, col_labels]), return_inverse=True)[1]
+        num_labels = labels.max() + 1 if labels.size > 0 else 0
+        num_same = np.dot(np.bincount(labels[:weights.shape[0]], minlength=num_labels), np.bincount(labels[weights.shape[0]:], minlength=num_labels))
+        positive_sum = np.maximum(weights.data, 0).sum() + max(default_weight, 0) * num_missing
+        same_sum = weights.data[is_same].sum() + default_weight * (num_same - np.count_nonzero(is_same))
+        return positive_sum - same_sum
+    obj_val = 0
+    for start, stop in row_chunks(weights.shape, chunk_size):
+        chunk = np.asarray(weights[start:stop])
+        is_edited = (chunk > 0) != (row_labels[start:stop, None] == col_labels[None, :])
+        obj_val = obj_val + np.abs(chunk[is_edited]).sum()
+    return obj_val
+
+def get_submatrix(weights, rows, cols, default_weight = 0.0):
+    """Returns the dense weights of a subproblem.
+    
+    Args:
+        weights (numpy.array or scipy.sparse matrix): The overall problem instance. May be memory-mapped.
+        rows (numpy.array): The rows of the subproblem.
+        cols (numpy.array): The columns of the subproblem.
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+    
+    Returns:
+        numpy.array: The weights of the subproblem.
+    """
+    if not sp.issparse(weights):
+        return np.asarray(weights[np.ix_(rows, cols)])
+    submatrix = sp.csr_matrix(weights)[rows][:, cols].tocoo()
+    submatrix.sum_duplicates()
+    dense_submatrix = np.full((len(rows), len(cols)), default_weight, dtype=np.result_type(weights.dtype, default_weight))
+    dense_submatrix[submatrix.row, submatrix.col] = submatrix.data
+    return dense_submatrix
+
+def build_adjacency_matrix(weights, chunk_size = 2 ** 24):
+    """Builds the sparse bi-adjacency matrix of the bipartite graph induced by the weights.
+    
+    Dense weights are scanned in chunks of rows, so that memory-mapped instances 
+    never have to be loaded into memory as a whole. For sparse weights, only the 
+    explicitly stored entries are considered, i.e., the default weight of the 
+    remaining cells must not be positive.
+    
+    Args:
+        weights (numpy.array or scipy.sparse matrix): The overall problem instance. May be memory-mapped.
+        chunk_size (int): Maximal number of cells that are processed at once.
+    
+    Returns:
+        scipy.sparse.csr_matrix: Boolean matrix of the same shape as weights 
+            whose entry (i,k) is True if and only if weights[i,k] > 0.
+    """
+    if sp.issparse(weights):
+        return sp.csr_matrix(sp.csr_matrix(weights) > 0)
+    chunks = [sp.csr_matrix(np.asarray(weights[start:stop]) > 0) for start, stop in row_chunks(weights.shape, chunk_size)]
+    if len(chunks) == 0:
+        return sp.csr_matrix(weights.shape, dtype=bool)
+    if len(chunks) == 1:
+        return chunks[0]
+    return sp.vstack(chunks, format="csr")
+
+def label_components(adjacency):
+    """Labels the connected components of the bipartite graph given by a bi-adjacency matrix.
+    
+    Args:
+        adjacency (scipy.sparse.csr_matrix): Bi-adjacency matrix as returned by build_adjacency_matrix().
+    
+    Returns:
+        numpy.array: Component labels 0, 1, ... of the rows.
+        numpy.array: Component labels 0, 1, ... of the columns.
+        numpy.array: Boolean array whose i-th entry is True if and only if the i-th component is a bi-clique.
+    """
+    num_rows, num_cols = adjacency.shape
+    if num_rows == 0 or num_cols == 0:
+        # Without rows or without columns, there are no edges, and each node is a bi-clique of its own.
+        return np.arange(num_rows), num_rows + np.arange(num_cols), np.ones(num_rows + num_cols, dtype=bool)
+    graph = sp.bmat([[None, adjacency], [adjacency.T, None]], format="csr")
+    num_components, labels = csgraph.connected_components(graph, directed=False)
+    row_labels = labels[:num_rows]
+    col_labels = labels[num_rows:]
+    
+    # Count rows, columns, and edges per component. Since edges never cross 
+    # components, an edge can be attributed to the component of its row.
+    num_rows_per_component = np.bincount(row_labels, minlength=num_components)
+    num_cols_per_component = np.bincount(col_labels, minlength=num_components)
+    edge_rows = np.repeat(np.arange(num_rows), np.diff(adjacency.indptr))
+    num_edges_per_component = np.bincount(row_labels[edge_rows], minlength=num_components)
+    is_bi_clique = num_edges_per_component == num_rows_per_component * num_cols_per_component
+    return row_labels, col_labels, is_bi_clique
+
+def group_by_labels(row_labels, col_labels, num_labels):
+    """Groups rows and columns by their labels.
+    
+    Args:
+        row_labels (numpy.array): Labels 0, 1, ..., num_labels - 1 of the rows.
+        col_labels (numpy.array): Labels 0, 1, ..., num_labels - 1 of the columns.
+        num_labels (int): The number of labels.
+    
+    Returns:
+        list of tuple of numpy.array: For each label, the sorted array of rows 
+            and the sorted array of columns with this label.
+    """
+    if num_labels == 0:
+        return []
+    num_rows_per_label = np.bincount(row_labels, minlength=num_labels)
+    num_cols_per_label = np.bincount(col_labels, minlength=num_labels)
+    rows_of_labels = np.split(np.argsort(row_labels, kind="stable"), np.cumsum(num_rows_per_label)[:-1])
+    cols_of_labels = np.split(np.argsort(col_labels, kind="stable"), np.cumsum(num_cols_per_label)[:-1])
+    return list(zip(rows_of_labels, cols_of_labels))
+
+def decompose(adjacency):
+    """Decomposes the bipartite graph given by a bi-adjacency matrix into connected components.
+    
+    Args:
+        adjacency (scipy.sparse.csr_matrix): Bi-adjacency matrix as returned by build_adjacency_matrix().
+    
+    Returns:
+        list of tuple of numpy.array: List of connected components. The first element of each 
+            component is the sorted array of its rows, the second the sorted array of its columns.
+        numpy.array: Boolean array whose i-th entry is True if and only if the i-th component is a bi-clique.
+    """
+    row_labels, col_labels, is_bi_clique = label_components(adjacency)
+    return group_by_labels(row_labels, col_labels, is_bi_clique.size), is_bi_clique
+
+def bi_clusters_to_labels(bi_clusters, num_rows, num_cols):
+    """Converts a list of bi-clusters into bi-cluster labels of the rows and columns.
+    
+    Rows and columns that are not covered by any bi-cluster receive labels of their own. 
+    If a row or column is contained in several bi-clusters, it receives the label of the last one.
+    
+    Args:
+        bi_clusters (list of tuple of list of int): List of bi-clusters. 
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        num_rows (int): The number of rows in the instance.
+        num_cols (int): The number of columns in the instance.
+    
+    Returns:
+        numpy.array: Bi-cluster labels of the rows.
+        numpy.array: Bi-cluster labels of the columns.
+        bool: True if and only if the bi-clusters are disjoint and cover all rows and columns.
+    """
+    num_bi_clusters = len(bi_clusters)
+    rows = np.concatenate([np.asarray(bi_cluster[0], dtype=int) for bi_cluster in bi_clusters] + [np.zeros(0, dtype=int)])
+    cols = np.concatenate([np.asarray(bi_cluster[1], dtype=int) for bi_cluster in bi_clusters] + [np.zeros(0, dtype=int)])
+    row_bi_clusters = np.repeat(np.arange(num_bi_clusters), [len(bi_cluster[0]) for bi_cluster in bi_clusters])
+    col_bi_clusters = np.repeat(np.arange(num_bi_clusters), [len(bi_cluster[1]) for bi_cluster in bi_clusters])
+    is_valid_row = (rows >= 0) & (rows < num_rows)
+    is_valid_col = (cols >= 0) & (cols < num_cols)
+    is_valid = bool(np.all(is_valid_row) and np.all(is_valid_col))
+    rows, row_bi_clusters = rows[is_valid_row], row_bi_clusters[is_valid_row]
+    cols, col_bi_clusters = cols[is_valid_col], col_bi_clusters[is_valid_col]
+    is_valid = is_valid and bool(np.all(np.bincount(rows, minlength=num_rows) == 1))
+    is_valid = is_valid and bool(np.all(np.bincount(cols, minlength=num_cols) == 1))
+    row_labels = num_bi_clusters + np.arange(num_rows)
+    row_labels[rows] = row_bi_clusters
+    col_labels = num_bi_clusters + num_rows + np.arange(num_cols)
+    col_labels[cols] = col_bi_clusters
+    return row_labels, col_labels, is_valid
+
 def connected_components(graph):
     """Decomposes graph into connected components.
     
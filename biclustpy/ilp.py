@@ -1,87 +1,201 @@
-import gurobipy as gp
-import networkx as nx
-from progress.bar import Bar
+import importlib
+import importlib.util
+import numpy as np
+import scipy.sparse as sp
 from . import helpers
+from .monitor import Monitor
 
-def run(weights, subgraph, time_limit, tune):
-    """Calls Gurobi to solve ILP formulation of the bi-cluster editing problem.
+backends = {"gurobi": ".ilp_gurobi", "highs": ".ilp_highs"}
+
+def register_backend(name, module_name):
+    """Registers a backend that solves the ILP formulation.
+    
+    The module is only imported when the backend is used for the first time. It has to provide 
+    a function solve() with the same signature and return values as ilp_gurobi.solve().
+    
+    Args:
+        name (string): Name of the backend.
+        module_name (string): Absolute name of the module, or name relative to the package biclustpy.
+    """
+    backends[name] = module_name
+
+def default_backend():
+    """Returns the backend that is used if no backend is specified.
+    
+    Returns:
+        string: \"gurobi\" if gurobipy can be imported and \"highs\" otherwise.
+    """
+    if importlib.util.find_spec("gurobipy") is not None:
+        return "gurobi"
+    return "highs"
+
+def get_backend(name):
+    """Imports a backend.
+    
+    Args:
+        name (string): Name of the backend.
+    
+    Returns:
+        module: The module of the backend.
+    """
+    if name not in backends:
+        raise Exception("Invalid ILP backend \"" + name + "\". Options: " + ", ".join("\"" + option + "\"" for option in backends) + ".")
+    try:
+        return importlib.import_module(backends[name], __package__)
+    except ImportError as error:
+        raise Exception("ILP backend \"" + name + "\" is not available: " + str(error))
+
+def find_violated_constraints(x_values, tolerance = 1e-6):
+    """Finds violated constraints x[i,k] - x[i,l] - x[j,k] - x[j,l] <= 0 that rule out induced P4s.
+    
+    For each pair (i,k), the most violated constraint is returned if it is violated by more than the tolerance.
+    
+    Args:
+        x_values (numpy.array): Integral or fractional values of the variables of a subproblem, 
+            where x_values[i,k] = 0 if and only if the edge (i,k) is contained in the solution.
+        tolerance (float): Violations smaller than or equal to the tolerance are ignored.
+    
+    Returns:
+        tuple of numpy.array: Arrays i, j, k, and l of local row and column indices of the violated constraints.
+    """
+    num_rows, num_cols = x_values.shape
+    all_rows = np.arange(num_rows)
+    all_cols = np.arange(num_cols)
+    violated = ([], [], [], [])
+    for k in range(num_cols):
+        # For each column l, find the row j that minimizes x[j,k] + x[j,l].
+        pair_sums = x_values + x_values[:, [k]]
+        best_j = pair_sums.argmin(axis=0)
+        # For each row i, find the column l that minimizes x[i,l] + x[j,k] + x[j,l].
+        path_sums = x_values + pair_sums[best_j, all_cols][None, :]
+        best_l = path_sums.argmin(axis=1)
+        violations = x_values[:, k] - path_sums[all_rows, best_l]
+        i = np.flatnonzero(violations > tolerance)
+        violated[0].append(i)
+        violated[1].append(best_j[best_l[i]])
+        violated[2].append(np.full(i.size, k))
+        violated[3].append(best_l[i])
+    return tuple(np.concatenate(indices) for indices in violated)
+
+def build_constraint_matrix(i, j, k, l, shape):
+    """Builds the coefficient matrix of constraints x[i,k] - x[i,l] - x[j,k] - x[j,l] <= 0.
+    
+    Args:
+        i (numpy.array): Local indices of the rows i.
+        j (numpy.array): Local indices of the rows j.
+        k (numpy.array): Local indices of the columns k.
+        l (numpy.array): Local indices of the columns l.
+        shape (tuple of int): Shape of the subproblem.
+    
+    Returns:
+        scipy.sparse.csr_matrix: Matrix with one row per constraint and one column 
+            per variable, where the variables are flattened in row-major order.
+    """
+    num_cols = shape[1]
+    constraint_ids = np.repeat(np.arange(i.size), 4)
+    variable_ids = np.stack([i * num_cols + k, i * num_cols + l, j * num_cols + k, j * num_cols + l], axis=1).ravel()
+    coefficients = np.tile([1.0, -1.0, -1.0, -1.0], i.size)
+    return sp.csr_matrix((coefficients, (constraint_ids, variable_ids)), shape=(i.size, shape[0] * num_cols))
+
+def run(weights, rows, cols, time_limit, tune, lazy = False, threads = 0, monitor = None, start_labels = None, incumbent_callback = None, backend = None, default_weight = 0.0, return_is_improved = False):
+    """Solves the ILP formulation of the bi-cluster editing problem with a MILP backend.
     
     Implements the ILP suggested in: 
     G. F. de Sousa Filho, T. L. B. Junior, L. dos Anjos F. Cabral, L. S. Ochi, and F. Protti:
     New heuristics for the bicluster editing problem. Annals OR 258(2), pp. 781-814, 2017,
     https://doi.org/10.1007/s10479-016-2261-x.
     
+    There is one binary variable x[i,k] per cell, which is 0 if and only if the edge (i,k) 
+    is contained in the solution, and the constraints x[i,k] - x[i,l] - x[j,k] - x[j,l] <= 0 
+    rule out induced P4s. The objective is the sum of w[i,k] * x[i,k], which differs from 
+    the cost of the solution by the sum of the negative weights.
+    
     Args:
-        weights (numpy.array): The overall problem instance.
-        subgraph (networkx.Graph): The subgraph that should be rendered bi-transitive.
+        weights (numpy.array or scipy.sparse matrix): The overall problem instance. 
+            If sparse, cells that are not stored explicitly have the default weight.
+        rows (numpy.array): The rows of the subproblem that should be rendered bi-transitive.
+        cols (numpy.array): The columns of the subproblem that should be rendered bi-transitive.
         time_limit (float): Time limit in seconds. If negative, no time limit is enforced.
-        tune (bool): If True, the model is tuned before optimization.
+        tune (bool): If True, the model is tuned before optimization if the backend supports it. Ignored if lazy is True.
+        lazy (bool): If True, the constraints are generated lazily. The model then only 
+            contains the constraints that are violated by the unedited subproblem, and 
+            further violated constraints are added by the backend.
+        threads (int): Number of threads used by the backend. If 0, the backend decides.
+        monitor (None or Monitor): Receives the events \"ilp_model_built\", \"ilp_tuned\", and \"ilp_solved\".
+        start_labels (None or tuple of numpy.array): Bi-cluster labels of the rows and columns of the subproblem. 
+            If not None, the induced solution is used as MIP start and its objective value as cutoff 
+            if the backend supports it. The returned solution is never worse than the start solution. 
+            Otherwise, the MIP start either deletes all edges or inserts all missing edges.
+        incumbent_callback (None or function): If not None, called with the bi-cluster labels of the rows and 
+            columns of the subproblem whenever the backend finds a new feasible incumbent.
+        backend (None or string): Name of the backend, see register_backend(). Options: \"gurobi\", \"highs\". 
+            If None, default_backend() is used.
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+        return_is_improved (bool): If True, a flag that indicates whether the solution improves on the start solution is returned as well.
     
     Returns:
-        networkx.Graph: The obtained bi-transitive graph.
+        numpy.array: Bi-cluster labels of the rows of the subproblem.
+        numpy.array: Bi-cluster labels of the columns of the subproblem.
         float: Objective value of obtained solution.
         bool: True if and only if obtained solution is guaranteed to be optimal.
+        bool: True if and only if start_labels is not None and the obtained solution is strictly better than the start solution. 
+            Only returned if return_is_improved is True.
     """
     
-    # Initialize Gurobi model.
-    print("Subproblem is solved with Gurobi ILP.")
-    model = gp.Model()
-    model.modelSense = gp.GRB.MINIMIZE
-    model.Params.OutputFlag = 0
-    if (time_limit <= 0):
-        model.Params.TimeLimit = gp.GRB.INFINITY
-        model.Params.TuneTimeLimit = gp.GRB.INFINITY
+    # Get the weights of the sub-problem and the start solution.
+    if monitor is None:
+        monitor = Monitor()
+    if backend is None:
+        backend = default_backend()
+    solver = get_backend(backend)
+    sub_weights = helpers.get_submatrix(weights, rows, cols, default_weight)
+    num_sub_rows, num_sub_cols = sub_weights.shape
+    cutoff = None
+    if start_labels is None:
+        start_value = 1.0
+        if 2 * np.count_nonzero(sub_weights > 0) >= sub_weights.size:
+            start_value = 0.0
+        start_values = np.full(sub_weights.shape, start_value)
     else:
-        model.Params.TimeLimit = time_limit
-        model.Params.TuneTimeLimit = time_limit
-    
-    # Get rows and columns of the sub-problem.
-    num_rows = weights.shape[0]
-    rows = [node for node in subgraph.nodes if helpers.is_row(node, num_rows)]
-    cols = [helpers.node_to_col(node, num_rows) for node in subgraph.nodes if helpers.is_col(node, num_rows)]
-    
-    # Add one binary decision variable x[(i,k)] for each possible edge (i,k) and set objective function.
-    x = {}
-    bar = Bar("Adding variables.  ", max = len(rows) * len(cols))
-    constant = 0
-    start = 1.0
-    if 2 * len(subgraph.edges) >= len(rows) * len(cols):
-        start = 0.0
-    for i in rows:
-        for k in cols:
-            x[(i,k)] = model.addVar(lb = 0.0, ub = 1.0, obj = weights[i,k], vtype = gp.GRB.BINARY)
-            x[(i,k)].setAttr(gp.GRB.Attr.Start, start)
-            if weights[i,k] <= 0:
-                constant = constant - weights[i,k]
-            bar.next()
-    bar.finish()
-    
-    # Add contsraints to rule out induced P4s in the solution.
-    bar = Bar("Adding constraints.", max = len(rows) * len(rows) * len(cols) * len(cols))
-    for i in rows:
-        for j in rows:
-            for k in cols:
-                for l in cols:
-                    model.addConstr(x[(i,k)] - x[(i,l)] - x[(j,k)] - x[(j,l)] <= 0)
-                    bar.next()
-    bar.finish()
-        
+        # The objective of the ILP differs from the cost of a solution by the sum of the negative weights.
+        start_row_labels, start_col_labels = start_labels
+        start_obj_val = helpers.compute_obj_val(sub_weights, start_row_labels, start_col_labels)
+        start_values = (start_row_labels[:, None] != start_col_labels[None, :]).astype(float)
+        cutoff = start_obj_val + np.minimum(sub_weights, 0).sum() + 1e-6 * max(1.0, abs(start_obj_val))
+    
+    # Collect the initial constraints that rule out induced P4s.
+    if lazy:
+        constraints = find_violated_constraints((sub_weights <= 0).astype(float))
+    else:
+        is_proper_row_pair = ~np.eye(num_sub_rows, dtype=bool)
+        is_proper_col_pair = ~np.eye(num_sub_cols, dtype=bool)
+        constraints = np.nonzero(is_proper_row_pair[:, :, None, None] & is_proper_col_pair[None, None, :, :])
+    
     # Solve the model.
-    model.update()
-    if tune:
-        print("Tuning the model ...")
-        model.tune()
-    print("Solving the model ...")
-    model.optimize()
-    
-    # Construct the bi-transitive subgraph from the solved model.
-    bi_transitive_subgraph = nx.Graph()
-    bi_transitive_subgraph.add_nodes_from(subgraph.nodes)
-    for (i,k) in x:
-        if x[(i,k)].getAttr(gp.GRB.Attr.X) == 0.0:
-            bi_transitive_subgraph.add_edge(i, helpers.col_to_node(k, num_rows))
+    solution_callback = None
+    if incumbent_callback is not None:
+        solution_callback = lambda x_values: incumbent_callback(*helpers.label_components(sp.csr_matrix(x_values < 0.5))[:2])
+    x_values, status, is_optimal, solve_time = solver.solve(sub_weights, constraints, start_values, cutoff, time_limit, tune, lazy, threads, monitor, solution_callback)
+    
+    # Extract the bi-cluster labels from the solution. Fall back to the start solution if the 
+    # backend did not find a better one, e.g., because it does not support MIP starts.
+    if start_labels is None:
+        start_row_labels, start_col_labels = helpers.label_components(sp.csr_matrix(start_values < 0.5))[:2]
+        start_obj_val = helpers.compute_obj_val(sub_weights, start_row_labels, start_col_labels)
+    row_labels, col_labels, obj_val = start_row_labels, start_col_labels, start_obj_val
+    if x_values is not None:
+        solution_row_labels, solution_col_labels = helpers.label_components(sp.csr_matrix(x_values < 0.5))[:2]
+        solution_obj_val = helpers.compute_obj_val(sub_weights, solution_row_labels, solution_col_labels)
+        if solution_obj_val <= start_obj_val:
+            row_labels, col_labels, obj_val = solution_row_labels, solution_col_labels, solution_obj_val
     
     # Return the solution.
-    obj_val = model.objVal + constant
-    is_optimal = (model.getAttr(gp.GRB.Attr.Status) == 2)
-    return bi_transitive_subgraph, obj_val, is_optimal
\ No newline at end of file
+    is_improved = False
+    start_data = {}
+    if start_labels is not None:
+        is_improved = bool(obj_val < start_obj_val - 1e-9 * max(1.0, abs(start_obj_val)))
+        start_data = {"start_obj_val": start_obj_val, "is_improved": is_improved}
+    monitor.event("ilp_solved", status = status, obj_val = obj_val, is_optimal = is_optimal, time = solve_time, **start_data)
+    if return_is_improved:
+        return row_labels, col_labels, obj_val, is_optimal, is_improved
+    return row_labels, col_labels, obj_val, is_optimal
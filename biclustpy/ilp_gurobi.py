@@ -0,0 +1,119 @@
+import gurobipy as gp
+import numpy as np
+import os
+import time
+from . import ilp
+
+environment = None
+environment_pid = None
+
+def get_environment():
+    """Returns the Gurobi environment that is shared by all models built in the current process.
+    
+    The environment is started on first use, with Gurobi's output turned off, and started
+    anew in forked worker processes.
+    
+    Returns:
+        gurobipy.Env: The shared environment.
+    """
+    global environment, environment_pid
+    if environment is None or environment_pid != os.getpid():
+        environment = gp.Env(empty = True)
+        environment.setParam("OutputFlag", 0)
+        environment.start()
+        environment_pid = os.getpid()
+    return environment
+
+def solve(sub_weights, constraints, start_values, cutoff, time_limit, tune, lazy, threads, monitor, solution_callback):
+    """Solves the ILP formulation of a subproblem with Gurobi.
+    
+    If lazy is True, violated constraints are added in a callback whenever Gurobi finds
+    a new incumbent or solves a node relaxation.
+    
+    Args:
+        sub_weights (numpy.array): The weights of the subproblem, i.e., the objective coefficients.
+        constraints (tuple of numpy.array): Arrays i, j, k, and l of the initial constraints
+            x[i,k] - x[i,l] - x[j,k] - x[j,l] <= 0.
+        start_values (numpy.array): Values of the variables of the MIP start.
+        cutoff (None or float): If not None, solutions whose objective value is not smaller are discarded.
+        time_limit (float): Time limit in seconds. If negative, no time limit is enforced.
+        tune (bool): If True, the model is tuned before optimization. Ignored if lazy is True.
+        lazy (bool): If True, further violated constraints are generated during the optimization.
+        threads (int): Number of threads. If 0, Gurobi decides.
+        monitor (Monitor): Receives the events \"ilp_model_built\" and \"ilp_tuned\".
+        solution_callback (None or function): If not None, called with the values of the variables
+            of each new feasible incumbent.
+    
+    Returns:
+        None or numpy.array: Values of the variables of the best solution or None if no solution was found.
+        int: Gurobi's status code.
+        bool: True if and only if the solution is guaranteed to be optimal.
+        float: Run time of the optimization in seconds.
+    """
+    
+    # Initialize Gurobi model.
+    build_start = time.perf_counter()
+    model = gp.Model(env = get_environment())
+    model.modelSense = gp.GRB.MINIMIZE
+    model.Params.OutputFlag = 0
+    if (time_limit <= 0):
+        model.Params.TimeLimit = gp.GRB.INFINITY
+        model.Params.TuneTimeLimit = gp.GRB.INFINITY
+    else:
+        model.Params.TimeLimit = time_limit
+        model.Params.TuneTimeLimit = time_limit
+    model.Params.Threads = threads
+    
+    # Add one binary decision variable x[i,k] for each possible edge (i,k) and set objective function.
+    x = model.addMVar(sub_weights.shape, vtype = gp.GRB.BINARY)
+    x.Obj = sub_weights
+    x.Start = start_values
+    if cutoff is not None:
+        model.Params.Cutoff = cutoff
+    
+    # Add contsraints to rule out induced P4s in the solution.
+    x_vars = None
+    if lazy:
+        x_vars = x.tolist()
+    def add_violated_constraints(add, x_values):
+        violated = ilp.find_violated_constraints(np.reshape(x_values, sub_weights.shape))
+        for i, j, k, l in zip(*violated):
+            add(x_vars[i][k] - x_vars[i][l] - x_vars[j][k] - x_vars[j][l] <= 0)
+        return violated[0].size
+    def callback(model, where):
+        if where == gp.GRB.Callback.MIPSOL:
+            x_values = model.cbGetSolution(x)
+            num_violated = 0
+            if lazy:
+                num_violated = add_violated_constraints(model.cbLazy, x_values)
+            if solution_callback is not None and num_violated == 0:
+                solution_callback(np.reshape(x_values, sub_weights.shape))
+        elif lazy and where == gp.GRB.Callback.MIPNODE and model.cbGet(gp.GRB.Callback.MIPNODE_STATUS) == gp.GRB.OPTIMAL:
+            add_violated_constraints(model.cbCut, model.cbGetNodeRel(x))
+    if lazy:
+        model.Params.LazyConstraints = 1
+        model.Params.PreCrush = 1
+    i, j, k, l = constraints
+    if i.size > 0:
+        coefficients = ilp.build_constraint_matrix(i, j, k, l, sub_weights.shape)
+        model.addMConstr(coefficients, x.reshape(-1), gp.GRB.LESS_EQUAL, np.zeros(i.size))
+    
+    # Solve the model.
+    model.update()
+    monitor.event("ilp_model_built", num_variables = model.NumVars, num_constraints = model.NumConstrs, time = time.perf_counter() - build_start)
+    if tune and not lazy:
+        tune_start = time.perf_counter()
+        model.tune()
+        monitor.event("ilp_tuned", time = time.perf_counter() - tune_start)
+    solve_start = time.perf_counter()
+    if lazy or solution_callback is not None:
+        model.optimize(callback)
+    else:
+        model.optimize()
+    solve_time = time.perf_counter() - solve_start
+    
+    # Return the solution.
+    x_values = None
+    if model.SolCount > 0:
+        x_values = x.X
+    return x_values, model.Status, model.Status == gp.GRB.OPTIMAL, solve_time
@@ -0,0 +1,70 @@
+import numpy as np
+import scipy.optimize as opt
+import time
+from . import ilp
+
+def solve(sub_weights, constraints, start_values, cutoff, time_limit, tune, lazy, threads, monitor, solution_callback):
+    """Solves the ILP formulation of a subproblem with the HiGHS solver bundled with SciPy.
+    
+    HiGHS is called via scipy.optimize.milp(), which supports neither MIP starts, cutoffs,
+    callbacks, tuning, nor a number of threads. These arguments are hence ignored, and the
+    caller falls back to the start solution if HiGHS does not find a better one. If lazy is
+    True, the constraints are generated in rounds: the model is solved, the constraints
+    violated by the solution are added, and the model is solved again until the solution
+    is feasible or the time limit is reached.
+    
+    Args:
+        sub_weights (numpy.array): The weights of the subproblem, i.e., the objective coefficients.
+        constraints (tuple of numpy.array): Arrays i, j, k, and l of the initial constraints
+            x[i,k] - x[i,l] - x[j,k] - x[j,l] <= 0.
+        start_values (numpy.array): Values of the variables of the MIP start. Ignored.
+        cutoff (None or float): Objective value of the start solution. Ignored.
+        time_limit (float): Time limit in seconds for all rounds. If negative, no time limit is enforced.
+        tune (bool): Ignored.
+        lazy (bool): If True, further violated constraints are generated in rounds.
+        threads (int): Ignored.
+        monitor (Monitor): Receives the event \"ilp_model_built\".
+        solution_callback (None or function): If not None, called with the values of the variables
+            of the final solution if it is feasible.
+    
+    Returns:
+        None or numpy.array: Values of the variables of the best solution or None if no solution was found.
+        int: Status code of scipy.optimize.milp().
+        bool: True if and only if the solution is guaranteed to be optimal.
+        float: Run time of the optimization in seconds.
+    """
+    
+    # Build the model.
+    build_start = time.perf_counter()
+    objective = sub_weights.ravel()
+    integrality = np.ones(objective.size)
+    bounds = opt.Bounds(0, 1)
+    i, j, k, l = constraints
+    monitor.event("ilp_model_built", num_variables = objective.size, num_constraints = i.size, time = time.perf_counter() - build_start)
+    
+    # Solve the model and add violated constraints until the solution is feasible.
+    solve_start = time.perf_counter()
+    while True:
+        options = {"disp": False}
+        if time_limit > 0:
+            options["time_limit"] = max(0.0, time_limit - (time.perf_counter() - solve_start))
+        linear_constraints = []
+        if i.size > 0:
+            linear_constraints = [opt.LinearConstraint(ilp.build_constraint_matrix(i, j, k, l, sub_weights.shape), -np.inf, 0.0)]
+        result = opt.milp(objective, integrality = integrality, bounds = bounds, constraints = linear_constraints, options = options)
+        if result.x is None:
+            return None, result.status, False, time.perf_counter() - solve_start
+        x_values = np.reshape(np.round(result.x), sub_weights.shape)
+        violated = ([],)
+        if lazy:
+            violated = ilp.find_violated_constraints(x_values)
+        if len(violated[0]) == 0:
+            break
+        if result.status != 0:
+            return x_values, result.status, False, time.perf_counter() - solve_start
+        i, j, k, l = (np.concatenate([old, new]) for old, new in zip((i, j, k, l), violated))
+    
+    # Return the solution.
+    if solution_callback is not None:
+        solution_callback(x_values)
+    return x_values, result.status, result.status == 0, time.perf_counter() - solve_start
@@ -1,6 +1,19 @@
 from . import helpers
 from . import ilp
 from . import ch
+from . import grasp
+from . import reduction
+from . import bounds
+from .monitor import Monitor, RecordingMonitor
+import concurrent.futures
+import contextlib
+import copy
+import json
+import numpy as np
+import os
+import scipy.sparse as sp
+import time
+import xml.etree.ElementTree as ET
 
 class Algorithm:
     
@@ -8,36 +21,91 @@ class Algorithm:
     
     Attributes:
         algorithm_name (string): Name of selected algorithm. 
-            Options: \"ILP\", \"CH\". 
+            Options: \"ILP\", \"CH\", \"GRASP\", \"AUTO\". 
             Default: \"ILP\".
         ilp_time_limit (float): Time limit for algorithm \"ILP\" in seconds. 
             If <= 0, no time limit is enforced. 
             Default: 60.
         ilp_tune (bool): If True, the model generated by \"ILP\" is tuned before being optimized. 
             Default: False.
+        ilp_lazy (bool): If True, \"ILP\" generates the constraints lazily. 
+            Default: False.
+        ilp_warm_start (bool): If True, \"ILP\" runs \"CH\" first and uses its solution as MIP start and 
+            its objective value as cutoff, unless a start solution is supplied. 
+            Default: False.
+        ilp_threads (int): Number of threads used by the backend of \"ILP\". If 0, the backend decides. 
+            Default: 0.
+        ilp_backend (string): Name of the MILP backend used by \"ILP\", see ilp.register_backend(). 
+            Options: \"gurobi\", \"highs\". 
+            Default: \"gurobi\" if gurobipy is installed and \"highs\" otherwise, see ilp.default_backend().
+        reduce (bool): If True, each subproblem is shrunk by data reduction rules 
+            before being passed to the selected algorithm. 
+            Default: False.
+        bound (bool): If True, a lower bound is computed for each subproblem with bounds.compute_lower_bound(). 
+            Solutions that match the bound are marked as optimal, and \"ILP\" is skipped if the 
+            solution of \"CH\" or the start solution matches the bound. 
+            Default: False.
         ch_alpha (float): Between 0 and 1. If smaller than 1, the algorithm behaves non-deterministically.
             Default: 1.0.
         ch_seed (None or int): Seed for random generation. 
             Default: None.
+        grasp_num_starts (int): Maximal number of starts of \"GRASP\". 
+            Default: 10.
+        grasp_alpha (float): Between 0 and 1. Parameter of the randomized construction used by \"GRASP\". 
+            Default: 0.8.
+        grasp_time_limit (float): Time limit for algorithm \"GRASP\" in seconds. 
+            If <= 0, no time limit is enforced. 
+            Default: 60.
+        grasp_seed (None or int): Seed for random generation. 
+            Default: None.
+        grasp_num_workers (int): Number of worker processes that run the starts of \"GRASP\" in parallel. 
+            Default: 1.
+        auto_time_budget (float): Wall-clock time budget in seconds of \"AUTO\" for the overall computation. 
+            Default: 600.
+        auto_max_ilp_size (int): Maximal number of cells of the subproblems that \"AUTO\" solves with \"ILP\". 
+            Larger subproblems are solved with \"GRASP\". 
+            Default: 400.
     """
     
     def __init__(self):
         self.algorithm_name = "ILP"
         self.ilp_time_limit = 60
         self.ilp_tune = False
+        self.ilp_lazy = False
+        self.ilp_warm_start = False
+        self.ilp_threads = 0
+        self.ilp_backend = ilp.default_backend()
+        self.reduce = False
+        self.bound = False
         self.ch_alpha = 1.0
         self.ch_seed = None
+        self.grasp_num_starts = 10
+        self.grasp_alpha = 0.8
+        self.grasp_time_limit = 60
+        self.grasp_seed = None
+        self.grasp_num_workers = 1
+        self.auto_time_budget = 600
+        self.auto_max_ilp_size = 400
     
-    def use_ilp(self, time_limit = 60, tune = False):
+    def use_ilp(self, time_limit = 60, tune = False, lazy = False, warm_start = False, backend = None):
         """Use the algorithm \"ILP\".
             
         Args:
             time_limit (float): Time limit for algorithm \"ILP\" in seconds. If <= 0, no time limit is enforced.
             tune (bool): If True, the model generated by \"ILP\" is tuned before being optimized.
+            lazy (bool): If True, the constraints of the model generated by \"ILP\" are generated lazily.
+            warm_start (bool): If True, the solution of \"CH\" is used as MIP start and cutoff.
+            backend (None or string): Name of the MILP backend. Options: \"gurobi\", \"highs\". 
+                If None, \"gurobi\" is used if gurobipy is installed and \"highs\" otherwise.
         """
         self.algorithm_name = "ILP"
         self.ilp_time_limit = time_limit
         self.ilp_tune = tune
+        self.ilp_lazy = lazy
+        self.ilp_warm_start = warm_start
+        if backend is None:
+            backend = ilp.default_backend()
+        self.ilp_backend = backend
     
     def use_ch(self, alpha = 1.0, seed = None):
         """Use the algorithm \"CH\".
@@ -45,28 +113,301 @@ class Algorithm:
         self.algorithm_name = "CH"
         self.ch_alpha = alpha
         self.ch_seed = seed
+    
+    def use_grasp(self, num_starts = 10, alpha = 0.8, time_limit = 60, seed = None, num_workers = 1):
+        """Use the algorithm \"GRASP\".
+        
+        Each start of \"GRASP\" builds a randomized solution with the construction phase of 
+        \"CH\" and improves it via local search. The best solution is returned.
+        
+        Args:
+            num_starts (int): Maximal number of starts. Must be at least 1.
+            alpha (float): Between 0 and 1. Parameter of the randomized construction.
+            time_limit (float): Time limit in seconds. If <= 0, no time limit is enforced.
+            seed (None or int): Seed for random generation.
+            num_workers (int): Number of worker processes that run the starts in parallel.
+        """
+        if num_starts < 1:
+            raise Exception("Number of starts of GRASP should be at least 1 but is " + str(num_starts) + ".")
+        self.algorithm_name = "GRASP"
+        self.grasp_num_starts = num_starts
+        self.grasp_alpha = alpha
+        self.grasp_time_limit = time_limit
+        self.grasp_seed = seed
+        self.grasp_num_workers = num_workers
+    
+    def use_auto(self, time_budget = 600, max_ilp_size = 400):
+        """Use the algorithm \"AUTO\".
+        
+        \"AUTO\" solves the subproblems in increasing order of their sizes within a global 
+        wall-clock time budget. Each subproblem receives a share of the remaining time that 
+        is proportional to its size, such that time that is not used by small subproblems is 
+        redistributed to the larger ones. Subproblems with at most max_ilp_size cells are solved 
+        with \"ILP\", larger ones with \"GRASP\", and all subproblems that are encountered after 
+        the time budget has been used up with \"CH\". \"ILP\" is always warm-started with the 
+        solution of \"CH\". The remaining options of these algorithms are taken from the 
+        corresponding attributes.
+        
+        Args:
+            time_budget (float): Wall-clock time budget in seconds for the overall computation.
+            max_ilp_size (int): Maximal number of cells of the subproblems that are solved with \"ILP\".
+        """
+        self.algorithm_name = "AUTO"
+        self.auto_time_budget = time_budget
+        self.auto_max_ilp_size = max_ilp_size
+    
+    def select(self, num_rows, num_cols, time_limit):
+        """Selects the algorithm that \"AUTO\" uses for a subproblem.
+        
+        Args:
+            num_rows (int): Number of rows of the subproblem.
+            num_cols (int): Number of columns of the subproblem.
+            time_limit (float): Time in seconds that is available for the subproblem.
+        
+        Returns:
+            Algorithm: A copy of the algorithm that uses \"ILP\", \"GRASP\", or \"CH\".
+        """
+        selected_algorithm = copy.copy(self)
+        if time_limit <= 0:
+            selected_algorithm.use_ch(self.ch_alpha, self.ch_seed)
+        elif num_rows * num_cols <= self.auto_max_ilp_size:
+            # Warm-start from CH, so that a small share of the time budget never yields a worse solution than CH.
+            selected_algorithm.use_ilp(time_limit, self.ilp_tune, self.ilp_lazy, True, self.ilp_backend)
+        else:
+            selected_algorithm.use_grasp(self.grasp_num_starts, self.grasp_alpha, time_limit, self.grasp_seed, self.grasp_num_workers)
+        return selected_algorithm
+    
+    def settings(self):
+        """Returns the settings that affect the solution of the selected algorithm.
+    
+        Settings of algorithms that are not used are omitted, and so are the number of threads
+        of \"ILP\" and the number of workers of \"GRASP\", which only affect the running time.
+        For \"AUTO\", the time limits of \"ILP\" and \"GRASP\" are replaced by the shares of the
+        time budget and are hence omitted as well.
+    
+        Returns:
+            list of tuple: Sorted pairs of names and values of the settings.
+        """
+        names = ["algorithm_name", "reduce", "bound"]
+        if self.algorithm_name == "ILP":
+            names = names + ["ilp_time_limit", "ilp_tune", "ilp_lazy", "ilp_warm_start", "ilp_backend"]
+            if self.ilp_warm_start or self.bound:
+                names = names + ["ch_alpha", "ch_seed"]
+        elif self.algorithm_name == "CH":
+            names = names + ["ch_alpha", "ch_seed"]
+        elif self.algorithm_name == "GRASP":
+            names = names + ["grasp_num_starts", "grasp_alpha", "grasp_time_limit", "grasp_seed"]
+        elif self.algorithm_name == "AUTO":
+            names = names + ["auto_time_budget", "auto_max_ilp_size", "ilp_tune", "ilp_lazy", "ilp_backend",
+                             "ch_alpha", "ch_seed", "grasp_num_starts", "grasp_alpha", "grasp_seed"]
+        return sorted((name, getattr(self, name)) for name in names)
             
-    def run(self, weights, subgraph):
-        """Runs the selected algorithm on a given subgraph.
+    def run(self, weights, rows, cols, monitor = None, start_labels = None, as_graph = False, incumbent_callback = None, default_weight = 0.0, return_is_improved = False):
+        """Runs the selected algorithm on a given subproblem.
+        
+        The algorithms return one bi-cluster label per row and column, so that the size of the 
+        result is linear in the size of the subproblem. The bi-transitive NetworkX graph, whose 
+        size is quadratic in the sizes of the bi-clusters, is only built if as_graph is True.
         
         Args:
-            weights (numpy.array): The overall problem instance.
-            subgraph (networkx.Graph): The subgraph of the instance that should be rendered bi-transitive.
+            weights (numpy.array or scipy.sparse matrix): The overall problem instance. 
+                If sparse, cells that are not stored explicitly have the default weight.
+            rows (numpy.array): The rows of the subproblem that should be rendered bi-transitive.
+            cols (numpy.array): The columns of the subproblem that should be rendered bi-transitive.
+            monitor (None or Monitor): Receives the events of the selected algorithm.
+            start_labels (None or tuple of numpy.array): Bi-cluster labels of the rows and columns of 
+                a start solution of the subproblem. Only used by \"ILP\".
+            as_graph (bool): If True, the bi-transitive subgraph is returned instead of the labels.
+            incumbent_callback (None or function): Called with the bi-cluster labels of the rows and columns of 
+                each new incumbent of the subproblem. Only used by \"ILP\".
+            default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+            return_is_improved (bool): If True, a flag that indicates whether the solution improves on the start solution is returned as well.
         
         Returns:
-            networkx.Graph: The obtained bi-transitive subgraph.
+            numpy.array: Bi-cluster labels of the rows of the subproblem. Omitted if as_graph is True.
+            numpy.array: Bi-cluster labels of the columns of the subproblem. Omitted if as_graph is True.
+            networkx.Graph: The obtained bi-transitive subgraph. Only returned if as_graph is True.
             float: Objective value of obtained solution.
             bool: True if and only if obtained solution is guaranteed to be optimal.
+            bool: True if and only if \"ILP\" was given start labels and found a strictly better solution. 
+                Only returned if return_is_improved is True.
         """
         if self.algorithm_name == "ILP":
-            return ilp.run(weights, subgraph, self.ilp_time_limit, self.ilp_tune)
+            if start_labels is None and self.ilp_warm_start:
+                start_labels = ch.construct(helpers.get_submatrix(weights, rows, cols, default_weight), self.ch_alpha, np.random.default_rng(self.ch_seed))
+            result = ilp.run(weights, rows, cols, self.ilp_time_limit, self.ilp_tune, self.ilp_lazy, self.ilp_threads, monitor, start_labels, incumbent_callback, 
+                             self.ilp_backend, default_weight, return_is_improved = True)
         elif self.algorithm_name == "CH":
-            return ch.run(weights, subgraph, self.ch_alpha, self.ch_seed)
+            result = ch.run(weights, rows, cols, self.ch_alpha, self.ch_seed, monitor, default_weight) + (False,)
+        elif self.algorithm_name == "GRASP":
+            result = grasp.run(weights, rows, cols, self.grasp_num_starts, self.grasp_alpha, self.grasp_time_limit, self.grasp_seed, self.grasp_num_workers, monitor, default_weight) + (False,)
+        elif self.algorithm_name == "AUTO":
+            result = self.select(len(rows), len(cols), self.auto_time_budget).run(weights, rows, cols, monitor, start_labels, incumbent_callback = incumbent_callback, 
+                                                                                  default_weight = default_weight, return_is_improved = True)
         else:
-            raise Exception("Invalid algorithm name \"" + self.algorithm_name + "\". Options: \"ILP\", \"CH\".")
+            raise Exception("Invalid algorithm name \"" + self.algorithm_name + "\". Options: \"ILP\", \"CH\", \"GRASP\", \"AUTO\".")
+        if as_graph:
+            row_labels, col_labels, obj_val, is_optimal, is_improved = result
+            result = helpers.build_graph_from_labels(rows, cols, row_labels, col_labels, weights.shape[0]), obj_val, is_optimal, is_improved
+        if return_is_improved:
+            return result
+        return result[:-1]
     
     
-def compute_bi_clusters(weights, algorithm):
+def solve_subproblem(algorithm, weights, monitor = None, start_labels = None, checkpoint = None, incumbent_keys = None):
+    """Solves a subproblem and groups its rows and columns into bi-clusters by their labels.
+    
+    If algorithm.reduce is True, the subproblem is first shrunk with reduction.reduce(). 
+    The reduced subproblem is then decomposed into connected components, which are 
+    solved recursively, and the obtained bi-clusters are expanded to the original rows and columns.
+    
+    Args:
+        algorithm (Algorithm): The algorithm that should be used.
+        weights (numpy.array): The weights of the subproblem.
+        monitor (None or Monitor): Receives the events \"subproblem_reduced\", \"lower_bound_computed\", and 
+            \"ilp_skipped\" and the events of the algorithm.
+        start_labels (None or tuple of numpy.array): Bi-cluster labels of the rows and columns of a 
+            start solution. If the subproblem is reduced, each super-node takes the label of one of its members.
+        checkpoint (None or Checkpoint): If not None and the algorithm is \"ILP\", the incumbents of the 
+            ILP are stored in the checkpoint, and a stored incumbent is used as start solution if 
+            start_labels is None.
+        incumbent_keys (None or list of string): If not None, the keys of the incumbents stored in the 
+            checkpoint are appended, so that the caller can remove them once the solution is stored.
+    
+    Returns:
+        list of tuple of list of int: List of bi-clusters of the subproblem. Rows and 
+            columns are given as indices into weights.
+        float: Objective value of the obtained solution.
+        bool: True if and only if the obtained solution is guaranteed to be optimal.
+        float: Lower bound on the optimal objective value. Equals the objective value if the 
+            solution is optimal and is 0 if algorithm.bound is False and the solution is not optimal.
+        bool: True if and only if the ILP improved on the start solution of the subproblem or, if 
+            the subproblem is reduced, of one of its components.
+    """
+    if monitor is None:
+        monitor = Monitor()
+    num_rows, num_cols = weights.shape
+    if algorithm.reduce:
+        reduction_start = time.perf_counter()
+        reduced_weights, row_groups, col_groups, offset = reduction.reduce(weights)
+        if reduced_weights.shape != weights.shape:
+            monitor.event("subproblem_reduced", num_rows = num_rows, num_cols = num_cols, num_reduced_rows = reduced_weights.shape[0], 
+                          num_reduced_cols = reduced_weights.shape[1], time = time.perf_counter() - reduction_start)
+            if start_labels is not None:
+                reduced_row_labels = np.empty(reduced_weights.shape[0], dtype=start_labels[0].dtype)
+                reduced_row_labels[row_groups] = start_labels[0]
+                reduced_col_labels = np.empty(reduced_weights.shape[1], dtype=start_labels[1].dtype)
+                reduced_col_labels[col_groups] = start_labels[1]
+            bi_clusters = []
+            obj_val = offset
+            is_optimal = True
+            lower_bound = offset
+            is_improved = False
+            components, is_bi_clique = helpers.decompose(helpers.build_adjacency_matrix(reduced_weights))
+            for (rows, cols), bi_clique in zip(components, is_bi_clique):
+                if bi_clique:
+                    bi_clusters.append((rows.tolist(), cols.tolist()))
+                    continue
+                local_start_labels = None
+                if start_labels is not None:
+                    local_start_labels = (reduced_row_labels[rows], reduced_col_labels[cols])
+                local_bi_clusters, local_obj_val, local_is_optimal, local_lower_bound, local_is_improved = solve_subproblem(algorithm, reduced_weights[np.ix_(rows, cols)], monitor, 
+                                                                                                                            local_start_labels, checkpoint, incumbent_keys)
+                obj_val = obj_val + local_obj_val
+                is_optimal = is_optimal and local_is_optimal
+                lower_bound = lower_bound + local_lower_bound
+                is_improved = is_improved or local_is_improved
+                for local_rows, local_cols in local_bi_clusters:
+                    bi_clusters.append((rows[local_rows].tolist(), cols[local_cols].tolist()))
+            return reduction.expand(bi_clusters, row_groups, col_groups), obj_val, is_optimal, lower_bound, is_improved
+    incumbent_callback = None
+    if checkpoint is not None and algorithm.algorithm_name == "ILP":
+        # Resume from the last incumbent of an interrupted solve and store the new incumbents.
+        incumbent_key = checkpoint.key(weights, None)
+        if start_labels is None:
+            start_labels = checkpoint.get_incumbent(incumbent_key)
+        incumbent_callback = lambda row_labels, col_labels: checkpoint.put_incumbent(incumbent_key, row_labels, col_labels)
+        if incumbent_keys is not None:
+            incumbent_keys.append(incumbent_key)
+    lower_bound = 0.0
+    result = None
+    if algorithm.bound:
+        bound_start = time.perf_counter()
+        lower_bound = bounds.compute_lower_bound(weights)
+        monitor.event("lower_bound_computed", lower_bound = lower_bound, time = time.perf_counter() - bound_start)
+        if algorithm.algorithm_name == "ILP":
+            # Skip the ILP if the start solution or the solution of CH matches the lower bound.
+            heuristic_labels = start_labels
+            if heuristic_labels is None:
+                heuristic_labels = ch.construct(weights, algorithm.ch_alpha, np.random.default_rng(algorithm.ch_seed))
+                if algorithm.ilp_warm_start:
+                    start_labels = heuristic_labels
+            heuristic_obj_val = helpers.compute_obj_val(weights, heuristic_labels[0], heuristic_labels[1])
+            if heuristic_obj_val <= lower_bound + 1e-9 * max(1.0, abs(lower_bound)):
+                monitor.event("ilp_skipped", obj_val = heuristic_obj_val, lower_bound = lower_bound)
+                result = heuristic_labels[0], heuristic_labels[1], heuristic_obj_val, True, False
+    if result is None:
+        result = algorithm.run(weights, np.arange(num_rows), np.arange(num_cols), monitor, start_labels, incumbent_callback = incumbent_callback, return_is_improved = True)
+    row_labels, col_labels, obj_val, is_optimal, is_improved = result
+    if incumbent_callback is not None:
+        incumbent_callback(row_labels, col_labels)
+    if algorithm.bound and obj_val <= lower_bound + 1e-9 * max(1.0, abs(lower_bound)):
+        is_optimal = True
+    if is_optimal:
+        lower_bound = obj_val
+    labels = np.unique(np.concatenate([row_labels, col_labels]), return_inverse=True)[1].ravel()
+    groups = helpers.group_by_labels(labels[:num_rows], labels[num_rows:], labels.max() + 1 if labels.size > 0 else 0)
+    bi_clusters = [(rows.tolist(), cols.tolist()) for rows, cols in groups]
+    return bi_clusters, obj_val, is_optimal, lower_bound, is_improved
+
+def solve_subproblem_recorded(algorithm, weights, start_labels = None, checkpoint = None):
+    """Solves a subproblem in a worker process and records the emitted events.
+    
+    Args:
+        algorithm (Algorithm): The algorithm that should be used.
+        weights (numpy.array): The weights of the subproblem.
+        start_labels (None or tuple of numpy.array): Bi-cluster labels of the rows and columns of a start solution.
+        checkpoint (None or Checkpoint): Checkpoint that stores the incumbents of the ILP.
+    
+    Returns:
+        tuple: The return values of solve_subproblem().
+        RecordingMonitor: The recorded events.
+        float: Run time in seconds.
+        list of string: The keys of the incumbents stored in the checkpoint.
+    """
+    start = time.perf_counter()
+    monitor = RecordingMonitor()
+    incumbent_keys = []
+    result = solve_subproblem(algorithm, weights, monitor, start_labels, checkpoint, incumbent_keys)
+    return result, monitor, time.perf_counter() - start, incumbent_keys
+
+def split_threads(sizes, num_threads):
+    """Splits threads among concurrently solved subproblems.
+    
+    Each subproblem receives a share of the threads that is proportional to the 
+    squared number of its cells, i.e., to the number of constraints of its ILP formulation.
+    Every subproblem receives at least one thread. The shares sum up to num_threads 
+    unless there are more subproblems than threads.
+    
+    Args:
+        sizes (list of int): Number of cells of the subproblems.
+        num_threads (int): Total number of available threads.
+    
+    Returns:
+        list of int: Number of threads for each subproblem.
+    """
+    costs = np.asarray(sizes, dtype=float) ** 2
+    num_extra_threads = max(num_threads - costs.size, 0)
+    if costs.size == 0 or num_extra_threads == 0 or costs.sum() == 0:
+        return [1 for size in sizes]
+    # Round the shares of the extra threads down and hand out the rest by largest remainder.
+    targets = num_extra_threads * costs / costs.sum()
+    shares = np.floor(targets).astype(int)
+    shares[np.argsort(shares - targets, kind="stable")[:num_extra_threads - shares.sum()]] += 1
+    return (shares + 1).tolist()
+
+def compute_bi_clusters(weights, algorithm, num_workers = 1, default_weight = 0.0, monitor = None, start_bi_clusters = None, cache = None, checkpoint = None, return_lower_bound = False, coordinator = None, 
+                        return_is_improved = False):
     """Computes bi-clusters using bi-cluster editing.
     
     Given a matrix W = (w[i][k]) of weights of dimension n x m with positive and negative 
@@ -82,20 +423,65 @@ def compute_bi_clusters(weights, algorithm):
     user-specified algorithm to solve the remaining subproblems.
     
     Args:
-        weights (numpy.array): The problem instance.
+        weights (numpy.array or scipy.sparse matrix): The problem instance. May be memory-mapped, in which case 
+            only the weights of one connected component at a time are loaded into memory. 
+            If sparse, cells that are not stored explicitly have the default weight.
         algorithm (Algorithm): The subgraph that should be rendered bi-transitive.
+        num_workers (int): Number of worker processes used to solve the subproblems. 
+            If larger than 1, the subproblems are solved in a process pool, largest first. 
+            If the algorithm is \"ILP\" and its number of threads is 0, the threads that are 
+            not used by the subproblems in flight are split among the subproblems that are 
+            scheduled next. If the algorithm 
+            is \"AUTO\", the subproblems are solved smallest first, and each subproblem receives 
+            its share of the time budget once a worker process becomes available.
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse. 
+            Must not be positive.
+        monitor (None or Monitor): Receives structured events about the phases and subproblems, 
+            see Monitor. If None, no events are reported.
+        start_bi_clusters (None or list of tuple of list of int): Bi-clusters of a start solution, e.g., 
+            computed by \"CH\" or in a previous run. If not None, \"ILP\" uses the start solution 
+            restricted to each subproblem as MIP start and cutoff. Rows and columns that are not 
+            covered by any bi-cluster are treated as singletons.
+        cache (None or Cache): If not None, subproblems whose weights and algorithm settings match 
+            an entry of the cache are not solved again, and the solutions of all other 
+            subproblems are stored in the cache.
+        checkpoint (None or Checkpoint): If not None, the solution of each subproblem is stored in the 
+            checkpoint as soon as it is solved, and subproblems whose solutions are already stored, 
+            e.g., by an interrupted run on the same instance with the same settings, are not solved again. 
+            The ILP also stores its incumbents and resumes from them.
+        return_lower_bound (bool): If True, a lower bound on the optimal objective value is returned as well. 
+            The bound is the sum of the lower bounds of the subproblems, see Algorithm.bound.
+        coordinator (None or distributed.Coordinator): If not None, the subproblems are solved by the workers 
+            connected to the coordinator instead of a local process pool, and num_workers is the number of 
+            subproblems in flight, which should match the overall number of workers. The number of threads 
+            of the ILP is not split, and the incumbents of the ILP are not stored in the checkpoint.
+        return_is_improved (bool): If True, a flag that indicates whether the ILP improved on the start solution is returned as well.
     
     Returns:
         list of tuple of list of int: List of computed bi-clusters. 
             The first element of each bi-cluster is the list of rows, the second the list of columns.
         float: Objective value of the obtained solution.
         bool: True if and only if the obtained solution is guaranteed to be optimal.
+        float: Lower bound on the optimal objective value. Only returned if return_lower_bound is True.
+        bool: True if and only if start_bi_clusters is not None and the ILP found a strictly better solution 
+            than the start solution for at least one subproblem. Subproblems loaded from the cache or the 
+            checkpoint count as not improved. Only returned if return_is_improved is True.
     """
     
-    # Get dimension of the problem instance and build NetworkX graph.
-    num_rows = weights.shape[0]
-    num_cols = weights.shape[1]
-    graph = helpers.build_graph_from_weights(weights, range(num_rows + num_cols))
+    # Build the sparse bi-adjacency matrix of the problem instance.
+    if monitor is None:
+        monitor = Monitor()
+    overall_start = time.perf_counter()
+    start = overall_start
+    if sp.issparse(weights):
+        if default_weight > 0:
+            raise Exception("Default weight of sparse instances must not be positive.")
+        weights = sp.csr_matrix(weights)
+    start_row_labels, start_col_labels = None, None
+    if start_bi_clusters is not None:
+        start_row_labels, start_col_labels = helpers.bi_clusters_to_labels(start_bi_clusters, weights.shape[0], weights.shape[1])[:2]
+    adjacency = helpers.build_adjacency_matrix(weights)
+    monitor.event("graph_built", num_rows = weights.shape[0], num_cols = weights.shape[1], num_edges = adjacency.nnz, time = time.perf_counter() - start)
     
     # Initialize the return variable.
     bi_clusters = []
@@ -103,78 +489,271 @@ def compute_bi_clusters(weights, algorithm):
     # Decompose graph into connected components and check if some 
     # of them are already bi-cliques. If so, put their rows and columns 
     # into bi-clusters. Otherwise, add the connected 
-    # component to the list of connected subgraphs that have to be 
+    # component to the list of subproblems that have to be 
     # rendered bi-transitive.
-    subgraphs = []
-    components = helpers.connected_components(graph)
-    for component in components:
-        if helpers.is_bi_clique(component, num_rows):
-            bi_cluster = ([], [])
-            for node in component.nodes:
-                if helpers.is_row(node, num_rows):
-                    bi_cluster[0].append(node)
-                else:
-                    bi_cluster[1].append(helpers.node_to_col(node, num_rows))
-            bi_clusters.append(bi_cluster)
+    start = time.perf_counter()
+    subproblems = []
+    components, is_bi_clique = helpers.decompose(adjacency)
+    for (rows, cols), bi_clique in zip(components, is_bi_clique):
+        if bi_clique:
+            bi_clusters.append((rows.tolist(), cols.tolist()))
         else:
-            subgraphs.append(component)
-            
-    # Print information about connected components.
-    print("\n==============================================================================")
-    print("Finished pre-processing.")
-    print("------------------------------------------------------------------------------")
-    print("Number of connected components: " + str(len(components)))
-    print("Number of bi-cliques: " + str(len(bi_clusters)))
-    print("==============================================================================")
+            subproblems.append((rows, cols))
+    monitor.event("decomposed", num_components = len(components), num_bi_cliques = len(bi_clusters), 
+                  num_subproblems = len(subproblems), time = time.perf_counter() - start)
     
     # Solve the subproblems and construct the final bi-clusters. 
     # Also compute the objective value and a flag that indicates whether the
     # obtained solution is guaranteed to be optimal.
+    start = time.perf_counter()
+    results = [None for subproblem in subproblems]
+    sizes = [len(rows) * len(cols) for rows, cols in subproblems]
+    order = list(range(len(subproblems)))
+    if algorithm.algorithm_name == "AUTO":
+        order = sorted(order, key = lambda c: sizes[c])
+        deadline = overall_start + algorithm.auto_time_budget
+    elif num_workers > 1 or coordinator is not None:
+        order = sorted(order, key = lambda c: sizes[c], reverse = True)
+    threads = [0 for subproblem in subproblems]
+    time_limits = [None for subproblem in subproblems]
+    def select_algorithm(c):
+        nonlocal remaining_size
+        rows, cols = subproblems[c]
+        local_algorithm = algorithm
+        if algorithm.algorithm_name == "AUTO":
+            # Assign a share of the remaining time that is proportional to the size of the subproblem.
+            time_limits[c] = (deadline - time.perf_counter()) * min(1.0, num_workers * sizes[c] / remaining_size)
+            remaining_size = remaining_size - sizes[c]
+            local_algorithm = algorithm.select(len(rows), len(cols), time_limits[c])
+        if num_workers > 1 and coordinator is None and local_algorithm.algorithm_name == "ILP" and local_algorithm.ilp_threads == 0:
+            local_algorithm = copy.copy(local_algorithm)
+            local_algorithm.ilp_threads = threads[c]
+        return local_algorithm
+    def get_start_labels(c):
+        if start_bi_clusters is None:
+            return None
+        rows, cols = subproblems[c]
+        return (start_row_labels[rows], start_col_labels[cols])
+    def report_started(c, local_algorithm):
+        rows, cols = subproblems[c]
+        monitor.event("subproblem_started", subproblem = c, num_subproblems = len(subproblems), num_rows = len(rows), num_cols = len(cols), 
+                      algorithm = local_algorithm.algorithm_name, time_limit = time_limits[c])
+    def report_finished(c, run_time, is_cached = False, is_resumed = False):
+        rows, cols = subproblems[c]
+        monitor.event("subproblem_finished", subproblem = c, num_subproblems = len(subproblems), num_rows = len(rows), num_cols = len(cols), 
+                      obj_val = results[c][1], is_optimal = results[c][2], lower_bound = results[c][3], is_cached = is_cached, 
+                      is_resumed = is_resumed, time = run_time)
+    
+    # Look up the subproblems in the checkpoint and in the cache.
+    keys = [None for subproblem in subproblems]
+    if cache is not None or checkpoint is not None:
+        keyed_store = checkpoint if cache is None else cache
+        for c, (rows, cols) in enumerate(subproblems):
+            lookup_start = time.perf_counter()
+            keys[c] = keyed_store.key(helpers.get_submatrix(weights, rows, cols, default_weight), algorithm)
+            if checkpoint is not None:
+                results[c] = checkpoint.get(keys[c])
+                if results[c] is not None:
+                    results[c] = results[c] + (False,)
+                    report_started(c, algorithm)
+                    report_finished(c, time.perf_counter() - lookup_start, is_resumed = True)
+                    continue
+            if cache is not None:
+                results[c] = cache.get(keys[c])
+                if results[c] is not None:
+                    results[c] = results[c] + (False,)
+                    report_started(c, algorithm)
+                    report_finished(c, time.perf_counter() - lookup_start, is_cached = True)
+        order = [c for c in order if results[c] is None]
+    remaining_size = sum(sizes[c] for c in order)
+    def store(c, incumbent_keys):
+        if cache is not None:
+            cache.put(keys[c], results[c][:4])
+        if checkpoint is not None:
+            checkpoint.put(keys[c], results[c][:4])
+            # The incumbents are obsolete once the solution of the subproblem is stored.
+            for incumbent_key in incumbent_keys:
+                checkpoint.remove_incumbent(incumbent_key)
+    
+    if num_workers > 1 or coordinator is not None:
+        with contextlib.ExitStack() as stack:
+            if coordinator is None:
+                executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(max_workers = num_workers))
+                submit = lambda local_algorithm, sub_weights, start_labels: executor.submit(solve_subproblem_recorded, local_algorithm, sub_weights, start_labels, checkpoint)
+            else:
+                submit = coordinator.submit
+            # Keep at most num_workers subproblems in flight, such that time budgets 
+            # are assigned once a worker becomes available.
+            futures = {}
+            local_algorithms = {}
+            pending = order[::-1]
+            while len(pending) > 0 or len(futures) > 0:
+                # Split the threads that are not used by the subproblems in flight among the subproblems scheduled next.
+                scheduled = pending[::-1][:max(num_workers, 1) - len(futures)]
+                num_busy_threads = sum(local_algorithms[c].ilp_threads if local_algorithms[c].algorithm_name == "ILP" else 1 for c in futures.values())
+                for c, num_threads in zip(scheduled, split_threads([sizes[c] for c in scheduled], os.cpu_count() - num_busy_threads)):
+                    threads[c] = num_threads
+                while len(pending) > 0 and len(futures) < max(num_workers, 1):
+                    c = pending.pop()
+                    rows, cols = subproblems[c]
+                    local_algorithms[c] = select_algorithm(c)
+                    futures[submit(local_algorithms[c], helpers.get_submatrix(weights, rows, cols, default_weight), get_start_labels(c))] = c
+                done, not_done = concurrent.futures.wait(futures, return_when = concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    c = futures.pop(future)
+                    results[c], recorded_monitor, run_time, incumbent_keys = future.result()
+                    store(c, incumbent_keys)
+                    report_started(c, local_algorithms[c])
+                    recorded_monitor.replay(monitor)
+                    report_finished(c, run_time)
+    else:
+        for c in order:
+            rows, cols = subproblems[c]
+            local_algorithm = select_algorithm(c)
+            report_started(c, local_algorithm)
+            subproblem_start = time.perf_counter()
+            incumbent_keys = []
+            results[c] = solve_subproblem(local_algorithm, helpers.get_submatrix(weights, rows, cols, default_weight), monitor, get_start_labels(c), checkpoint, incumbent_keys)
+            store(c, incumbent_keys)
+            report_finished(c, time.perf_counter() - subproblem_start)
+    monitor.event("solved", num_subproblems = len(subproblems), time = time.perf_counter() - start)
+    
+    # Merge the results in the order of the subproblems.
     obj_val = 0
     is_optimal = True 
-    counter = 0
-    for subgraph in subgraphs:
-        counter = counter + 1
-        print("\n==============================================================================")
-        print("Solving subproblem " + str(counter) + " of " + str(len(subgraphs)) + ".")
-        print("------------------------------------------------------------------------------")
-        n = len([node for node in subgraph.nodes if helpers.is_row(node, num_rows)])
-        m = len([node for node in subgraph.nodes if helpers.is_col(node, num_rows)])
-        print("Dimension: " + str(n) + " x " + str(m))
-        bi_transitive_subgraph, local_obj_val, local_is_optimal = algorithm.run(weights, subgraph)
+    lower_bound = 0.0
+    is_improved = False
+    for (rows, cols), (local_bi_clusters, local_obj_val, local_is_optimal, local_lower_bound, local_is_improved) in zip(subproblems, results):
         obj_val = obj_val + local_obj_val
         is_optimal = is_optimal and local_is_optimal
-        for component in helpers.connected_components(bi_transitive_subgraph):
-            if not helpers.is_bi_clique(component, num_rows):
-                msg = "Subgraph should be bi-clique but isn't."
-                msg = msg + "\nNodes: " + str(component.nodes)
-                msg = msg + "\nEdges: " + str(component.edges)
-                raise Exception(msg)
-            bi_cluster = ([], [])
-            for node in component.nodes:
-                if helpers.is_row(node, num_rows):
-                    bi_cluster[0].append(node)
-                else:
-                    bi_cluster[1].append(helpers.node_to_col(node, num_rows))
-            bi_clusters.append(bi_cluster)
-        print("==============================================================================")
-    
-    print("\n==============================================================================")
-    print("Finished computation of bi-clusters.")
-    print("------------------------------------------------------------------------------")
-    print("Objective value: " + str(obj_val))
-    print("Is optimal: " + str(is_optimal))
-    print("Number of bi-clusters: " + str(len(bi_clusters)))
-    print("==============================================================================")
+        lower_bound = lower_bound + local_lower_bound
+        is_improved = is_improved or local_is_improved
+        for local_rows, local_cols in local_bi_clusters:
+            bi_clusters.append((rows[local_rows].tolist(), cols[local_cols].tolist()))
     
+    # Check that the bi-clusters are disjoint and cover all rows and columns.
+    if not helpers.bi_clusters_to_labels(bi_clusters, weights.shape[0], weights.shape[1])[2]:
+        raise Exception("Bi-clusters should be disjoint and cover all rows and columns but don't.")
+    monitor.event("finished", obj_val = obj_val, is_optimal = is_optimal, lower_bound = lower_bound, num_bi_clusters = len(bi_clusters), 
+                  num_optimal_subproblems = sum(result[2] for result in results), time = time.perf_counter() - overall_start)
     
     # Return the obtained bi-transitive subgraph, the objective value of the obtained solution, 
     # and a flag that indicates if the solution is guaranteed to be optimal.
-    return bi_clusters, obj_val, is_optimal 
+    result = (bi_clusters, obj_val, is_optimal)
+    if return_lower_bound:
+        result = result + (lower_bound,)
+    if return_is_improved:
+        result = result + (is_improved,)
+    return result
+
+def compute_bi_clusters_recorded(weights, algorithm, default_weight, cache, checkpoint = None):
+    """Computes the bi-clusters of one instance of a batch in a worker process and records the emitted events.
+    
+    Args:
+        weights (numpy.array or scipy.sparse matrix): The problem instance.
+        algorithm (Algorithm): The algorithm that should be used.
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+        cache (None or Cache): The cache.
+        checkpoint (None or Checkpoint): The checkpoint.
     
-def save_bi_clusters_as_xml(filename, bi_clusters, obj_val, is_optimal, instance = ""):
+    Returns:
+        tuple: The return values of compute_bi_clusters() including the lower bound.
+        RecordingMonitor: The recorded events.
+        int: Number of cache hits in the worker process.
+        int: Number of cache misses in the worker process.
+    """
+    monitor = RecordingMonitor()
+    num_hits, num_misses = 0, 0
+    if cache is not None:
+        num_hits, num_misses = cache.num_hits, cache.num_misses
+    result = compute_bi_clusters(weights, algorithm, 1, default_weight, monitor, cache = cache, checkpoint = checkpoint, return_lower_bound = True)
+    if cache is not None:
+        num_hits, num_misses = cache.num_hits - num_hits, cache.num_misses - num_misses
+    return result, monitor, num_hits, num_misses
+
+def compute_bi_clusters_batch(instances, algorithm, num_workers = 1, default_weight = 0.0, monitor = None, cache = None, checkpoint = None, return_lower_bound = False):
+    """Computes bi-clusters for many instances in one process.
+    
+    The instances are consumed lazily. If num_workers is larger than 1, they are solved in a 
+    shared process pool with at most two instances per worker in flight. All ILP models of a 
+    process share one Gurobi environment.
+    
+    Args:
+        instances (iterable of tuple): Pairs of a name and a problem instance.
+        algorithm (Algorithm): The algorithm that should be used.
+        num_workers (int): Number of worker processes that solve instances in parallel.
+        default_weight (float): Weight of the cells that are not stored explicitly if an instance is sparse.
+        monitor (None or Monitor): Receives the events \"instance_started\" and \"instance_finished\" 
+            and, in between, the events of compute_bi_clusters() for the instance.
+        cache (None or Cache): The cache passed to compute_bi_clusters().
+        checkpoint (None or Checkpoint): The checkpoint passed to compute_bi_clusters(). Since the 
+            solutions of the subproblems are stored by content, one checkpoint serves all instances.
+        return_lower_bound (bool): If True, the lower bound of each instance is yielded as well.
+    
+    Yields:
+        tuple: The name of an instance, its bi-clusters, their objective value, the optimality flag, 
+            and, if return_lower_bound is True, the lower bound, in the order in which the instances are finished.
+    """
+    if monitor is None:
+        monitor = Monitor()
+    instances = iter(instances)
+    if num_workers <= 1:
+        for name, weights in instances:
+            monitor.event("instance_started", instance = name, num_rows = weights.shape[0], num_cols = weights.shape[1])
+            start = time.perf_counter()
+            bi_clusters, obj_val, is_optimal, lower_bound = compute_bi_clusters(weights, algorithm, 1, default_weight, monitor, cache = cache, 
+                                                                                checkpoint = checkpoint, return_lower_bound = True)
+            monitor.event("instance_finished", instance = name, obj_val = obj_val, is_optimal = is_optimal, time = time.perf_counter() - start)
+            yield (name, bi_clusters, obj_val, is_optimal) + ((lower_bound,) if return_lower_bound else ())
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers = num_workers) as executor:
+        futures = {}
+        is_exhausted = False
+        while not is_exhausted or len(futures) > 0:
+            while not is_exhausted and len(futures) < 2 * num_workers:
+                try:
+                    name, weights = next(instances)
+                except StopIteration:
+                    is_exhausted = True
+                    break
+                futures[executor.submit(compute_bi_clusters_recorded, weights, algorithm, default_weight, cache, checkpoint)] = (name, weights.shape, time.perf_counter())
+            if len(futures) == 0:
+                break
+            done, not_done = concurrent.futures.wait(futures, return_when = concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name, shape, start = futures.pop(future)
+                (bi_clusters, obj_val, is_optimal, lower_bound), recorded_monitor, num_hits, num_misses = future.result()
+                if cache is not None:
+                    cache.num_hits = cache.num_hits + num_hits
+                    cache.num_misses = cache.num_misses + num_misses
+                monitor.event("instance_started", instance = name, num_rows = shape[0], num_cols = shape[1])
+                recorded_monitor.replay(monitor)
+                monitor.event("instance_finished", instance = name, obj_val = obj_val, is_optimal = is_optimal, time = time.perf_counter() - start)
+                yield (name, bi_clusters, obj_val, is_optimal) + ((lower_bound,) if return_lower_bound else ())
+
+def score_bi_clusters(weights, bi_clusters, default_weight = 0.0):
+    """Computes the objective value of bi-clusters and checks if they are valid.
+    
+    Args:
+        weights (numpy.array or scipy.sparse matrix): The problem instance.
+        bi_clusters (list of tuple of list of int): List of bi-clusters.
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+    
+    Returns:
+        float: Objective value of the bi-clusters, i.e., the overall cost of the induced 
+            edge insertions and deletions. Rows and columns that are not covered 
+            by any bi-cluster are treated as singletons.
+        bool: True if and only if the bi-clusters are disjoint and cover all rows and columns.
+    """
+    row_labels, col_labels, is_valid = helpers.bi_clusters_to_labels(bi_clusters, weights.shape[0], weights.shape[1])
+    return helpers.compute_obj_val(weights, row_labels, col_labels, default_weight), is_valid
+    
+def save_bi_clusters_as_xml(filename, bi_clusters, obj_val, is_optimal, instance = "", lower_bound = None):
     """Saves bi-clusters as XML file.
     
+    The file is written incrementally, one bi-cluster at a time.
+    
     Args:
         filename (string): Name of XML file.
         bi_clusters (list of tuple of list of int): List of computed bi-clusters.
@@ -182,9 +761,160 @@ def save_bi_clusters_as_xml(filename, bi_clusters, obj_val, is_optimal, instance
         obj_val (float): Objective value of the obtained solution.
         is_optimal (bool): Set to True if and only if the obtained solution is guaranteed to be optimal.
         instance (string): String that contains information about the problem instance.
+        lower_bound (None or float): Lower bound on the optimal objective value. Only saved if not None.
+    """
+    with open(filename, "w") as xml_file:
+        xml_file.write("<?xml version=\"1.0\" ?>\n")
+        helpers.write_bi_clusters_as_xml(xml_file, bi_clusters, obj_val, is_optimal, instance, lower_bound = lower_bound)
+    
+def save_bi_clusters_as_npz(filename, bi_clusters, obj_val, is_optimal, instance = "", lower_bound = None):
+    """Saves bi-clusters as .npz file with one bi-cluster label per row and column.
+    
+    The file contains the arrays \"row_labels\" and \"col_labels\", where the label of a row or 
+    column is the index of its bi-cluster, as well as \"num_bi_clusters\", \"obj_val\", 
+    \"is_optimal\", and \"instance\". The numbers of rows and columns are derived from the 
+    largest row and column contained in the bi-clusters.
+    
+    Args:
+        filename (string): Name of .npz file.
+        bi_clusters (list of tuple of list of int): List of computed bi-clusters.
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        obj_val (float): Objective value of the obtained solution.
+        is_optimal (bool): Set to True if and only if the obtained solution is guaranteed to be optimal.
+        instance (string): String that contains information about the problem instance.
+        lower_bound (None or float): Lower bound on the optimal objective value. Only saved if not None.
     """
-    elem_tree = helpers.build_element_tree(bi_clusters, obj_val, is_optimal, instance)
-    xml_file = open(filename, "w")
-    xml_file.write(helpers.prettify(elem_tree))
-    xml_file.close()
+    num_rows = max([max(bi_cluster[0]) + 1 for bi_cluster in bi_clusters if len(bi_cluster[0]) > 0], default=0)
+    num_cols = max([max(bi_cluster[1]) + 1 for bi_cluster in bi_clusters if len(bi_cluster[1]) > 0], default=0)
+    row_labels, col_labels = helpers.bi_clusters_to_labels(bi_clusters, num_rows, num_cols)[:2]
+    with open(filename, "wb") as npz_file:
+        arrays = {}
+        if lower_bound is not None:
+            arrays["lower_bound"] = lower_bound
+        np.savez(npz_file, row_labels=row_labels, col_labels=col_labels, num_bi_clusters=len(bi_clusters), 
+                 obj_val=obj_val, is_optimal=is_optimal, instance=instance, **arrays)
     
+def save_bi_clusters_as_jsonl(filename, bi_clusters, obj_val, is_optimal, instance = "", lower_bound = None):
+    """Saves bi-clusters as JSON lines file.
+    
+    The first line contains \"num_bi_clusters\", \"obj_val\", \"is_optimal\", and \"instance\". 
+    Each further line contains the \"rows\" and \"cols\" of one bi-cluster.
+    
+    Args:
+        filename (string): Name of JSON lines file.
+        bi_clusters (list of tuple of list of int): List of computed bi-clusters.
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        obj_val (float): Objective value of the obtained solution.
+        is_optimal (bool): Set to True if and only if the obtained solution is guaranteed to be optimal.
+        instance (string): String that contains information about the problem instance.
+        lower_bound (None or float): Lower bound on the optimal objective value. Only saved if not None.
+    """
+    with open(filename, "w") as jsonl_file:
+        helpers.write_bi_clusters_as_jsonl(jsonl_file, bi_clusters, obj_val, is_optimal, instance, lower_bound)
+    
+def save_bi_clusters(filename, bi_clusters, obj_val, is_optimal, instance = "", lower_bound = None):
+    """Saves bi-clusters in the format given by the extension of the file name.
+    
+    Files ending with .npz are written with save_bi_clusters_as_npz(), files ending with .jsonl 
+    with save_bi_clusters_as_jsonl(), and all other files with save_bi_clusters_as_xml().
+    
+    Args:
+        filename (string): Name of the file.
+        bi_clusters (list of tuple of list of int): List of computed bi-clusters.
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        obj_val (float): Objective value of the obtained solution.
+        is_optimal (bool): Set to True if and only if the obtained solution is guaranteed to be optimal.
+        instance (string): String that contains information about the problem instance.
+        lower_bound (None or float): Lower bound on the optimal objective value. Only saved if not None.
+    """
+    if filename.endswith(".npz"):
+        save_bi_clusters_as_npz(filename, bi_clusters, obj_val, is_optimal, instance, lower_bound)
+    elif filename.endswith(".jsonl"):
+        save_bi_clusters_as_jsonl(filename, bi_clusters, obj_val, is_optimal, instance, lower_bound)
+    else:
+        save_bi_clusters_as_xml(filename, bi_clusters, obj_val, is_optimal, instance, lower_bound)
+    
+def load_bi_clusters(filename):
+    """Loads bi-clusters saved with save_bi_clusters().
+    
+    The format is given by the extension of the file name. XML files are parsed incrementally. 
+    Bi-clusters loaded from .npz files have sorted rows and columns, and rows and columns 
+    that were not covered by any of the saved bi-clusters are loaded as singletons.
+    
+    Args:
+        filename (string): Name of the file.
+    
+    Returns:
+        list of tuple of list of int: List of bi-clusters.
+            The first element of each bi-cluster is the list of rows, the second the list of columns.
+        float: Objective value of the bi-clusters.
+        bool: True if and only if the bi-clusters are guaranteed to be optimal.
+        string: String that contains information about the problem instance.
+    """
+    bi_clusters = []
+    if filename.endswith(".npz"):
+        with np.load(filename) as npz_file:
+            row_labels, col_labels = npz_file["row_labels"], npz_file["col_labels"]
+            num_labels = max([int(npz_file["num_bi_clusters"]), row_labels.max(initial=-1) + 1, col_labels.max(initial=-1) + 1])
+            # Sort the rows and columns by label once and slice the sorted lists, which is much faster than converting one array per bi-cluster.
+            rows = np.argsort(row_labels, kind="stable").tolist()
+            cols = np.argsort(col_labels, kind="stable").tolist()
+            row_bounds = [0] + np.cumsum(np.bincount(row_labels, minlength=num_labels)).tolist()
+            col_bounds = [0] + np.cumsum(np.bincount(col_labels, minlength=num_labels)).tolist()
+            bi_clusters = [(rows[row_bounds[label]:row_bounds[label + 1]], cols[col_bounds[label]:col_bounds[label + 1]]) for label in range(num_labels)]
+            return bi_clusters, float(npz_file["obj_val"]), bool(npz_file["is_optimal"]), str(npz_file["instance"])
+    if filename.endswith(".jsonl"):
+        with open(filename) as jsonl_file:
+            header = json.loads(jsonl_file.readline())
+            for line in jsonl_file:
+                bi_cluster = json.loads(line)
+                bi_clusters.append((bi_cluster["rows"], bi_cluster["cols"]))
+        return bi_clusters, header["obj_val"], header["is_optimal"], header["instance"]
+    header = {}
+    nodes = {}
+    for event, elem in ET.iterparse(filename, events=("start", "end")):
+        if event == "start" and elem.tag == "bi_clusters":
+            header = dict(elem.attrib)
+        elif event == "end" and elem.tag in ("rows", "cols"):
+            nodes[elem.tag] = [int(node) for node in (elem.text or "").split()]
+        elif event == "end" and elem.tag == "bi_cluster":
+            bi_clusters.append((nodes.get("rows", []), nodes.get("cols", [])))
+            nodes = {}
+            elem.clear()
+    return bi_clusters, float(header["obj_val"]), header["is_opt"] == "True", header["instance"]
+
+def save_bi_clusters_batch_as_xml(filename, results):
+    """Saves the bi-clusters of a batch of instances as one XML file while they are computed.
+    
+    The root element \"batch\" contains one \"bi_clusters\" element per instance, which has the 
+    same format as the root element of the files written by save_bi_clusters_as_xml(). 
+    Each element is written as soon as the corresponding result is available.
+    
+    Args:
+        filename (string): Name of XML file.
+        results (iterable of tuple): The name of an instance, its bi-clusters, their objective value, 
+            the optimality flag, and optionally the lower bound, e.g., as yielded by compute_bi_clusters_batch().
+    """
+    with open(filename, "w") as xml_file:
+        xml_file.write("<?xml version=\"1.0\" ?>\n<batch>\n")
+        for name, bi_clusters, obj_val, is_optimal, *lower_bound in results:
+            helpers.write_bi_clusters_as_xml(xml_file, bi_clusters, obj_val, is_optimal, name, "\t", *lower_bound)
+            xml_file.flush()
+        xml_file.write("</batch>\n")
+
+def save_bi_clusters_batch_as_jsonl(filename, results):
+    """Saves the bi-clusters of a batch of instances as one JSON lines file while they are computed.
+    
+    For each instance, the file contains the lines written by save_bi_clusters_as_jsonl(), i.e., a header 
+    with the number of bi-clusters followed by one line per bi-cluster. Each instance is written as soon as 
+    the corresponding result is available.
+    
+    Args:
+        filename (string): Name of JSON lines file.
+        results (iterable of tuple): The name of an instance, its bi-clusters, their objective value, 
+            the optimality flag, and optionally the lower bound, e.g., as yielded by compute_bi_clusters_batch().
+    """
+    with open(filename, "w") as jsonl_file:
+        for name, bi_clusters, obj_val, is_optimal, *lower_bound in results:
+            helpers.write_bi_clusters_as_jsonl(jsonl_file, bi_clusters, obj_val, is_optimal, name, *lower_bound)
+            jsonl_file.flush()
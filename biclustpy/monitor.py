@@ -0,0 +1,180 @@
+import json
+import progress.bar
+import time
+
+class Monitor:
+
+    """Base class of monitors that receive structured events during the computation of bi-clusters.
+    
+    The base class ignores all events. Subclasses override event() to render or store them.
+    The following events are emitted, each with the listed keyword arguments:
+        - \"graph_built\": num_rows, num_cols, num_edges, time.
+        - \"decomposed\": num_components, num_bi_cliques, num_subproblems, time.
+        - \"subproblem_started\": subproblem, num_subproblems, num_rows, num_cols, algorithm, time_limit.
+        - \"subproblem_reduced\": num_rows, num_cols, num_reduced_rows, num_reduced_cols, time.
+        - \"lower_bound_computed\": lower_bound, time.
+        - \"ilp_skipped\": obj_val, lower_bound.
+        - \"ilp_model_built\": num_variables, num_constraints, time.
+        - \"ilp_tuned\": time.
+        - \"ilp_solved\": status, obj_val, is_optimal, time, and, if a start solution was used, 
+          start_obj_val and is_improved.
+        - \"ch_constructed\": obj_val, time.
+        - \"grasp_finished\": num_starts, obj_val, time.
+        - \"subproblem_finished\": subproblem, num_subproblems, num_rows, num_cols, obj_val, is_optimal, lower_bound, is_cached, is_resumed, time.
+        - \"solved\": num_subproblems, time.
+        - \"finished\": obj_val, is_optimal, lower_bound, num_bi_clusters, num_optimal_subproblems, time.
+        - \"instance_started\": instance, num_rows, num_cols.
+        - \"instance_finished\": instance, obj_val, is_optimal, time.
+        - \"session_updated\": num_updates, num_affected_components, num_new_components, num_rows, num_cols, time.
+        - \"worker_reported\": worker, num_tasks, num_lost_tasks, num_cells, busy_time, throughput, is_connected.
+    The time_limit of \"subproblem_started\" is the share of the time budget that \"AUTO\" assigns
+    to the subproblem and None for all other algorithms. All times are durations in seconds. The events of the algorithms are emitted between the
+    \"subproblem_started\" and \"subproblem_finished\" events of the subproblem they belong to.
+    """
+    
+    def event(self, name, **data):
+        """Receives an event.
+    
+        Args:
+            name (string): Name of the event.
+            **data: Data of the event.
+        """
+        pass
+
+class RecordingMonitor(Monitor):
+
+    """Monitor that records all events.
+    
+    Attributes:
+        events (list of tuple of string and dict): The recorded events.
+    """
+    
+    def __init__(self):
+        self.events = []
+    
+    def event(self, name, **data):
+        self.events.append((name, data))
+    
+    def replay(self, monitor):
+        """Forwards the recorded events to another monitor.
+    
+        Args:
+            monitor (Monitor): The monitor that should receive the events.
+        """
+        for name, data in self.events:
+            monitor.event(name, **data)
+
+class MultiMonitor(Monitor):
+
+    """Monitor that forwards all events to several monitors.
+    
+    Attributes:
+        monitors (list of Monitor): The monitors.
+    """
+    
+    def __init__(self, monitors):
+        self.monitors = monitors
+    
+    def event(self, name, **data):
+        for monitor in self.monitors:
+            monitor.event(name, **data)
+
+class PrintMonitor(Monitor):
+
+    """Monitor that prints human-readable banners.
+    """
+    
+    def event(self, name, **data):
+        if name == "instance_started":
+            print("\n##############################################################################")
+            print("Instance " + data["instance"] + " (" + str(data["num_rows"]) + " x " + str(data["num_cols"]) + ")")
+            print("##############################################################################")
+        elif name == "decomposed":
+            print("\n==============================================================================")
+            print("Finished pre-processing.")
+            print("------------------------------------------------------------------------------")
+            print("Number of connected components: " + str(data["num_components"]))
+            print("Number of bi-cliques: " + str(data["num_bi_cliques"]))
+            print("==============================================================================")
+        elif name == "subproblem_started":
+            print("\n==============================================================================")
+            print("Solving subproblem " + str(data["subproblem"] + 1) + " of " + str(data["num_subproblems"]) + ".")
+            print("------------------------------------------------------------------------------")
+            print("Dimension: " + str(data["num_rows"]) + " x " + str(data["num_cols"]))
+            print("Algorithm: " + data["algorithm"])
+            if data["time_limit"] is not None:
+                print("Time limit: " + "{:.3f}".format(data["time_limit"]) + " seconds")
+        elif name == "subproblem_reduced":
+            print("Reduced subproblem from " + str(data["num_rows"]) + " x " + str(data["num_cols"]) + " to " + str(data["num_reduced_rows"]) + " x " + str(data["num_reduced_cols"]) + ".")
+        elif name == "lower_bound_computed":
+            print("Computed lower bound " + str(data["lower_bound"]) + ".")
+        elif name == "ilp_skipped":
+            print("Skipped ILP because the solution of CH matches the lower bound.")
+        elif name == "ilp_model_built":
+            print("Built ILP with " + str(data["num_variables"]) + " variables and " + str(data["num_constraints"]) + " constraints.")
+        elif name == "ilp_solved":
+            print("Solved ILP with status " + str(data["status"]) + ".")
+            if "start_obj_val" in data:
+                print("Start solution with objective value " + str(data["start_obj_val"]) + " was " + ("" if data["is_improved"] else "not ") + "improved.")
+        elif name == "ch_constructed":
+            print("Constructed bi-transitive subgraph with CH.")
+        elif name == "grasp_finished":
+            print("Completed " + str(data["num_starts"]) + " starts of GRASP.")
+        elif name == "subproblem_finished":
+            if data["is_cached"]:
+                print("Loaded solution from cache.")
+            if data["is_resumed"]:
+                print("Loaded solution from checkpoint.")
+            print("Objective value: " + str(data["obj_val"]))
+            print("Is optimal: " + str(data["is_optimal"]))
+            print("Lower bound: " + str(data["lower_bound"]))
+            print("==============================================================================")
+        elif name == "finished":
+            print("\n==============================================================================")
+            print("Finished computation of bi-clusters.")
+            print("------------------------------------------------------------------------------")
+            print("Objective value: " + str(data["obj_val"]))
+            print("Is optimal: " + str(data["is_optimal"]))
+            print("Lower bound: " + str(data["lower_bound"]))
+            print("Number of subproblems solved to optimality: " + str(data["num_optimal_subproblems"]))
+            print("Number of bi-clusters: " + str(data["num_bi_clusters"]))
+            print("==============================================================================")
+        elif name == "worker_reported":
+            print("Worker " + data["worker"] + ": " + str(data["num_tasks"]) + " subproblems, " + str(data["num_lost_tasks"]) + " lost, " 
+                  + "{:.1f}".format(data["throughput"]) + " cells per second")
+
+class ProgressBarMonitor(Monitor):
+
+    """Monitor that renders a progress bar over the subproblems.
+    """
+    
+    def __init__(self):
+        self.bar = None
+    
+    def event(self, name, **data):
+        if name == "decomposed":
+            self.bar = progress.bar.Bar("Solving subproblems", max = data["num_subproblems"])
+        elif name == "subproblem_finished" and self.bar is not None:
+            self.bar.next()
+        elif name == "solved" and self.bar is not None:
+            self.bar.finish()
+            self.bar = None
+
+class JsonLinesMonitor(Monitor):
+
+    """Monitor that writes each event as one line of JSON.
+    
+    Each line contains the name of the event as \"event\", the point in time when it
+    was received as \"timestamp\", and the data of the event.
+    
+    Attributes:
+        stream (file object): The stream the lines are written to.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def event(self, name, **data):
+        line = json.dumps(dict(data, event=name, timestamp=time.time()), default=lambda value: value.item())
+        self.stream.write(line + "\n")
+        self.stream.flush()
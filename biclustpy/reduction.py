@@ -0,0 +1,120 @@
+import numpy as np
+import scipy.sparse as sp
+
+def merge(weights, row_groups, col_groups):
+    """Merges groups of rows and columns into weighted super-nodes.
+    
+    The weight between a super-row and a super-column is the sum of the weights
+    between their members. If all members of each group end up in the same
+    bi-cluster, the cost of a solution of the merged instance differs from the cost
+    of the corresponding solution of the original instance only by a constant offset.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+        row_groups (numpy.array): Group labels 0, 1, ... of the rows.
+        col_groups (numpy.array): Group labels 0, 1, ... of the columns.
+    
+    Returns:
+        numpy.array: The weights of the merged instance.
+        float: The offset that has to be added to the costs of the merged instance.
+    """
+    num_rows, num_cols = weights.shape
+    row_indicators = sp.csr_matrix((np.ones(num_rows), (row_groups, np.arange(num_rows))))
+    col_indicators = sp.csr_matrix((np.ones(num_cols), (col_groups, np.arange(num_cols))))
+    merged_weights = np.asarray(col_indicators @ np.asarray(row_indicators @ weights).T).T
+    offset = np.maximum(-weights, 0).sum() - np.maximum(-merged_weights, 0).sum()
+    return merged_weights, offset
+
+def find_twins(weights):
+    """Groups rows with identical weights.
+    
+    Given the bi-clustering of the columns, the rows can be assigned to the bi-clusters
+    independently of each other. Twins hence have the same optimal choices, and there is
+    an optimal solution where all twins belong to the same bi-cluster.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+    
+    Returns:
+        numpy.array: Group labels 0, 1, ... of the rows.
+    """
+    return np.unique(weights, axis=0, return_inverse=True)[1].ravel()
+
+def find_forced_rows(weights):
+    """Groups rows that are forced into the bi-cluster of the same column.
+    
+    If w[i,k] > 0 is at least as large as the sum of the absolute values of the remaining
+    weights w[i,l] of row i, putting i into the bi-cluster of k costs at most w[i,k], while
+    any other choice costs at least w[i,k]. Hence, there is an optimal solution where all
+    rows that are forced to the same column belong to the same bi-cluster.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+    
+    Returns:
+        numpy.array: Group labels 0, 1, ... of the rows.
+    """
+    num_rows, num_cols = weights.shape
+    best_cols = weights.argmax(axis=1)
+    best_weights = weights[np.arange(num_rows), best_cols]
+    remaining_weights = np.abs(weights).sum(axis=1) - np.abs(best_weights)
+    is_forced = (best_weights > 0) & (best_weights >= remaining_weights)
+    groups = np.where(is_forced, best_cols, num_cols + np.arange(num_rows))
+    return np.unique(groups, return_inverse=True)[1]
+
+def reduce(weights):
+    """Shrinks a subproblem without losing optimality.
+    
+    Alternately merges row twins, column twins, rows that are forced into the bi-cluster
+    of the same column, and columns that are forced into the bi-cluster of the same row,
+    until none of the rules applies anymore. For exact twins, the offset is 0.
+    
+    Args:
+        weights (numpy.array): The weights of the subproblem.
+    
+    Returns:
+        numpy.array: The weights of the reduced subproblem.
+        numpy.array: For each row of the subproblem, the super-row of the reduced subproblem that contains it.
+        numpy.array: For each column of the subproblem, the super-column of the reduced subproblem that contains it.
+        float: The offset that has to be added to the costs of the reduced subproblem.
+    """
+    row_groups = np.arange(weights.shape[0])
+    col_groups = np.arange(weights.shape[1])
+    offset = 0.0
+    is_reducible = True
+    while is_reducible:
+        is_reducible = False
+        for find_groups in [find_twins, find_forced_rows]:
+            groups = find_groups(weights)
+            if groups.max() + 1 < weights.shape[0]:
+                weights, local_offset = merge(weights, groups, np.arange(weights.shape[1]))
+                row_groups = groups[row_groups]
+                offset = offset + local_offset
+                is_reducible = True
+            groups = find_groups(weights.T)
+            if groups.max() + 1 < weights.shape[1]:
+                weights, local_offset = merge(weights, np.arange(weights.shape[0]), groups)
+                col_groups = groups[col_groups]
+                offset = offset + local_offset
+                is_reducible = True
+    return weights, row_groups, col_groups, offset
+
+def expand(bi_clusters, row_groups, col_groups):
+    """Expands bi-clusters of a reduced subproblem to the rows and columns of the original subproblem.
+    
+    Args:
+        bi_clusters (list of tuple of list of int): Bi-clusters of the reduced subproblem.
+        row_groups (numpy.array): For each row of the subproblem, the super-row that contains it.
+        col_groups (numpy.array): For each column of the subproblem, the super-column that contains it.
+    
+    Returns:
+        list of tuple of list of int: Bi-clusters of the original subproblem.
+    """
+    members_of_row_groups = np.split(np.argsort(row_groups, kind="stable"), np.cumsum(np.bincount(row_groups))[:-1])
+    members_of_col_groups = np.split(np.argsort(col_groups, kind="stable"), np.cumsum(np.bincount(col_groups))[:-1])
+    expanded_bi_clusters = []
+    for rows, cols in bi_clusters:
+        expanded_rows = [row for group in rows for row in members_of_row_groups[group].tolist()]
+        expanded_cols = [col for group in cols for col in members_of_col_groups[group].tolist()]
+        expanded_bi_clusters.append((sorted(expanded_rows), sorted(expanded_cols)))
+    return expanded_bi_clusters
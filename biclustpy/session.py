@@ -0,0 +1,201 @@
+from . import helpers
+from . import main
+from .monitor import Monitor
+import numpy as np
+import scipy.sparse as sp
+import time
+
+class Session:
+
+    """Stateful bi-clustering that is updated incrementally after changes of the weights.
+    
+    The session keeps the connected components of the instance together with their bi-clusters,
+    objective values, and optimality flags. When weights are updated, only the components that
+    contain an updated row or column are affected. Their union is decomposed anew, which
+    accounts for components that split or merge, and only the resulting components are solved again.
+    
+    Attributes:
+        weights (numpy.array or scipy.sparse.csr_matrix): Copy of the current problem instance.
+        algorithm (Algorithm): The algorithm used to solve the components.
+        default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+        monitor (Monitor): Receives the events of compute_bi_clusters() and the event \"session_updated\".
+        cache (None or Cache): Cache passed to compute_bi_clusters().
+        warm_start (bool): If True, the bi-clusters of the affected components before the update
+            are passed to compute_bi_clusters() as start solution.
+        row_components (numpy.array): Component of each row.
+        col_components (numpy.array): Component of each column.
+        row_labels (numpy.array): Bi-cluster of each row.
+        col_labels (numpy.array): Bi-cluster of each column.
+        component_obj_vals (dict): Objective value of each component.
+        component_is_optimal (dict): Optimality flag of each component.
+        num_components (int): Number of component IDs that have been assigned so far.
+        num_labels (int): Number of bi-cluster labels that have been assigned so far.
+    """
+    
+    def __init__(self, weights, algorithm, num_workers = 1, default_weight = 0.0, monitor = None, cache = None, warm_start = True):
+        """Computes the initial bi-clusters with compute_bi_clusters().
+    
+        If compute_bi_clusters() cannot guarantee that its solution is optimal, none of
+        the initial components is considered to be solved to optimality.
+    
+        Args:
+            weights (numpy.array or scipy.sparse matrix): The problem instance. The session works on a copy.
+            algorithm (Algorithm): The algorithm used to solve the components.
+            num_workers (int): Number of worker processes used for the initial computation.
+            default_weight (float): Weight of the cells that are not stored explicitly if weights is sparse.
+            monitor (None or Monitor): Receives the events of compute_bi_clusters() and the event \"session_updated\".
+            cache (None or Cache): Cache passed to compute_bi_clusters().
+            warm_start (bool): If True, affected components are warm-started from their previous bi-clusters.
+        """
+        if sp.issparse(weights):
+            self.weights = sp.csr_matrix(weights, copy=True)
+        else:
+            self.weights = np.array(weights)
+        self.algorithm = algorithm
+        self.default_weight = default_weight
+        self.monitor = monitor
+        if self.monitor is None:
+            self.monitor = Monitor()
+        self.cache = cache
+        self.warm_start = warm_start
+        num_rows, num_cols = self.weights.shape
+        self.row_components = np.zeros(num_rows, dtype=int)
+        self.col_components = np.zeros(num_cols, dtype=int)
+        self.row_labels = np.zeros(num_rows, dtype=int)
+        self.col_labels = np.zeros(num_cols, dtype=int)
+        self.component_obj_vals = {}
+        self.component_is_optimal = {}
+        self.num_components = 0
+        self.num_labels = 0
+    
+        # Compute the initial bi-clusters and split them into the connected components.
+        bi_clusters, obj_val, is_optimal = main.compute_bi_clusters(self.weights, algorithm, num_workers, default_weight, self.monitor, cache = cache)
+        self.row_labels, self.col_labels = helpers.bi_clusters_to_labels(bi_clusters, num_rows, num_cols)[:2]
+        self.num_labels = len(bi_clusters)
+        components, is_bi_clique = helpers.decompose(helpers.build_adjacency_matrix(self.weights))
+        for rows, cols in components:
+            sub_weights = helpers.get_submatrix(self.weights, rows, cols, default_weight)
+            local_obj_val = helpers.compute_obj_val(sub_weights, self.row_labels[rows], self.col_labels[cols])
+            self.add_component(rows, cols, local_obj_val, is_optimal)
+    
+    def add_component(self, rows, cols, obj_val, is_optimal):
+        """Registers a new component.
+    
+        Args:
+            rows (numpy.array): The rows of the component.
+            cols (numpy.array): The columns of the component.
+            obj_val (float): Objective value of the bi-clusters of the component.
+            is_optimal (bool): True if and only if the bi-clusters of the component are guaranteed to be optimal.
+        """
+        component = self.num_components
+        self.num_components = self.num_components + 1
+        self.row_components[rows] = component
+        self.col_components[cols] = component
+        self.component_obj_vals[component] = obj_val
+        self.component_is_optimal[component] = is_optimal
+    
+    def set_weights(self, rows, cols, values):
+        """Overwrites weights of the instance.
+    
+        Args:
+            rows (numpy.array): Rows of the updated cells.
+            cols (numpy.array): Columns of the updated cells.
+            values (numpy.array): New weights of the updated cells. If a cell is updated several times, the last update counts.
+        """
+        num_rows, num_cols = self.weights.shape
+        flat_indices = rows * num_cols + cols
+        last_updates = flat_indices.size - 1 - np.unique(flat_indices[::-1], return_index=True)[1]
+        rows, cols, values = rows[last_updates], cols[last_updates], values[last_updates]
+        if not sp.issparse(self.weights):
+            self.weights[rows, cols] = values
+            return
+        # Store all updated cells explicitly, such that updates to 0 are not mistaken for the default weight.
+        entries = self.weights.tocoo()
+        is_kept = ~np.isin(entries.row * num_cols + entries.col, rows * num_cols + cols)
+        self.weights = sp.csr_matrix((np.concatenate([entries.data[is_kept], values]),
+                                      (np.concatenate([entries.row[is_kept], rows]), np.concatenate([entries.col[is_kept], cols]))),
+                                     shape=self.weights.shape)
+    
+    def update(self, updates):
+        """Updates weights and solves the affected components again.
+    
+        Args:
+            updates (list of tuple): Updates of the form (row, col, new_weight).
+    
+        Returns:
+            list of tuple of list of int: List of bi-clusters after the update.
+            float: Objective value after the update.
+            bool: True if and only if the bi-clusters are guaranteed to be optimal.
+        """
+        start = time.perf_counter()
+        if len(updates) == 0:
+            return self.bi_clusters(), self.obj_val(), self.is_optimal()
+        rows = np.array([update[0] for update in updates], dtype=int)
+        cols = np.array([update[1] for update in updates], dtype=int)
+        values = np.array([update[2] for update in updates], dtype=float)
+        num_rows, num_cols = self.weights.shape
+        if np.any((rows < 0) | (rows >= num_rows) | (cols < 0) | (cols >= num_cols)):
+            raise Exception("Updated cells should be contained in the instance but aren't.")
+        self.set_weights(rows, cols, values)
+    
+        # Collect the rows and columns of the affected components and remove the components.
+        affected_components = np.unique(np.concatenate([self.row_components[rows], self.col_components[cols]]))
+        affected_rows = np.flatnonzero(np.isin(self.row_components, affected_components))
+        affected_cols = np.flatnonzero(np.isin(self.col_components, affected_components))
+        for component in affected_components.tolist():
+            del self.component_obj_vals[component]
+            del self.component_is_optimal[component]
+    
+        # Decompose the affected part of the instance and solve the new components.
+        sub_weights = helpers.get_submatrix(self.weights, affected_rows, affected_cols, self.default_weight)
+        components, is_bi_clique = helpers.decompose(helpers.build_adjacency_matrix(sub_weights))
+        for (local_rows, local_cols), bi_clique in zip(components, is_bi_clique):
+            component_rows = affected_rows[local_rows]
+            component_cols = affected_cols[local_cols]
+            if bi_clique:
+                bi_clusters, obj_val, is_optimal = [(list(range(local_rows.size)), list(range(local_cols.size)))], 0.0, True
+            else:
+                start_bi_clusters = None
+                if self.warm_start:
+                    labels = np.unique(np.concatenate([self.row_labels[component_rows], self.col_labels[component_cols]]), return_inverse=True)[1].ravel()
+                    groups = helpers.group_by_labels(labels[:local_rows.size], labels[local_rows.size:], labels.max() + 1)
+                    start_bi_clusters = [(group_rows.tolist(), group_cols.tolist()) for group_rows, group_cols in groups]
+                bi_clusters, obj_val, is_optimal = main.compute_bi_clusters(sub_weights[np.ix_(local_rows, local_cols)], self.algorithm,
+                                                                            monitor = self.monitor, start_bi_clusters = start_bi_clusters, cache = self.cache)
+            for bi_cluster_rows, bi_cluster_cols in bi_clusters:
+                self.row_labels[component_rows[bi_cluster_rows]] = self.num_labels
+                self.col_labels[component_cols[bi_cluster_cols]] = self.num_labels
+                self.num_labels = self.num_labels + 1
+            self.add_component(component_rows, component_cols, obj_val, is_optimal)
+        self.monitor.event("session_updated", num_updates = len(updates), num_affected_components = affected_components.size,
+                           num_new_components = len(components), num_rows = affected_rows.size, num_cols = affected_cols.size,
+                           time = time.perf_counter() - start)
+        return self.bi_clusters(), self.obj_val(), self.is_optimal()
+    
+    def bi_clusters(self):
+        """Returns the current bi-clusters.
+    
+        Returns:
+            list of tuple of list of int: List of bi-clusters.
+                The first element of each bi-cluster is the list of rows, the second the list of columns.
+        """
+        labels = np.unique(np.concatenate([self.row_labels, self.col_labels]), return_inverse=True)[1].ravel()
+        num_rows = self.row_labels.size
+        groups = helpers.group_by_labels(labels[:num_rows], labels[num_rows:], labels.max() + 1 if labels.size > 0 else 0)
+        return [(rows.tolist(), cols.tolist()) for rows, cols in groups]
+    
+    def obj_val(self):
+        """Returns the current objective value.
+    
+        Returns:
+            float: The sum of the objective values of the components.
+        """
+        return sum(self.component_obj_vals.values())
+    
+    def is_optimal(self):
+        """Returns whether the current bi-clusters are guaranteed to be optimal.
+    
+        Returns:
+            bool: True if and only if the bi-clusters of all components are guaranteed to be optimal.
+        """
+        return all(self.component_is_optimal.values())
@@ -20,11 +20,14 @@ setup(name='biclustpy',
           'numpy',
           'argparse',
           'networkx',
-          'progress',
-          'gurobipy'
+          'scipy',
+          'progress'
       ],
+      extras_require={
+          'gurobi': ['gurobipy']
+      },
       entry_points={
-          'console_scripts': ['biclustpy=biclustpy.command_line:main'],
+          'console_scripts': ['biclustpy=biclustpy.command_line:main', 'biclustpy-benchmark=biclustpy.benchmark:main', 'biclustpy-worker=biclustpy.command_line:worker_main'],
       },
       include_package_data=True,
       zip_safe=False)
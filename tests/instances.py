@@ -0,0 +1,115 @@
+import itertools
+import numpy as np
+import os
+import sys
+import biclustpy as bp
+from biclustpy import command_line
+
+def random_instance(num_rows, num_cols, seed, threshold = 0.5):
+    """Generates a dense instance with uniformly random weights.
+    
+    Args:
+        num_rows (int): Number of rows.
+        num_cols (int): Number of columns.
+        seed (int): Seed for random generation.
+        threshold (float): Subtracted from the random values between 0 and 1.
+    
+    Returns:
+        numpy.array: The instance.
+    """
+    return np.random.default_rng(seed).random((num_rows, num_cols)) - threshold
+
+def block_instance(num_blocks, block_rows, block_cols, seed, threshold = 0.3):
+    """Generates an instance with one random block per connected component.
+    
+    Args:
+        num_blocks (int): Number of blocks.
+        block_rows (int): Number of rows of each block.
+        block_cols (int): Number of columns of each block.
+        seed (int): Seed for random generation.
+        threshold (float): Subtracted from the random values between 0 and 1 inside the blocks.
+    
+    Returns:
+        numpy.array: The instance. Cells outside the blocks have weight -1.
+    """
+    rng = np.random.default_rng(seed)
+    weights = -np.ones((num_blocks * block_rows, num_blocks * block_cols))
+    for block in range(num_blocks):
+        weights[block * block_rows:(block + 1) * block_rows, block * block_cols:(block + 1) * block_cols] = rng.random((block_rows, block_cols)) - threshold
+    return weights
+
+def brute_force_obj_val(weights):
+    """Computes the optimal objective value of a tiny instance by enumerating all labelings.
+    
+    Args:
+        weights (numpy.array): The instance. Should have at most 7 rows and columns in total.
+    
+    Returns:
+        float: The optimal objective value.
+    """
+    num_rows, num_cols = weights.shape
+    num_nodes = num_rows + num_cols
+    labels = np.array(list(itertools.product(range(num_nodes), repeat=num_nodes)))
+    is_same = labels[:, :num_rows, None] == labels[:, None, num_rows:]
+    costs = np.where((weights > 0)[None, :, :] != is_same, np.abs(weights)[None, :, :], 0.0)
+    return costs.sum(axis=(1, 2)).min()
+
+def to_sets(bi_clusters):
+    """Converts bi-clusters into a comparable set representation.
+    
+    Args:
+        bi_clusters (list of tuple of list of int): List of bi-clusters.
+    
+    Returns:
+        set of tuple of frozenset: The bi-clusters.
+    """
+    return {(frozenset(rows), frozenset(cols)) for rows, cols in bi_clusters}
+
+def highs_ilp():
+    """Builds the algorithm \"ILP\" with the HiGHS backend, which does not require a license.
+    
+    Returns:
+        biclustpy.Algorithm: The algorithm.
+    """
+    algorithm = bp.Algorithm()
+    algorithm.use_ilp(60, backend = "highs")
+    return algorithm
+
+def ch_algorithm():
+    """Builds the algorithm \"CH\".
+    
+    Returns:
+        biclustpy.Algorithm: The algorithm.
+    """
+    algorithm = bp.Algorithm()
+    algorithm.use_ch()
+    return algorithm
+
+def grasp_algorithm():
+    """Builds the algorithm \"GRASP\" with two seeded starts.
+    
+    Returns:
+        biclustpy.Algorithm: The algorithm.
+    """
+    algorithm = bp.Algorithm()
+    algorithm.use_grasp(num_starts = 2, time_limit = 10, seed = 0)
+    return algorithm
+
+def run_command_line(monkeypatch, args):
+    """Runs the command line interface.
+    
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to set the command line arguments.
+        args (list of string): The command line arguments without the program name.
+    """
+    monkeypatch.setattr(sys, "argv", ["biclustpy"] + args)
+    command_line.main()
+
+def write_batch(directory):
+    """Writes a batch of three instances to a directory, one in a.npy and two in b.npz.
+    
+    Args:
+        directory (string): The directory.
+    """
+    np.save(os.path.join(directory, "a.npy"), block_instance(2, 3, 3, 0))
+    np.savez(os.path.join(directory, "b.npz"), x = block_instance(2, 2, 3, 1), y = random_instance(3, 4, 2))
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy.monitor import RecordingMonitor
+from instances import block_instance, ch_algorithm, highs_ilp, random_instance
+
+def auto_algorithm(time_budget, max_ilp_size):
+    algorithm = bp.Algorithm()
+    algorithm.use_auto(time_budget, max_ilp_size)
+    algorithm.ilp_backend = "highs"
+    algorithm.grasp_num_starts = 2
+    algorithm.grasp_seed = 0
+    return algorithm
+
+def test_select():
+    algorithm = auto_algorithm(60, 20)
+    assert algorithm.select(4, 5, 10.0).algorithm_name == "ILP"
+    assert algorithm.select(4, 6, 10.0).algorithm_name == "GRASP"
+    assert algorithm.select(4, 5, 0.0).algorithm_name == "CH"
+    assert algorithm.select(4, 5, 10.0).ilp_backend == "highs"
+    assert algorithm.select(4, 5, 10.0).ilp_warm_start and not algorithm.ilp_warm_start
+    assert algorithm.algorithm_name == "AUTO"
+
+@pytest.mark.parametrize("max_ilp_size, expected", [(1000, {"ILP"}), (1, {"GRASP"})])
+def test_auto(max_ilp_size, expected):
+    weights = block_instance(3, 3, 4, 0)
+    monitor = RecordingMonitor()
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, auto_algorithm(60, max_ilp_size), monitor = monitor)
+    assert {data["algorithm"] for name, data in monitor.events if name == "subproblem_started"} == expected
+    assert bp.score_bi_clusters(weights, bi_clusters) == (pytest.approx(obj_val), True)
+    optimum = bp.compute_bi_clusters(weights, highs_ilp())[1]
+    heuristic = bp.compute_bi_clusters(weights, ch_algorithm())[1]
+    assert optimum - 1e-9 <= obj_val <= heuristic + 1e-9
+    if expected == {"ILP"}:
+        assert is_optimal and np.isclose(obj_val, optimum)
+
+def test_auto_without_budget():
+    weights = block_instance(3, 3, 4, 0)
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, auto_algorithm(0, 1000))
+    assert np.isclose(obj_val, bp.compute_bi_clusters(weights, ch_algorithm())[1])
+
+@pytest.mark.parametrize("seed", range(3))
+def test_tiny_time_share(seed):
+    weights = random_instance(8, 9, seed)
+    rows, cols = np.arange(8), np.arange(9)
+    selected_algorithm = auto_algorithm(60, 1000).select(8, 9, 1e-6)
+    assert selected_algorithm.algorithm_name == "ILP"
+    obj_val = selected_algorithm.run(weights, rows, cols)[2]
+    assert obj_val <= ch_algorithm().run(weights, rows, cols)[2] + 1e-9
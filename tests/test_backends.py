@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import ilp
+from instances import random_instance
+
+def test_unknown_backend():
+    with pytest.raises(Exception, match = "Invalid ILP backend"):
+        ilp.get_backend("cplex")
+    algorithm = bp.Algorithm()
+    algorithm.use_ilp(backend = "cplex")
+    with pytest.raises(Exception):
+        bp.compute_bi_clusters(random_instance(3, 4, 0), algorithm)
+
+def test_register_backend(monkeypatch):
+    monkeypatch.setitem(ilp.backends, "alias", "biclustpy.ilp_highs")
+    weights = random_instance(3, 4, 1)
+    expected = ilp.run(weights, np.arange(3), np.arange(4), 60, False, backend = "highs")
+    result = ilp.run(weights, np.arange(3), np.arange(4), 60, False, backend = "alias")
+    assert np.isclose(result[2], expected[2]) and result[3]
+    monkeypatch.setitem(ilp.backends, "missing", "biclustpy.no_such_backend")
+    with pytest.raises(Exception, match = "not available"):
+        ilp.get_backend("missing")
+
+@pytest.mark.parametrize("seed", range(3))
+def test_highs_matches_gurobi(seed):
+    pytest.importorskip("gurobipy")
+    weights = random_instance(3, 4, seed)
+    for lazy in (False, True):
+        highs = ilp.run(weights, np.arange(3), np.arange(4), 60, False, lazy, backend = "highs")
+        gurobi = ilp.run(weights, np.arange(3), np.arange(4), 60, False, lazy, backend = "gurobi")
+        assert highs[3] and gurobi[3]
+        assert np.isclose(highs[2], gurobi[2])
+
+def test_default_backend(monkeypatch):
+    monkeypatch.setattr(ilp.importlib.util, "find_spec", lambda name: None)
+    assert ilp.default_backend() == "highs"
+    assert bp.Algorithm().ilp_backend == "highs"
+    algorithm = bp.Algorithm()
+    algorithm.use_ilp()
+    assert algorithm.ilp_backend == "highs"
+    weights = random_instance(3, 4, 0)
+    assert bp.compute_bi_clusters(weights, bp.Algorithm())[2]
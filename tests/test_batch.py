@@ -0,0 +1,46 @@
+import json
+import numpy as np
+import os
+import pytest
+import biclustpy as bp
+from biclustpy import command_line
+from instances import highs_ilp, random_instance, run_command_line, to_sets, write_batch
+
+def test_iterate_instances(tmp_path):
+    write_batch(str(tmp_path))
+    assert command_line.is_batch(str(tmp_path)) and command_line.is_batch(str(tmp_path / "b.npz"))
+    assert not command_line.is_batch(str(tmp_path / "a.npy"))
+    assert [name for name, weights in command_line.iterate_instances(str(tmp_path), False, False)] == ["a", "b_x", "b_y"]
+    assert [name for name, weights in command_line.iterate_instances(str(tmp_path / "*.npz"), False, False)] == ["b_x", "b_y"]
+    assert [name for name, weights in command_line.iterate_instances(str(tmp_path / "b.npz"), False, False)] == ["x", "y"]
+    np.save(str(tmp_path / "b_x.npy"), random_instance(2, 2, 0))
+    with pytest.raises(Exception):
+        list(command_line.iterate_instances(str(tmp_path), False, False))
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_batch_matches_single(tmp_path, num_workers):
+    write_batch(str(tmp_path))
+    instances = dict(command_line.iterate_instances(str(tmp_path), False, False))
+    results = list(bp.compute_bi_clusters_batch(instances.items(), highs_ilp(), num_workers, return_lower_bound = True))
+    assert sorted(result[0] for result in results) == sorted(instances)
+    for name, bi_clusters, obj_val, is_optimal, lower_bound in results:
+        expected = bp.compute_bi_clusters(instances[name], highs_ilp())
+        assert np.isclose(obj_val, expected[1]) and is_optimal
+        assert to_sets(bi_clusters) == to_sets(expected[0])
+        assert np.isclose(lower_bound, obj_val)
+
+def test_command_line_batch(tmp_path, monkeypatch):
+    write_batch(str(tmp_path))
+    output = str(tmp_path / "output") + os.sep
+    checkpoint = str(tmp_path / "checkpoint")
+    args = ["--load", str(tmp_path), "--save", output, "--batch_format", "jsonl", "--ilp_backend", "highs", 
+            "--monitor", "quiet", "--checkpoint", checkpoint, "--bound"]
+    run_command_line(monkeypatch, args)
+    assert sorted(os.listdir(output)) == ["a.jsonl", "b_x.jsonl", "b_y.jsonl"]
+    assert len(os.listdir(checkpoint)) > 0
+    for name in ["a", "b_x", "b_y"]:
+        with open(os.path.join(output, name + ".jsonl")) as jsonl_file:
+            record = json.loads(jsonl_file.readline())
+        assert record["lower_bound"] is not None and record["lower_bound"] <= record["obj_val"] + 1e-9
+    with pytest.raises(Exception):
+        run_command_line(monkeypatch, ["--load", str(tmp_path), "--save", str(tmp_path / "output.npz")])
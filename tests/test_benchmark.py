@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import benchmark
+
+def test_generate_planted_instance():
+    weights, planted_bi_clusters = benchmark.generate_planted_instance(12, 15, 3, noise = 0.0, sparsity = 0.5, default_weight = -0.5, seed = 0)
+    assert weights.shape == (12, 15)
+    assert sorted(row for rows, cols in planted_bi_clusters for row in rows) == list(range(12))
+    assert sorted(col for rows, cols in planted_bi_clusters for col in cols) == list(range(15))
+    assert bp.score_bi_clusters(weights, planted_bi_clusters) == (0.0, True)
+    assert np.any(weights == -0.5)
+    with pytest.raises(Exception):
+        benchmark.generate_planted_instance(4, 4, 2, default_weight = 0.5)
+
+def test_adjusted_rand_index():
+    assert benchmark.adjusted_rand_index(np.array([0, 0, 1, 1]), np.array([5, 5, 3, 3])) == 1.0
+    assert benchmark.adjusted_rand_index(np.array([0, 0, 1, 1]), np.array([0, 1, 0, 1])) < 0.0
+
+def test_build_algorithm():
+    algorithm = benchmark.build_algorithm("ILP+lazy+warm+reduce+bound+highs", 5)
+    assert algorithm.algorithm_name == "ILP"
+    assert algorithm.ilp_lazy and algorithm.ilp_warm_start and algorithm.reduce and algorithm.bound
+    assert algorithm.ilp_backend == "highs" and algorithm.ilp_time_limit == 5
+    assert benchmark.build_algorithm("CH").algorithm_name == "CH"
+    with pytest.raises(Exception):
+        benchmark.build_algorithm("CH+fast")
+    with pytest.raises(Exception):
+        benchmark.build_algorithm("SA")
+
+def test_run_and_compare(tmp_path):
+    records = benchmark.run_benchmark(["CH", "ILP+highs"], [(8, 10)], num_bi_clusters = 2, sparsity = 0.5, use_sparse = True, time_limit = 10)
+    assert [record["setting"] for record in records] == ["CH", "ILP+highs"]
+    assert records[1]["is_optimal"] and records[1]["obj_val"] <= records[0]["obj_val"] + 1e-9
+    filename = str(tmp_path / "results.json")
+    benchmark.save_results(filename, records)
+    assert benchmark.compare_results(records, benchmark.load_results(filename)) == []
+    worse = [dict(record, obj_val = record["obj_val"] + 1.0) for record in records]
+    assert len(benchmark.compare_results(records, worse)) == 2
+
+def test_run_is_quiet(capsys):
+    benchmark.run_benchmark(["CH"], [(6, 6)], num_bi_clusters = 2)
+    assert capsys.readouterr().out == ""
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_phase_timings(num_workers):
+    records = benchmark.run_benchmark(["ILP+highs"], [(8, 8)], num_bi_clusters = 3, noise = 0.2, num_workers = num_workers, time_limit = 10)
+    timings = records[0]["timings"]
+    assert timings["model_build"] > 0.0
+    assert all(value >= 0.0 for value in timings.values())
@@ -0,0 +1,47 @@
+import itertools
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import bounds
+from biclustpy.monitor import RecordingMonitor
+from instances import block_instance, brute_force_obj_val, highs_ilp, random_instance
+
+@pytest.mark.parametrize("num_nodes", [2, 5, 6])
+def test_round_robin(num_nodes):
+    pairs = []
+    for round_id in range(num_nodes - 1 + num_nodes % 2):
+        first, second = bounds.round_robin(num_nodes, round_id)
+        assert len(set(first.tolist()) | set(second.tolist())) == 2 * first.size
+        pairs.extend(tuple(sorted(pair)) for pair in zip(first.tolist(), second.tolist()))
+    assert sorted(pairs) == list(itertools.combinations(range(num_nodes), 2))
+
+@pytest.mark.parametrize("seed", range(4))
+def test_lower_bound(seed):
+    weights = random_instance(3, 4, seed)
+    optimum = brute_force_obj_val(weights)
+    assert bounds.compute_lower_bound(weights) <= optimum + 1e-9
+    assert bounds.compute_lower_bound(weights.T) <= optimum + 1e-9
+    weights = random_instance(6, 7, seed)
+    optimum = bp.compute_bi_clusters(weights, highs_ilp())[1]
+    assert 0.0 <= bounds.compute_lower_bound(weights, max_work = 1) <= bounds.compute_lower_bound(weights) <= optimum + 1e-9
+
+def test_ilp_skipped():
+    weights = np.array([[1.0, 1.0], [1.0, -1.0]])
+    assert bounds.compute_lower_bound(weights) == 1.0
+    assert bounds.compute_lower_bound(np.ones((3, 3))) == 0.0
+    algorithm = highs_ilp()
+    algorithm.bound = True
+    monitor = RecordingMonitor()
+    bi_clusters, obj_val, is_optimal, lower_bound = bp.compute_bi_clusters(weights, algorithm, monitor = monitor, return_lower_bound = True)
+    names = [name for name, data in monitor.events]
+    assert "ilp_skipped" in names and "ilp_solved" not in names
+    assert obj_val == lower_bound == 1.0 and is_optimal
+
+def test_overall_lower_bound():
+    weights = block_instance(3, 3, 4, 0)
+    algorithm = bp.Algorithm()
+    algorithm.use_ch()
+    algorithm.bound = True
+    bi_clusters, obj_val, is_optimal, lower_bound = bp.compute_bi_clusters(weights, algorithm, return_lower_bound = True)
+    assert lower_bound <= bp.compute_bi_clusters(weights, highs_ilp())[1] + 1e-9
+    assert lower_bound <= obj_val + 1e-9
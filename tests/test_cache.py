@@ -0,0 +1,65 @@
+import numpy as np
+import biclustpy as bp
+from biclustpy.monitor import RecordingMonitor
+from instances import block_instance, ch_algorithm, highs_ilp, to_sets
+
+def test_cache_hit(tmp_path):
+    weights = block_instance(3, 3, 4, 0)
+    cache = bp.Cache(str(tmp_path))
+    expected = bp.compute_bi_clusters(weights, highs_ilp(), cache = cache)
+    assert cache.num_hits == 0 and cache.num_misses > 0
+    num_entries = cache.statistics()["num_entries"]
+    assert num_entries == cache.num_misses
+    monitor = RecordingMonitor()
+    result = bp.compute_bi_clusters(weights, highs_ilp(), monitor = monitor, cache = cache)
+    assert cache.num_hits == num_entries
+    assert all(data["is_cached"] for name, data in monitor.events if name == "subproblem_finished")
+    assert np.isclose(result[1], expected[1]) and result[2] == expected[2]
+    assert to_sets(result[0]) == to_sets(expected[0])
+
+def test_cache_key(tmp_path):
+    cache = bp.Cache(str(tmp_path))
+    cache_weights = block_instance(2, 3, 3, 0)
+    key = cache.key(cache_weights, highs_ilp())
+    assert key == cache.key(cache_weights.copy(), highs_ilp())
+    assert key != cache.key(cache_weights, ch_algorithm())
+    assert key != cache.key(cache_weights.astype(np.float32), highs_ilp())
+    threaded = highs_ilp()
+    threaded.ilp_threads = 4
+    assert key == cache.key(cache_weights, threaded)
+    unused = highs_ilp()
+    unused.use_grasp(num_starts = 3, seed = 1)
+    unused.use_ilp(backend = "highs")
+    assert key == cache.key(cache_weights, unused)
+    unused.ilp_warm_start = True
+    assert key != cache.key(cache_weights, unused)
+    seeded = ch_algorithm()
+    seeded.use_ch(seed = 2)
+    assert cache.key(cache_weights, seeded) != cache.key(cache_weights, ch_algorithm())
+
+def test_eviction(tmp_path):
+    cache = bp.Cache(str(tmp_path), max_size = 1)
+    cache.put("a", ([([0], [0])], 0.0, True, 0.0))
+    assert cache.statistics()["num_entries"] == 0
+    cache = bp.Cache(str(tmp_path), max_size = 0)
+    cache.put("a", ([([0, 1], [2])], 1.5, False, 0.5))
+    assert cache.size == cache.statistics()["size"] > 0
+    assert cache.get("a") == ([([0, 1], [2])], 1.5, False, 0.5)
+    assert cache.get("b") is None
+    cache.clear()
+    assert cache.statistics()["num_entries"] == 0 and cache.size == 0
+
+def test_eviction_order(tmp_path):
+    cache = bp.Cache(str(tmp_path), max_size = 0)
+    for key in "abc":
+        cache.put(key, ([([0], [0])], 0.0, True, 0.0))
+    entry_size = cache.size // 3
+    cache = bp.Cache(str(tmp_path), max_size = 3 * entry_size)
+    assert cache.size == 3 * entry_size
+    cache.put("b", ([([0], [0])], 0.0, True, 0.0))
+    assert cache.size == 3 * entry_size
+    assert cache.get("a") is not None
+    cache.put("d", ([([0], [0])], 0.0, True, 0.0))
+    assert cache.get("c") is None
+    assert all(cache.get(key) is not None for key in "abd")
+    assert cache.size == cache.statistics()["size"]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from biclustpy import ch
+from biclustpy import helpers
+from instances import random_instance
+
+def naive_g_values(weights):
+    """Computes the g-values with the loops of the original implementation of CH."""
+    num_rows, num_cols = weights.shape
+    adjacency = weights > 0
+    g_values = np.zeros(weights.shape)
+    for i in range(num_rows):
+        n2i = [j for l in np.flatnonzero(adjacency[i]) for j in np.flatnonzero(adjacency[:, l])]
+        for k in range(num_cols):
+            n2k = [l for j in np.flatnonzero(adjacency[:, k]) for l in np.flatnonzero(adjacency[j])]
+            g = weights[i, k]
+            g = g + sum([weights[i, l] for l in n2k if l != k])
+            g = g + sum([weights[j, k] for j in n2i if j != i])
+            g = g - sum([weights[i, l] for l in range(num_cols) if weights[i, l] > 0])
+            g = g + sum([weights[i, l] for l in n2k if weights[i, l] > 0])
+            g = g - sum([weights[j, k] for j in range(num_rows) if weights[j, k] > 0])
+            g = g + sum([weights[j, k] for j in n2i if weights[j, k] > 0])
+            g_values[i, k] = g
+    return g_values
+
+@pytest.mark.parametrize("seed", range(5))
+def test_g_values_match_loops(seed):
+    weights = random_instance(7, 9, seed)
+    assert np.allclose(ch.compute_g_values(weights, weights > 0), naive_g_values(weights))
+
+def naive_construct(weights):
+    """Runs the construction phase of the original implementation of CH with alpha = 1."""
+    num_rows, num_cols = weights.shape
+    adjacency = weights > 0
+    g_values = naive_g_values(weights)
+    queue = sorted([((i, k), g_values[i, k]) for i in range(num_rows) for k in range(num_cols)], key = lambda pair: pair[1], reverse = True)
+    is_deleted_row = np.zeros(num_rows, dtype=bool)
+    is_deleted_col = np.zeros(num_cols, dtype=bool)
+    row_labels = np.arange(num_rows) + num_rows + num_cols
+    col_labels = np.arange(num_cols) + 2 * (num_rows + num_cols)
+    num_bi_clusters = 0
+    while np.any(adjacency[np.ix_(~is_deleted_row, ~is_deleted_col)]):
+        i, k = next(pair for pair, g in queue if not (is_deleted_row[pair[0]] or is_deleted_col[pair[1]]))
+        left = set(np.flatnonzero(adjacency[:, k] & ~is_deleted_row)) | {i}
+        right = set(np.flatnonzero(adjacency[i] & ~is_deleted_col)) | {k}
+        row_labels[list(left)] = num_bi_clusters
+        col_labels[list(right)] = num_bi_clusters
+        is_deleted_row[list(left)] = True
+        is_deleted_col[list(right)] = True
+        num_bi_clusters = num_bi_clusters + 1
+    return row_labels, col_labels
+
+@pytest.mark.parametrize("seed", range(5))
+def test_construct_matches_original(seed):
+    weights = random_instance(8, 10, seed)
+    row_labels, col_labels = ch.construct(weights, 1.0, np.random.default_rng(0))
+    expected_row_labels, expected_col_labels = naive_construct(weights)
+    assert np.isclose(helpers.compute_obj_val(weights, row_labels, col_labels), helpers.compute_obj_val(weights, expected_row_labels, expected_col_labels))
+
+def test_pair_queue_skips_deleted_pairs():
+    g_values = random_instance(6, 6, 0)
+    queue = ch.PairQueue(g_values, 0.5, np.random.default_rng(0))
+    queue.delete([0, 1], [2])
+    for trial in range(20):
+        i, k = queue.next_pair()
+        assert i not in (0, 1) and k != 2
+        remaining = g_values[2:][:, [0, 1, 3, 4, 5]]
+        assert g_values[i, k] >= remaining.min() + 0.5 * (remaining.max() - remaining.min()) - 1e-12
+    queue.delete(np.arange(6), [])
+    assert queue.next_pair() is None
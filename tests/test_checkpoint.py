@@ -0,0 +1,42 @@
+import numpy as np
+import os
+import pytest
+import biclustpy as bp
+from biclustpy import main
+from biclustpy.monitor import RecordingMonitor
+from instances import block_instance, highs_ilp, to_sets
+
+@pytest.mark.parametrize("num_workers, reduce", [(1, False), (2, False), (1, True)])
+def test_resume(tmp_path, num_workers, reduce):
+    weights = block_instance(3, 3, 4, 0)
+    algorithm = highs_ilp()
+    algorithm.reduce = reduce
+    checkpoint = bp.Checkpoint(str(tmp_path))
+    expected = bp.compute_bi_clusters(weights, algorithm, num_workers, checkpoint = checkpoint)
+    assert not any(name.endswith(".incumbent.npz") for name in os.listdir(str(tmp_path)))
+    assert len(checkpoint.entries()) > 0
+    monitor = RecordingMonitor()
+    result = bp.compute_bi_clusters(weights, algorithm, num_workers, monitor = monitor, checkpoint = bp.Checkpoint(str(tmp_path)))
+    assert all(data["is_resumed"] for name, data in monitor.events if name == "subproblem_finished")
+    assert np.isclose(result[1], expected[1]) and result[2] == expected[2]
+    assert to_sets(result[0]) == to_sets(expected[0])
+
+def test_incumbent(tmp_path):
+    weights = block_instance(1, 3, 4, 0)
+    checkpoint = bp.Checkpoint(str(tmp_path))
+    key = checkpoint.key(weights, None)
+    start_labels = (np.zeros(3, dtype=int), np.zeros(4, dtype=int))
+    checkpoint.put_incumbent(key, *start_labels)
+    assert all(np.array_equal(labels, start) for labels, start in zip(checkpoint.get_incumbent(key), start_labels))
+    monitor = RecordingMonitor()
+    incumbent_keys = []
+    bi_clusters, obj_val, is_optimal, lower_bound, is_improved = main.solve_subproblem(highs_ilp(), weights, monitor, checkpoint = checkpoint, incumbent_keys = incumbent_keys)
+    assert incumbent_keys == [key]
+    solved = [data for name, data in monitor.events if name == "ilp_solved"]
+    assert np.isclose(solved[0]["start_obj_val"], bp.score_bi_clusters(weights, [(list(range(3)), list(range(4)))])[0])
+    assert obj_val <= solved[0]["start_obj_val"] + 1e-9
+    assert is_improved == solved[0]["is_improved"]
+    assert os.path.exists(checkpoint.incumbent_path(key))
+    checkpoint.remove_incumbent(key)
+    checkpoint.remove_incumbent(key)
+    assert checkpoint.get_incumbent(key) is None
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import command_line
+from instances import block_instance, ch_algorithm, to_sets
+
+@pytest.mark.parametrize("mmap, float32", [(False, False), (True, False), (False, True), (True, True)])
+def test_load_instance(tmp_path, mmap, float32):
+    weights = block_instance(3, 3, 4, 0)
+    filename = str(tmp_path / "instance.npy")
+    np.save(filename, weights)
+    loaded = command_line.load_instance(filename, mmap, float32)
+    assert loaded.dtype == (np.float32 if float32 else np.float64)
+    if mmap and not float32:
+        assert isinstance(loaded, np.memmap)
+    expected = bp.compute_bi_clusters(weights, ch_algorithm())
+    result = bp.compute_bi_clusters(loaded, ch_algorithm())
+    assert np.isclose(result[1], expected[1], rtol = 1e-5)
+    assert to_sets(result[0]) == to_sets(expected[0])
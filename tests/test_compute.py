@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import main
+from instances import block_instance, ch_algorithm, highs_ilp, to_sets
+
+def test_parallel_matches_serial():
+    weights = block_instance(4, 3, 4, 0)
+    for algorithm in (ch_algorithm(), highs_ilp()):
+        serial = bp.compute_bi_clusters(weights, algorithm)
+        parallel = bp.compute_bi_clusters(weights, algorithm, num_workers = 2)
+        assert np.isclose(serial[1], parallel[1])
+        assert serial[2] == parallel[2]
+        assert to_sets(serial[0]) == to_sets(parallel[0])
+
+@pytest.mark.parametrize("sizes, num_threads", [([1] * 8, 32), ([100, 10, 10, 10], 32), ([5, 5, 5], 2), ([3, 7], 5)])
+def test_split_threads(sizes, num_threads):
+    threads = main.split_threads(sizes, num_threads)
+    assert len(threads) == len(sizes)
+    assert min(threads) >= 1
+    assert sum(threads) == max(num_threads, len(sizes))
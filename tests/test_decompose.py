@@ -0,0 +1,40 @@
+import networkx as nx
+import numpy as np
+import pytest
+import scipy.sparse as sp
+import biclustpy as bp
+from biclustpy import helpers
+from instances import block_instance, random_instance
+
+@pytest.mark.parametrize("seed", range(5))
+def test_decompose_matches_networkx(seed):
+    weights = random_instance(12, 15, seed, threshold = 0.85)
+    graph = nx.Graph()
+    graph.add_nodes_from(range(weights.shape[0] + weights.shape[1]))
+    graph.add_edges_from((i, weights.shape[0] + k) for i, k in zip(*np.nonzero(weights > 0)))
+    expected = {frozenset(component) for component in nx.connected_components(graph)}
+    components, is_bi_clique = helpers.decompose(helpers.build_adjacency_matrix(weights))
+    assert {frozenset(rows.tolist()) | frozenset((weights.shape[0] + cols).tolist()) for rows, cols in components} == expected
+    for (rows, cols), bi_clique in zip(components, is_bi_clique):
+        assert bi_clique == bool(np.all(weights[np.ix_(rows, cols)] > 0))
+
+def test_decompose_finds_blocks():
+    weights = block_instance(4, 3, 5, 0)
+    components, is_bi_clique = helpers.decompose(helpers.build_adjacency_matrix(weights))
+    sizes = sorted((len(rows), len(cols)) for rows, cols in components if len(rows) > 0 and len(cols) > 0)
+    assert sum(len(rows) for rows, cols in components) == weights.shape[0]
+    assert sum(len(cols) for rows, cols in components) == weights.shape[1]
+    assert all(num_rows <= 3 and num_cols <= 5 for num_rows, num_cols in sizes)
+
+@pytest.mark.parametrize("shape", [(0, 3), (3, 0), (0, 0)])
+@pytest.mark.parametrize("is_sparse", [False, True])
+def test_empty_instance(shape, is_sparse):
+    weights = np.zeros(shape)
+    if is_sparse:
+        weights = sp.csr_matrix(weights)
+    algorithm = bp.Algorithm()
+    algorithm.use_ch()
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, algorithm, default_weight = -1.0 if is_sparse else 0.0)
+    assert obj_val == 0 and is_optimal
+    assert sorted(bi_clusters) == sorted([([row], []) for row in range(shape[0])] + [([], [col]) for col in range(shape[1])])
+    assert helpers.compute_obj_val(weights, np.zeros(shape[0], dtype=int), np.zeros(shape[1], dtype=int), -1.0) == 0
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+import threading
+import time
+import biclustpy as bp
+from biclustpy import distributed
+from instances import block_instance, highs_ilp, run_command_line, to_sets
+
+TIMEOUT = 60.0
+
+def run_with_timeout(function, timeout = TIMEOUT):
+    """Runs a function in a thread and fails if it does not return in time.
+    
+    Args:
+        function (function): The function without arguments.
+        timeout (float): Time in seconds.
+    
+    Returns:
+        The return value of the function.
+    """
+    outcome = {}
+    def target():
+        try:
+            outcome["result"] = function()
+        except Exception as error:
+            outcome["error"] = error
+    thread = threading.Thread(target = target, daemon = True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "Timed out after " + str(timeout) + " seconds."
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+def test_start_compute_shutdown():
+    weights = block_instance(3, 3, 4, 0)
+    expected = bp.compute_bi_clusters(weights, highs_ilp())
+    coordinator = bp.Coordinator()
+    try:
+        coordinator.start_local_workers(2)
+        result = run_with_timeout(lambda: bp.compute_bi_clusters(weights, highs_ilp(), 2, coordinator = coordinator))
+    finally:
+        run_with_timeout(coordinator.shutdown)
+    assert np.isclose(result[1], expected[1]) and result[2] == expected[2]
+    assert to_sets(result[0]) == to_sets(expected[0])
+    statistics = coordinator.statistics()
+    assert sum(worker_statistics["num_tasks"] for worker_statistics in statistics) == 3
+    assert not any(worker_statistics["is_connected"] for worker_statistics in statistics)
+    assert all(not process.is_alive() for process in coordinator.processes)
+
+def test_shutdown_with_idle_worker():
+    with bp.Coordinator() as coordinator:
+        worker = threading.Thread(target = bp.run_worker, args = (coordinator.address, coordinator.authkey, 10.0), daemon = True)
+        worker.start()
+        while len(coordinator.statistics()) == 0:
+            time.sleep(0.05)
+        start = time.perf_counter()
+        run_with_timeout(coordinator.shutdown, 10.0)
+        assert time.perf_counter() - start < 5.0
+    worker.join(TIMEOUT)
+    assert not worker.is_alive()
+
+def test_no_worker_timeout():
+    with bp.Coordinator(worker_timeout = 0.5) as coordinator:
+        with pytest.raises(Exception, match = "No worker"):
+            run_with_timeout(lambda: bp.compute_bi_clusters(block_instance(2, 3, 4, 0), highs_ilp(), 2, coordinator = coordinator))
+
+def test_lost_worker():
+    with bp.Coordinator(max_retries = 0) as coordinator:
+        # A worker that disconnects as soon as it receives a subproblem.
+        def lose_task():
+            with distributed.connect(coordinator.address, coordinator.authkey, 10.0) as connection:
+                connection.send(("hello", "lost", 0))
+                connection.recv()
+        worker = threading.Thread(target = lose_task, daemon = True)
+        worker.start()
+        future = coordinator.submit(highs_ilp(), block_instance(1, 3, 4, 0))
+        with pytest.raises(Exception, match = "lost"):
+            future.result(TIMEOUT)
+        assert coordinator.statistics()[0]["num_lost_tasks"] == 1
+    with pytest.raises(Exception):
+        coordinator.submit(highs_ilp(), block_instance(1, 3, 4, 0))
+
+def test_command_line(tmp_path, monkeypatch):
+    output = str(tmp_path / "bi_clusters.jsonl")
+    args = ["--random", "6", "7", "0.5", "0", "--ilp_backend", "highs", "--monitor", "quiet", "--coordinator", "localhost:0", "--num_workers", "2"]
+    run_with_timeout(lambda: run_command_line(monkeypatch, args + ["--local_workers", "2", "--save", output]))
+    assert bp.load_bi_clusters(output)[2]
+    
+    # Without workers, the run fails after the worker timeout and still shuts the coordinator down.
+    coordinators = []
+    shutdown = bp.Coordinator.shutdown
+    def record_shutdown(coordinator, timeout = 5.0):
+        coordinators.append(coordinator)
+        shutdown(coordinator, timeout)
+    monkeypatch.setattr(bp.Coordinator, "shutdown", record_shutdown)
+    with pytest.raises(Exception, match = "No worker"):
+        run_with_timeout(lambda: run_command_line(monkeypatch, args + ["--worker_timeout", "0.5"]))
+    assert len(coordinators) == 1 and coordinators[0].is_closed
+
+def test_silent_worker():
+    for max_retries in (0, 1):
+        with bp.Coordinator(max_retries = max_retries, heartbeat_timeout = 0.5) as coordinator:
+            # A worker that stops responding after it receives a subproblem but keeps the connection open.
+            is_released = threading.Event()
+            def keep_silent():
+                with distributed.connect(coordinator.address, coordinator.authkey, 10.0) as connection:
+                    connection.send(("hello", "silent", 0))
+                    connection.recv()
+                    is_released.wait(TIMEOUT)
+            silent_worker = threading.Thread(target = keep_silent, daemon = True)
+            silent_worker.start()
+            while len(coordinator.statistics()) == 0:
+                time.sleep(0.05)
+            weights = block_instance(1, 3, 4, 0)
+            future = coordinator.submit(highs_ilp(), weights)
+            if max_retries == 0:
+                with pytest.raises(Exception, match = "lost"):
+                    future.result(TIMEOUT)
+            else:
+                threading.Thread(target = bp.run_worker, args = (coordinator.address, coordinator.authkey, 10.0), daemon = True).start()
+                assert np.isclose(future.result(TIMEOUT)[0][1], bp.compute_bi_clusters(weights, highs_ilp())[1])
+            assert coordinator.statistics()[0]["num_lost_tasks"] == 1
+            is_released.set()
+
+def test_heartbeats_keep_busy_worker():
+    algorithm = bp.Algorithm()
+    algorithm.use_grasp(num_starts = 10 ** 4, time_limit = 1.5, seed = 0)
+    with bp.Coordinator(max_retries = 0, heartbeat_timeout = 0.3) as coordinator:
+        threading.Thread(target = bp.run_worker, args = (coordinator.address, coordinator.authkey, 10.0), daemon = True).start()
+        future = coordinator.submit(algorithm, block_instance(1, 6, 6, 0))
+        future.result(TIMEOUT)
+        assert coordinator.statistics()[0]["num_lost_tasks"] == 0
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import ch
+from biclustpy import grasp
+from biclustpy import helpers
+from biclustpy.monitor import RecordingMonitor
+from instances import brute_force_obj_val, random_instance
+
+@pytest.mark.parametrize("seed", range(5))
+def test_local_search_does_not_worsen_ch(seed):
+    weights = random_instance(10, 12, seed)
+    row_labels, col_labels = ch.construct(weights, 1.0, np.random.default_rng(0))
+    improved_row_labels, improved_col_labels = grasp.improve(weights, row_labels, col_labels)
+    assert helpers.compute_obj_val(weights, improved_row_labels, improved_col_labels) <= helpers.compute_obj_val(weights, row_labels, col_labels) + 1e-9
+
+@pytest.mark.parametrize("seed", range(4))
+def test_grasp_is_bounded_by_ch_and_optimum(seed):
+    weights = random_instance(3, 4, seed)
+    rows, cols = np.arange(3), np.arange(4)
+    row_labels, col_labels, obj_val, is_optimal = grasp.run(weights, rows, cols, 5, 1.0, 0, seed, 1)
+    assert np.isclose(obj_val, helpers.compute_obj_val(weights, row_labels, col_labels))
+    assert obj_val >= brute_force_obj_val(weights) - 1e-9
+    assert obj_val <= ch.run(weights, rows, cols, 1.0, seed)[2] + 1e-9
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_best_start_is_kept(num_workers):
+    weights = random_instance(10, 12, 3)
+    rows, cols = np.arange(10), np.arange(12)
+    seed_sequences = np.random.SeedSequence(7).spawn(6)
+    start_obj_vals = [grasp.run_start(weights, 0.5, seed_sequence, None)[2] for seed_sequence in seed_sequences]
+    assert len(set(np.round(start_obj_vals, 9))) > 1
+    monitor = RecordingMonitor()
+    row_labels, col_labels, obj_val, is_optimal = grasp.run(weights, rows, cols, 6, 0.5, 0, 7, num_workers, monitor)
+    assert np.isclose(obj_val, min(start_obj_vals))
+    assert np.isclose(obj_val, helpers.compute_obj_val(weights, row_labels, col_labels))
+    assert monitor.events[-1][1]["num_starts"] == 6
+
+def test_invalid_num_starts():
+    weights = random_instance(3, 4, 0)
+    with pytest.raises(Exception, match = "at least 1"):
+        grasp.run(weights, np.arange(3), np.arange(4), 0, 0.8, 0, 0, 1)
+    with pytest.raises(Exception, match = "at least 1"):
+        bp.Algorithm().use_grasp(num_starts = 0)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from biclustpy import ilp
+from instances import brute_force_obj_val, random_instance
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("lazy", [False, True])
+def test_ilp_is_optimal(seed, lazy):
+    weights = random_instance(3, 4, seed)
+    row_labels, col_labels, obj_val, is_optimal = ilp.run(weights, np.arange(3), np.arange(4), 60, False, lazy, backend = "highs")
+    assert is_optimal
+    assert np.isclose(obj_val, brute_force_obj_val(weights))
+
+@pytest.mark.parametrize("seed", range(3))
+def test_lazy_matches_full_model(seed):
+    weights = random_instance(6, 7, seed)
+    full = ilp.run(weights, np.arange(6), np.arange(7), 60, False, False, backend = "highs")
+    lazy = ilp.run(weights, np.arange(6), np.arange(7), 60, False, True, backend = "highs")
+    assert full[3] and lazy[3]
+    assert np.isclose(full[2], lazy[2])
+
+def test_find_violated_constraints():
+    # If only the edge (1,1) is missing, the edges (0,0), (0,1), and (1,0) induce a P4.
+    x_values = np.zeros((2, 2))
+    assert ilp.find_violated_constraints(x_values)[0].size == 0
+    x_values[1, 1] = 1.0
+    i, j, k, l = ilp.find_violated_constraints(x_values)
+    assert i.size > 0
+    assert np.all(x_values[i, k] - x_values[i, l] - x_values[j, k] - x_values[j, l] > 0)
+
+def test_constraint_matrix():
+    shape = (3, 4)
+    i, j, k, l = np.array([0, 2]), np.array([1, 0]), np.array([3, 1]), np.array([0, 2])
+    x_values = np.random.default_rng(0).random(shape)
+    coefficients = ilp.build_constraint_matrix(i, j, k, l, shape)
+    assert coefficients.shape == (2, 12)
+    assert np.allclose(coefficients @ x_values.ravel(), x_values[i, k] - x_values[i, l] - x_values[j, k] - x_values[j, l])
+
+def test_gurobi_backend_is_optimal():
+    pytest.importorskip("gurobipy")
+    weights = random_instance(3, 4, 0)
+    for lazy in (False, True):
+        row_labels, col_labels, obj_val, is_optimal = ilp.run(weights, np.arange(3), np.arange(4), 60, False, lazy, backend = "gurobi")
+        assert is_optimal
+        assert np.isclose(obj_val, brute_force_obj_val(weights))
@@ -0,0 +1,44 @@
+import json
+import numpy as np
+import pytest
+import xml.etree.ElementTree as ET
+import biclustpy as bp
+from instances import block_instance, ch_algorithm, run_command_line, to_sets, write_batch
+
+@pytest.mark.parametrize("extension", ["xml", "npz", "jsonl"])
+@pytest.mark.parametrize("lower_bound", [None, 0.25])
+def test_round_trip(tmp_path, extension, lower_bound):
+    weights = block_instance(3, 3, 4, 0)
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, ch_algorithm())
+    filename = str(tmp_path / ("bi_clusters." + extension))
+    bp.save_bi_clusters(filename, bi_clusters, obj_val, is_optimal, "instance", lower_bound)
+    loaded_bi_clusters, loaded_obj_val, loaded_is_optimal, instance = bp.load_bi_clusters(filename)
+    assert to_sets(loaded_bi_clusters) == to_sets(bi_clusters)
+    assert np.isclose(loaded_obj_val, obj_val) and loaded_is_optimal == is_optimal and instance == "instance"
+
+def test_batch_writers(tmp_path):
+    results = [("a", [([0, 1], [0]), ([2], [1, 2])], 1.5, True, 1.5), ("b", [([0], [0])], 0.0, False, 0.0)]
+    xml_filename = str(tmp_path / "batch.xml")
+    bp.save_bi_clusters_batch_as_xml(xml_filename, iter(results))
+    elements = ET.parse(xml_filename).getroot().findall("bi_clusters")
+    assert [element.get("instance") for element in elements] == ["a", "b"]
+    assert [len(element.findall("bi_cluster")) for element in elements] == [2, 1]
+    jsonl_filename = str(tmp_path / "batch.jsonl")
+    bp.save_bi_clusters_batch_as_jsonl(jsonl_filename, iter(result[:4] for result in results))
+    with open(jsonl_filename) as jsonl_file:
+        lines = [json.loads(line) for line in jsonl_file]
+    assert len(lines) == 5
+    assert [line["instance"] for line in lines if "instance" in line] == ["a", "b"]
+    assert lines[1] == {"rows": [0, 1], "cols": [0]}
+
+@pytest.mark.parametrize("extension", ["xml", "jsonl"])
+def test_command_line_batch_file(tmp_path, monkeypatch, extension):
+    write_batch(str(tmp_path))
+    output = str(tmp_path / ("output." + extension))
+    run_command_line(monkeypatch, ["--load", str(tmp_path), "--save", output, "--alg", "CH", "--monitor", "quiet"])
+    with open(output) as output_file:
+        content = output_file.read()
+    for name in ["a", "b_x", "b_y"]:
+        assert "\"" + name + "\"" in content
+    if extension == "jsonl":
+        assert all(json.loads(line) for line in content.splitlines())
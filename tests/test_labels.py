@@ -0,0 +1,26 @@
+import numpy as np
+import networkx as nx
+import pytest
+from biclustpy import helpers
+from instances import ch_algorithm, highs_ilp, random_instance
+
+@pytest.mark.parametrize("build_algorithm", [ch_algorithm, highs_ilp])
+def test_graph_matches_labels(build_algorithm):
+    weights = random_instance(8, 9, 0)
+    num_rows = weights.shape[0]
+    rows, cols = np.array([0, 2, 3, 5, 7]), np.array([1, 2, 4, 6, 8])
+    row_labels, col_labels, obj_val, is_optimal = build_algorithm().run(weights, rows, cols)
+    graph, graph_obj_val, graph_is_optimal = build_algorithm().run(weights, rows, cols, as_graph = True)
+    assert np.isclose(graph_obj_val, obj_val) and graph_is_optimal == is_optimal
+    assert set(graph.nodes) == set(rows.tolist()) | set((cols + num_rows).tolist())
+    assert all(helpers.is_bi_clique(component, num_rows) for component in helpers.connected_components(graph))
+    
+    # The edited graph and the labels induce the same bi-clusters and the same objective value.
+    node_labels = dict(zip(rows.tolist(), row_labels.tolist()))
+    node_labels.update(zip((cols + num_rows).tolist(), col_labels.tolist()))
+    for component in nx.connected_components(graph):
+        if len(component) > 1:
+            assert len({node_labels[node] for node in component}) == 1
+    edited_obj_val = sum(abs(weights[row, col]) for row in rows for col in cols if graph.has_edge(row, col + num_rows) != (weights[row, col] > 0))
+    assert np.isclose(edited_obj_val, obj_val)
+    assert np.isclose(helpers.compute_obj_val(weights[np.ix_(rows, cols)], row_labels, col_labels), obj_val)
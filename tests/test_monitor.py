@@ -0,0 +1,38 @@
+import io
+import json
+import pytest
+import biclustpy as bp
+from biclustpy.monitor import RecordingMonitor
+from instances import block_instance, ch_algorithm, highs_ilp
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_event_order(num_workers):
+    weights = block_instance(3, 3, 4, 0)
+    monitor = RecordingMonitor()
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, highs_ilp(), num_workers, monitor = monitor)
+    names = [name for name, data in monitor.events]
+    assert names[:2] == ["graph_built", "decomposed"]
+    assert names[-2:] == ["solved", "finished"]
+    num_subproblems = monitor.events[1][1]["num_subproblems"]
+    assert num_subproblems > 1
+    assert names.count("subproblem_started") == names.count("subproblem_finished") == num_subproblems
+    
+    # The events of the algorithm lie between the start and the end of their subproblem.
+    current = None
+    for name, data in monitor.events[2:-2]:
+        if name == "subproblem_started":
+            assert current is None
+            current = data["subproblem"]
+        elif name == "subproblem_finished":
+            assert current == data["subproblem"]
+            current = None
+        else:
+            assert current is not None
+    assert monitor.events[-1][1]["obj_val"] == pytest.approx(obj_val)
+
+def test_json_lines_monitor():
+    stream = io.StringIO()
+    bp.compute_bi_clusters(block_instance(2, 3, 3, 0), ch_algorithm(), monitor = bp.JsonLinesMonitor(stream))
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[0]["event"] == "graph_built" and lines[-1]["event"] == "finished"
+    assert all("timestamp" in line for line in lines)
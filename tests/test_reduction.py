@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import reduction
+from instances import random_instance
+
+def twin_instance(seed):
+    weights = random_instance(4, 5, seed)
+    return weights[[0, 1, 0, 2, 3, 1]][:, [0, 1, 2, 2, 3, 4]]
+
+@pytest.mark.parametrize("seed", range(4))
+def test_reduction_preserves_optimum(seed):
+    weights = twin_instance(seed)
+    algorithm = bp.Algorithm()
+    algorithm.use_ilp(60, backend = "highs")
+    expected = bp.compute_bi_clusters(weights, algorithm)
+    algorithm.reduce = True
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, algorithm)
+    assert expected[2] and is_optimal
+    assert np.isclose(obj_val, expected[1])
+    assert np.isclose(bp.score_bi_clusters(weights, bi_clusters)[0], obj_val)
+
+def test_reduction_merges_twins():
+    weights = twin_instance(0)
+    reduced_weights, row_groups, col_groups, offset = reduction.reduce(weights)
+    assert reduced_weights.shape[0] <= 4 and reduced_weights.shape[1] <= 5
+    assert row_groups[0] == row_groups[2] and row_groups[1] == row_groups[5]
+    assert col_groups[2] == col_groups[3]
+    bi_clusters = [([group], []) for group in range(reduced_weights.shape[0])] + [([], [group]) for group in range(reduced_weights.shape[1])]
+    expanded = reduction.expand(bi_clusters, row_groups, col_groups)
+    assert sorted(row for rows, cols in expanded for row in rows) == list(range(weights.shape[0]))
+    assert sorted(col for rows, cols in expanded for col in cols) == list(range(weights.shape[1]))
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import helpers
+from instances import random_instance
+
+def naive_obj_val(weights, row_labels, col_labels):
+    obj_val = 0.0
+    for i in range(weights.shape[0]):
+        for k in range(weights.shape[1]):
+            if (weights[i, k] > 0) != (row_labels[i] == col_labels[k]):
+                obj_val = obj_val + abs(weights[i, k])
+    return obj_val
+
+@pytest.mark.parametrize("seed", range(3))
+def test_obj_val_matches_loops(seed):
+    weights = random_instance(9, 11, seed)
+    rng = np.random.default_rng(seed)
+    row_labels, col_labels = rng.integers(0, 4, 9), rng.integers(0, 4, 11)
+    expected = naive_obj_val(weights, row_labels, col_labels)
+    assert np.isclose(helpers.compute_obj_val(weights, row_labels, col_labels), expected)
+    assert np.isclose(helpers.compute_obj_val(weights, row_labels, col_labels, chunk_size = 20), expected)
+
+def test_score_bi_clusters():
+    weights = random_instance(4, 5, 0)
+    algorithm = bp.Algorithm()
+    algorithm.use_ch()
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, algorithm)
+    assert bp.score_bi_clusters(weights, bi_clusters) == (pytest.approx(obj_val), True)
+    assert not bp.score_bi_clusters(weights, [([0, 1], [0]), ([1], [1])])[1]
+    assert not bp.score_bi_clusters(weights, [([0, 7], [0])])[1]
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import benchmark, helpers
+from instances import block_instance, highs_ilp
+
+UPDATES = [(0, 0, -0.9), (1, 5, 0.8), (4, 1, 0.7), (7, 10, -0.6), (7, 10, 0.6)]
+
+@pytest.mark.parametrize("warm_start", [False, True])
+def test_update_matches_recompute(warm_start):
+    weights = block_instance(3, 3, 4, 0)
+    session = bp.Session(weights, highs_ilp(), warm_start = warm_start)
+    for row, col, value in UPDATES:
+        weights[row, col] = value
+    bi_clusters, obj_val, is_optimal = session.update(UPDATES)
+    assert np.array_equal(session.weights, weights)
+    assert is_optimal
+    assert np.isclose(obj_val, bp.compute_bi_clusters(weights, highs_ilp())[1])
+    assert bp.score_bi_clusters(weights, bi_clusters) == (pytest.approx(obj_val), True)
+
+def test_sparse_update():
+    weights = block_instance(3, 3, 4, 1)
+    session = bp.Session(benchmark.to_sparse(weights, -1.0), highs_ilp(), default_weight = -1.0)
+    updates = [(0, 4, 0.0), (2, 9, 0.5)]
+    for row, col, value in updates:
+        weights[row, col] = value
+    bi_clusters, obj_val, is_optimal = session.update(updates)
+    assert np.array_equal(helpers.get_submatrix(session.weights, np.arange(weights.shape[0]), np.arange(weights.shape[1]), -1.0), weights)
+    assert np.isclose(obj_val, bp.compute_bi_clusters(weights, highs_ilp())[1])
+    with pytest.raises(Exception):
+        session.update([(weights.shape[0], 0, 1.0)])
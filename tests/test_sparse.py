@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy import benchmark
+from instances import block_instance, ch_algorithm, grasp_algorithm, highs_ilp, to_sets
+
+@pytest.mark.parametrize("build_algorithm", [ch_algorithm, highs_ilp, grasp_algorithm])
+def test_sparse_matches_dense(build_algorithm):
+    weights = block_instance(3, 3, 4, 1)
+    sparse_weights = benchmark.to_sparse(weights, -1.0)
+    assert sparse_weights.nnz < weights.size
+    dense = bp.compute_bi_clusters(weights, build_algorithm())
+    sparse = bp.compute_bi_clusters(sparse_weights, build_algorithm(), default_weight = -1.0)
+    assert np.isclose(sparse[1], dense[1])
+    assert sparse[2] == dense[2]
+    assert to_sets(sparse[0]) == to_sets(dense[0])
+
+@pytest.mark.parametrize("build_algorithm", [ch_algorithm, highs_ilp, grasp_algorithm])
+def test_run_with_default_weight(build_algorithm):
+    weights = block_instance(2, 3, 3, 2)
+    sparse_weights = benchmark.to_sparse(weights, -1.0)
+    rows, cols = np.arange(weights.shape[0]), np.arange(weights.shape[1])
+    dense = build_algorithm().run(weights, rows, cols)
+    sparse = build_algorithm().run(sparse_weights, rows, cols, default_weight = -1.0)
+    assert np.isclose(sparse[2], dense[2])
+    assert np.array_equal(sparse[0], dense[0]) and np.array_equal(sparse[1], dense[1])
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import biclustpy as bp
+from biclustpy.monitor import RecordingMonitor
+from instances import block_instance, ch_algorithm, highs_ilp
+
+@pytest.mark.parametrize("time_limit", [0.0, 60])
+def test_start_bi_clusters(time_limit):
+    weights = block_instance(3, 3, 4, 0)
+    start_bi_clusters, start_obj_val = bp.compute_bi_clusters(weights, ch_algorithm())[:2]
+    algorithm = bp.Algorithm()
+    algorithm.use_ilp(time_limit, backend = "highs")
+    monitor = RecordingMonitor()
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, algorithm, monitor = monitor, start_bi_clusters = start_bi_clusters)
+    assert obj_val <= start_obj_val + 1e-9
+    assert bp.score_bi_clusters(weights, bi_clusters) == (pytest.approx(obj_val), True)
+    solved = [data for name, data in monitor.events if name == "ilp_solved"]
+    assert len(solved) > 0 and all("start_obj_val" in data for data in solved)
+    assert np.isclose(sum(data["start_obj_val"] for data in solved), start_obj_val)
+    assert all(data["is_improved"] == (data["obj_val"] < data["start_obj_val"] - 1e-9) for data in solved)
+
+def test_warm_start_with_ch():
+    weights = block_instance(3, 3, 4, 1)
+    algorithm = bp.Algorithm()
+    algorithm.use_ilp(60, warm_start = True, backend = "highs")
+    bi_clusters, obj_val, is_optimal = bp.compute_bi_clusters(weights, algorithm)
+    assert is_optimal
+    assert obj_val <= bp.compute_bi_clusters(weights, ch_algorithm())[1] + 1e-9
+
+def test_is_improved():
+    weights = block_instance(3, 3, 4, 2)
+    optimal_bi_clusters, optimum = bp.compute_bi_clusters(weights, highs_ilp())[:2]
+    trivial_bi_clusters = [([row], []) for row in range(weights.shape[0])] + [([], [col]) for col in range(weights.shape[1])]
+    bi_clusters, obj_val, is_optimal, is_improved = bp.compute_bi_clusters(weights, highs_ilp(), start_bi_clusters = trivial_bi_clusters, return_is_improved = True)
+    assert is_improved and np.isclose(obj_val, optimum)
+    result = bp.compute_bi_clusters(weights, highs_ilp(), 2, start_bi_clusters = optimal_bi_clusters, return_lower_bound = True, return_is_improved = True)
+    assert len(result) == 5 and not result[4]
+    assert not bp.compute_bi_clusters(weights, highs_ilp(), return_is_improved = True)[3]
+    rows, cols = np.arange(weights.shape[0]), np.arange(weights.shape[1])
+    start_labels = (np.arange(rows.size), rows.size + np.arange(cols.size))
+    assert highs_ilp().run(weights, rows, cols, start_labels = start_labels, return_is_improved = True)[4]
+    assert len(highs_ilp().run(weights, rows, cols, start_labels = start_labels)) == 4
+    assert not ch_algorithm().run(weights, rows, cols, return_is_improved = True)[4]